@@ -0,0 +1,251 @@
+# backend/benchmarks/datos.py
+"""
+Generador de datos sintéticos para los benchmarks.
+
+Inserta con SQL Core por lotes (executemany), con IDs explícitos y una semilla
+fija: dos bases sembradas con la misma escala y semilla son idénticas, y los IDs
+de muestra que usan los escenarios se conocen sin consultar.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from sqlalchemy import MetaData, insert
+from sqlalchemy.engine import Engine
+
+# Filas por INSERT (executemany) y por transacción
+TAMANO_LOTE = 10_000
+
+# Contraseña de todos los usuarios sembrados (se hashea una sola vez)
+CONTRASENA_USUARIOS = "benchmark123"
+
+NOMBRES = ("Ana", "Luis", "María", "José", "Carmen", "Jorge", "Lucía", "Pedro", "Sofía", "Diego",
+           "Valentina", "Andrés", "Camila", "Mateo", "Isabel", "Tomás", "Elena", "Gabriel", "Paula", "Raúl")
+APELLIDOS = ("González", "Rodríguez", "Pérez", "Fernández", "López", "Martínez", "Sánchez", "Gómez",
+             "Díaz", "Torres", "Ramírez", "Flores", "Rojas", "Vargas", "Castro", "Morales", "Ortiz", "Núñez")
+PUESTOS = ("Mesero", "Cocinero", "Cajero", "Bartender", "Ayudante de cocina", "Supervisor", "Repartidor")
+ROLES = (("employee", "Empleado"), ("admin", "Administrador"), ("manager", "Gerente"), ("supervisor", "Supervisor"))
+TIPOS_DOCUMENTO = ("Carnet Sanitario", "Contrato", "Cédula", "Certificado de Antecedentes", "Seguro")
+CAPACITACIONES = ("Manipulación de alimentos", "Primeros auxilios", "Atención al cliente", "Seguridad laboral")
+TIPOS_SOLICITUD = ("Vacaciones", "Permiso Médico", "Reemplazo")
+ESTADOS_SOLICITUD = ("Pendiente", "Aprobado", "Rechazado")
+TIPOS_COMPONENTE = ("Bono", "Horas Extra", "Descuento")
+TURNOS = ((time(7), time(15)), (time(8), time(16)), (time(15), time(23)), (time(10), time(18)))
+
+
+@dataclass(frozen=True)
+class Escala:
+    """Cantidad de filas por entidad."""
+    empleados: int
+    turnos: int
+    documentos: int
+    capacitaciones: int
+    solicitudes: int
+    horarios: int
+    periodos: int        # Mensuales, hacia atrás desde el mes en curso (abierto, sin detalles)
+    componentes: int
+    usuarios: int
+    sucursales: int = 20
+    dias_turnos: int = 365   # Los turnos se reparten en este rango, terminando 30 días adelante
+
+
+ESCALAS: Dict[str, Escala] = {
+    "pequena": Escala(empleados=1_000, turnos=50_000, documentos=10_000, capacitaciones=5_000,
+                      solicitudes=2_000, horarios=3_000, periodos=6, componentes=5_000, usuarios=1_000),
+    "media": Escala(empleados=10_000, turnos=500_000, documentos=100_000, capacitaciones=50_000,
+                    solicitudes=20_000, horarios=30_000, periodos=12, componentes=50_000, usuarios=10_000),
+    "grande": Escala(empleados=100_000, turnos=5_000_000, documentos=1_000_000, capacitaciones=500_000,
+                     solicitudes=200_000, horarios=300_000, periodos=12, componentes=500_000, usuarios=100_000),
+}
+
+
+def _lotes(filas: Iterable[dict]) -> Iterator[List[dict]]:
+    lote: List[dict] = []
+    for fila in filas:
+        lote.append(fila)
+        if len(lote) == TAMANO_LOTE:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _insertar(engine: Engine, metadata: MetaData, tabla: str, filas: Iterable[dict],
+              informar: Callable[[str, int], None]) -> int:
+    total = 0
+    for lote in _lotes(filas):
+        with engine.begin() as conexion:
+            conexion.execute(insert(metadata.tables[tabla]), lote)
+        total += len(lote)
+        informar(tabla, total)
+    return total
+
+
+def _mes(hoy: date, atras: int) -> date:
+    meses = hoy.year * 12 + hoy.month - 1 - atras
+    return date(meses // 12, meses % 12 + 1, 1)
+
+
+# ----------------------------------------------------
+# rh_service
+# ----------------------------------------------------
+
+def periodos_rh(escala: Escala, hoy: date) -> List[dict]:
+    """Períodos mensuales: el del mes en curso abierto, los anteriores finalizados."""
+    periodos = []
+    for i in range(escala.periodos):
+        inicio = _mes(hoy, escala.periodos - 1 - i)
+        fin = _mes(hoy, escala.periodos - 2 - i) - timedelta(days=1)
+        abierto = i == escala.periodos - 1
+        periodos.append({
+            "id": i + 1, "nombre_periodo": f"Nómina {inicio:%Y-%m}", "fecha_inicio": inicio, "fecha_fin": fin,
+            "fecha_corte_revision": fin + timedelta(days=3),
+            "estado": "Pendiente de Revisión" if abierto else "Pagado",
+            "finalizado": not abierto, "archivado": False,
+        })
+    return periodos
+
+
+def sembrar_rh(engine: Engine, metadata: MetaData, escala: Escala, semilla: int = 42,
+               informar: Callable[[str, int], None] = lambda tabla, n: None) -> Dict[str, int]:
+    """
+    Crea las tablas de rh_service y las llena según `escala`. Devuelve los IDs de
+    muestra para los escenarios (ver `muestras_rh`).
+    """
+    metadata.create_all(engine)
+    azar = random.Random(semilla)
+    hoy = date.today()
+    n = escala.empleados
+
+    _insertar(engine, metadata, "roles", (
+        {"id": i + 1, "rol": rol, "descripcion": descripcion} for i, (rol, descripcion) in enumerate(ROLES)
+    ), informar)
+    _insertar(engine, metadata, "sucursal", (
+        {"id": i, "nombre_sucursal": f"Sucursal {i}", "fecha_inauguracion": date(2015, 1, 1) + timedelta(days=90 * i),
+         "ubicacion": f"Calle {i} #{100 + i}", "telefono": 22_000_000 + i}
+        for i in range(1, escala.sucursales + 1)
+    ), informar)
+    _insertar(engine, metadata, "employees", (
+        {"id": i, "nombre": azar.choice(NOMBRES), "apellido": azar.choice(APELLIDOS),
+         "email": f"empleado{i}@lila-bench.com", "puesto": azar.choice(PUESTOS),
+         "tarifa_hora": Decimal(azar.randrange(800, 2500)) / 100, "es_salario_fijo": i % 10 == 0,
+         "fecha_ingreso": hoy - timedelta(days=azar.randrange(30, 3650)), "is_active": i % 20 != 0,
+         "desempeño_score": azar.randrange(0, 101), "sucursal_id": 1 + i % escala.sucursales,
+         "rol_id": 1 if i % 50 else 1 + i // 50 % len(ROLES)}
+        for i in range(1, n + 1)
+    ), informar)
+
+    desde = hoy - timedelta(days=escala.dias_turnos - 30)
+
+    def turnos():
+        for i in range(1, escala.turnos + 1):
+            inicio, fin = azar.choice(TURNOS)
+            asignado = azar.randrange(1, n + 1) if i % 15 else None
+            yield {"id": i, "fecha": desde + timedelta(days=azar.randrange(escala.dias_turnos)),
+                   "hora_inicio_real": inicio, "hora_fin_real": fin, "puesto_requerido": azar.choice(PUESTOS),
+                   "assigned_employee_id": asignado, "is_covered": asignado is not None,
+                   "es_alteracion": i % 40 == 0, "notas": None}
+    _insertar(engine, metadata, "shifts", turnos(), informar)
+
+    _insertar(engine, metadata, "documents", (
+        {"id": i, "employee_id": 1 + i % n, "tipo": azar.choice(TIPOS_DOCUMENTO),
+         "url_archivo": f"https://archivos.lila-bench.com/documentos/{i}.pdf",
+         "fecha_vencimiento": hoy + timedelta(days=azar.randrange(-60, 730)) if i % 4 else None,
+         "aprobado_admin": i % 3 != 0}
+        for i in range(1, escala.documentos + 1)
+    ), informar)
+    _insertar(engine, metadata, "trainings", (
+        {"id": i, "employee_id": 1 + i % n, "nombre_capacitacion": CAPACITACIONES[i % len(CAPACITACIONES)],
+         "fecha_asignacion": hoy - timedelta(days=azar.randrange(0, 365)),
+         "fecha_limite": hoy + timedelta(days=azar.randrange(-30, 180)), "completado": i % 3 == 0,
+         "certificado_url": None}
+        for i in range(1, escala.capacitaciones + 1)
+    ), informar)
+
+    def solicitudes():
+        for i in range(1, escala.solicitudes + 1):
+            inicio = hoy + timedelta(days=azar.randrange(-180, 90))
+            yield {"id": i, "employee_id": 1 + i % n, "tipo": azar.choice(TIPOS_SOLICITUD), "motivo": "Sintético",
+                   "fecha_solicitud": inicio - timedelta(days=azar.randrange(1, 30)), "fecha_inicio": inicio,
+                   "fecha_fin": inicio + timedelta(days=azar.randrange(0, 14)),
+                   "estado": ESTADOS_SOLICITUD[i % len(ESTADOS_SOLICITUD)]}
+    _insertar(engine, metadata, "requests", solicitudes(), informar)
+
+    def horarios():
+        for i in range(1, escala.horarios + 1):
+            inicio, fin = TURNOS[i % len(TURNOS)]
+            yield {"id": i, "employee_id": 1 + i % n, "nombre_horario": "Semana base", "dia_semana": 1 + i % 7,
+                   "hora_inicio_patron": inicio, "hora_fin_patron": fin, "es_actual": True}
+    _insertar(engine, metadata, "employee_schedules", horarios(), informar)
+
+    periodos = periodos_rh(escala, hoy)
+    _insertar(engine, metadata, "payroll_periods", periodos, informar)
+
+    # Un detalle por empleado en cada período finalizado
+    cerrados = [p["id"] for p in periodos if p["finalizado"]]
+
+    def detalles():
+        i = 0
+        for period_id in cerrados:
+            for employee_id in range(1, n + 1):
+                i += 1
+                horas = Decimal(azar.randrange(4000, 18000)) / 100
+                base = (horas * Decimal("12.50")).quantize(Decimal("0.01"))
+                yield {"id": i, "employee_id": employee_id, "period_id": period_id,
+                       "horas_totales_trabajadas": horas, "monto_base_calculado": base,
+                       "total_descuentos": Decimal("0.00"), "total_bonificaciones": Decimal("0.00"), "monto_neto": base}
+    total_detalles = _insertar(engine, metadata, "payment_details", detalles(), informar)
+
+    def componentes():
+        for i in range(1, escala.componentes + 1):
+            yield {"id": i, "payment_detail_id": 1 + i % total_detalles,
+                   "tipo": TIPOS_COMPONENTE[i % len(TIPOS_COMPONENTE)],
+                   "descripcion": "Sintético", "monto": Decimal(azar.randrange(500, 20000)) / 100}
+    if total_detalles:
+        _insertar(engine, metadata, "pay_components", componentes(), informar)
+
+    return muestras_rh(escala, total_detalles)
+
+
+def muestras_rh(escala: Escala, total_detalles: int) -> Dict[str, int]:
+    """
+    IDs existentes que usan los escenarios: del medio de cada tabla (ni el primero
+    ni el último, que suelen estar en caché o ser casos borde).
+    """
+    return {
+        "empleado": max(1, escala.empleados // 2),
+        "turno": max(1, escala.turnos // 2),
+        "documento": max(1, escala.documentos // 2),
+        "capacitacion": max(1, escala.capacitaciones // 2),
+        "solicitud": max(1, escala.solicitudes // 2),
+        "horario": max(1, escala.horarios // 2),
+        "periodo_abierto": escala.periodos,
+        "periodo_cerrado": max(1, escala.periodos - 1),
+        "detalle": max(1, total_detalles // 2),
+        "componente": max(1, escala.componentes // 2),
+        "rol": 1,
+        "sucursal": 1,
+    }
+
+
+# ----------------------------------------------------
+# user_service
+# ----------------------------------------------------
+
+def sembrar_usuarios(engine: Engine, metadata: MetaData, escala: Escala, hash_contrasena: str,
+                     informar: Callable[[str, int], None] = lambda tabla, n: None) -> Dict[str, int]:
+    """Crea la tabla de usuarios con `escala.usuarios` filas (todas con la misma contraseña)."""
+    metadata.create_all(engine)
+    _insertar(engine, metadata, "users", (
+        {"id": i, "username": f"usuario{i}", "email": f"usuario{i}@lila-bench.com", "hashed_password": hash_contrasena,
+         "is_active": True, "role": ROLES[0][0] if i % 50 else ROLES[1 + i // 50 % 3][0]}
+        for i in range(1, escala.usuarios + 1)
+    ), informar)
+    return {"usuario": max(1, escala.usuarios // 2)}
+
+
+def escala_a_dict(escala: Escala) -> Dict[str, int]:
+    return asdict(escala)
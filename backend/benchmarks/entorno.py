@@ -0,0 +1,97 @@
+# backend/benchmarks/entorno.py
+"""
+Carga rh_service o user_service contra una base SQLite local en lugar de MySQL.
+
+Los dos servicios usan el paquete `app`, así que cada proceso carga uno solo
+(ver run.py). Las tareas periódicas quedan desactivadas: los benchmarks no
+ejecutan el lifespan, pero así tampoco arrancan si se sirve con uvicorn.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+BACKEND = Path(__file__).resolve().parent.parent
+RUTAS_SERVICIO = {
+    "rh": BACKEND / "services" / "rh_service",
+    "usuarios": BACKEND / "services" / "user_service",
+}
+
+# Variables de entorno de rh_service para un proceso de benchmark
+ENTORNO_RH = {
+    "DEBUG": "false",
+    "METRICS_SNAPSHOT_ENABLED": "false",
+    "ALERTS_SWEEP_ENABLED": "false",
+    "EXPIRY_SCHEDULER_ENABLED": "false",
+    "ARCHIVE_ENABLED": "false",
+    "JOBS_ENABLED": "false",
+}
+
+
+def motor_sqlite(ruta: Path) -> Engine:
+    """
+    Motor SQLite compartible entre hilos (los endpoints síncronos corren en el
+    threadpool de FastAPI), con WAL para que las lecturas no esperen a las escrituras.
+    """
+    engine = create_engine(f"sqlite:///{ruta}", connect_args={"check_same_thread": False, "timeout": 60})
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(conexion, _registro):
+        cursor = conexion.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-200000")
+        cursor.close()
+
+    return engine
+
+
+def _importar_servicio(servicio: str) -> None:
+    if "app" in sys.modules:
+        raise RuntimeError("Ya hay un servicio cargado en este proceso; cada servicio va en su propio proceso.")
+    sys.path.insert(0, str(RUTAS_SERVICIO[servicio]))
+
+
+def cargar_rh(ruta_db: Path, cache: bool = True):
+    """
+    Importa rh_service y enlaza sus sesiones a la base SQLite.
+    Devuelve (app FastAPI, engine, metadata de los modelos).
+    """
+    os.environ.update(ENTORNO_RH)
+    os.environ["QUERY_CACHE_ENABLED"] = "true" if cache else "false"
+    _importar_servicio("rh")
+
+    from app import database
+    import app.models  # Registra todos los modelos en la metadata
+    from app.main import app as aplicacion
+
+    engine = motor_sqlite(ruta_db)
+    database.SessionLocal.configure(bind=engine)
+    database.engine = engine
+    return aplicacion, engine, database.Base.metadata
+
+
+def cargar_usuarios(ruta_db: Path):
+    """
+    Importa user_service y enlaza sus sesiones a la base SQLite (el servicio tiene
+    dos `SessionLocal`: el de app.db y el de app.config, que usa app.dependencies).
+    Devuelve (app FastAPI, engine, metadata de los modelos).
+    """
+    os.environ["DEBUG"] = "false"
+    _importar_servicio("usuarios")
+
+    from app import config, db
+    from app.models.user_model import Base
+    from app.main import app as aplicacion
+
+    engine = motor_sqlite(ruta_db)
+    for modulo in (db, config):
+        modulo.SessionLocal.configure(bind=engine)
+        modulo.engine = engine
+    return aplicacion, engine, Base.metadata
+
+
+CARGADORES = {"rh": cargar_rh, "usuarios": cargar_usuarios}
@@ -0,0 +1,270 @@
+# backend/benchmarks/escenarios.py
+"""
+Peticiones que se miden en cada servicio.
+
+Las rutas, parámetros, cuerpos y cabeceras admiten marcadores `{...}`:
+
+- IDs de muestra de la base sembrada (`{empleado}`, `{turno}`, `{periodo_cerrado}`, ...);
+- `{hoy}` y `{n}` (contador creciente, para valores únicos como emails);
+- `{dia_n}`: una fecha distinta por llamada, sin turnos sembrados (para no chocar);
+- `{p0_id}`, `{p1_access_token}`, ...: campos del JSON devuelto por los pasos de
+  `preparar` (peticiones previas que no se miden, p. ej. crear lo que se elimina).
+
+Los escenarios que escriben se ejecutan sobre una copia de la base sembrada.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Escenario:
+    nombre: str
+    metodo: str
+    ruta: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    cuerpo: Any = None
+    cabeceras: Dict[str, str] = field(default_factory=dict)
+    preparar: Tuple["Escenario", ...] = ()
+    repeticiones: Optional[int] = None    # Tope para operaciones pesadas (nómina, archivo)
+
+
+def _get(nombre: str, ruta: str, **kw) -> Escenario:
+    return Escenario(nombre, "GET", ruta, **kw)
+
+
+def _post(nombre: str, ruta: str, cuerpo: Any = None, **kw) -> Escenario:
+    return Escenario(nombre, "POST", ruta, cuerpo=cuerpo, **kw)
+
+
+# ----------------------------------------------------
+# Cuerpos reutilizados
+# ----------------------------------------------------
+
+EMPLEADO = {"nombre": "Bench", "apellido": "Marca", "email": "bench{n}@lila-bench.com", "puesto": "Mesero",
+            "fecha_ingreso": "{hoy}", "tarifa_hora": "12.50", "rol_id": "{rol}", "sucursal_id": "{sucursal}"}
+TURNO = {"fecha": "{hoy}", "hora_inicio_real": "09:00:00", "hora_fin_real": "13:00:00",
+         "puesto_requerido": "Mesero", "assigned_employee_id": None}
+DOCUMENTO = {"tipo": "Contrato", "url_archivo": "https://archivos.lila-bench.com/nuevo.pdf", "fecha_vencimiento": "{hoy}"}
+CAPACITACION = {"employee_id": "{empleado}", "nombre_capacitacion": "Primeros auxilios", "fecha_asignacion": "{hoy}",
+                "fecha_limite": "{hoy}"}
+SOLICITUD = {"employee_id": "{empleado}", "tipo": "Vacaciones", "motivo": "Benchmark", "fecha_solicitud": "{hoy}",
+             "fecha_inicio": "{hoy}", "fecha_fin": "{hoy}"}
+HORARIO = {"employee_id": "{empleado}", "nombre_horario": "Benchmark", "dia_semana": 3,
+           "hora_inicio_patron": "09:00:00", "hora_fin_patron": "17:00:00"}
+PERIODO = {"nombre_periodo": "Benchmark {n}", "fecha_inicio": "2030-01-01", "fecha_fin": "2030-01-31",
+           "fecha_corte_revision": "2030-02-03"}
+COMPONENTE = {"payment_detail_id": "{detalle}", "tipo": "Bono", "descripcion": "Benchmark", "monto": "10.00"}
+ROL = {"rol": "Rol benchmark {n}", "descripcion": "Benchmark"}
+SUCURSAL = {"nombre_sucursal": "Sucursal benchmark", "fecha_inauguracion": "{hoy}", "ubicacion": "Benchmark",
+            "telefono": 22000000}
+USUARIO = {"username": "bench{n}", "email": "bench{n}@lila-bench.com", "password": "benchmark123"}
+LOGIN = {"username": "usuario{usuario}", "password": "benchmark123"}
+
+CREAR_EMPLEADO = _post("empleados: crear", "/employees", EMPLEADO)
+CREAR_TURNO = _post("turnos: crear", "/shift/", TURNO)
+CREAR_TURNO_LIBRE = _post("turnos: crear en día libre", "/shift/", dict(TURNO, fecha="{dia_n}"))
+CREAR_PERIODO = _post("períodos: crear", "/periods/", PERIODO)
+
+
+# ----------------------------------------------------
+# rh_service
+# ----------------------------------------------------
+
+ESCENARIOS_RH = (
+    _get("raíz", "/"),
+    _get("health", "/health"),
+    _get("métricas", "/metrics"),
+
+    # Empleados
+    _get("empleados: listado", "/employees"),
+    _get("empleados: listado por cursor", "/employees", params={"after": "{cursor_empleados}", "limit": 100}),
+    _get("empleados: listado resumen", "/employees", params={"vista": "resumen", "limit": 1000}),
+    _get("empleados: búsqueda", "/employees/buscar", params={"q": "gonz"}),
+    _get("empleados: búsqueda aproximada", "/employees/buscar", params={"q": "rodriges mesero"}),
+    _get("empleados: por ID", "/employees/{empleado}"),
+    _get("empleados: perfil completo", "/employees/{empleado}/perfil-completo"),
+    CREAR_EMPLEADO,
+    Escenario("empleados: actualizar", "PUT", "/employees/{empleado}", cuerpo={"puesto": "Cajero"}),
+    Escenario("empleados: eliminar", "DELETE", "/employees/{p0_id}", preparar=(CREAR_EMPLEADO,)),
+
+    # Documentos
+    _post("documentos: crear", "/documents/employees/{empleado}/documents", DOCUMENTO),
+    _get("documentos: listado", "/documents/"),
+    _get("documentos: por ID", "/documents/{documento}"),
+    Escenario("documentos: actualizar", "PUT", "/documents/{documento}", cuerpo={"aprobado_admin": True}),
+    Escenario("documentos: eliminar", "DELETE", "/documents/{p0_id}",
+              preparar=(_post("crear documento", "/documents/employees/{empleado}/documents", DOCUMENTO),)),
+
+    # Horarios
+    _post("horarios: crear", "/schedules", HORARIO),
+    _post("horarios: generar turnos (semana)", "/schedules/generar-turnos",
+          {"fecha_inicio": "{hoy}", "fecha_fin": "{hoy_mas_6}"}, repeticiones=3),
+    _get("horarios: listado", "/schedules"),
+    _get("horarios: por ID", "/schedules/{horario}"),
+    Escenario("horarios: actualizar", "PUT", "/schedules/{horario}", cuerpo={"nombre_horario": "Benchmark"}),
+    Escenario("horarios: eliminar", "DELETE", "/schedules/{p0_id}",
+              preparar=(_post("crear horario", "/schedules", HORARIO),)),
+
+    # Componentes y detalles de pago
+    _post("componentes: crear", "/components/details/{detalle}/components", COMPONENTE),
+    _get("componentes: por detalle", "/components/details/{detalle}/components"),
+    _get("componentes: por ID", "/components/{componente}"),
+    Escenario("componentes: actualizar", "PUT", "/components/{componente}", cuerpo={"descripcion": "Benchmark"}),
+    Escenario("componentes: eliminar", "DELETE", "/components/{p0_id}",
+              preparar=(_post("crear componente", "/components/details/{detalle}/components", COMPONENTE),)),
+    _post("detalles: crear", "/details/", {"employee_id": "{empleado}", "period_id": "{p0_id}",
+                                           "monto_base_calculado": "100.00"}, preparar=(CREAR_PERIODO,)),
+    _get("detalles: listado", "/details/"),
+    _get("detalles: por ID", "/details/{detalle}"),
+    Escenario("detalles: actualizar", "PUT", "/details/{detalle}", cuerpo={"horas_totales_trabajadas": "120.00"}),
+    Escenario("detalles: eliminar", "DELETE", "/details/{p1_id}", preparar=(
+        CREAR_PERIODO,
+        _post("crear detalle", "/details/", {"employee_id": "{empleado}", "period_id": "{p0_id}",
+                                             "monto_base_calculado": "100.00"}),
+    )),
+
+    # Períodos de nómina
+    CREAR_PERIODO,
+    _get("períodos: listado", "/periods/"),
+    _get("períodos: por ID", "/periods/{periodo_cerrado}"),
+    Escenario("períodos: actualizar", "PUT", "/periods/{periodo_abierto}", cuerpo={"estado": "Pendiente de Revisión"}),
+    _post("períodos: ejecutar nómina", "/periods/{periodo_abierto}/ejecutar-nomina", repeticiones=3),
+    _post("períodos: conciliar totales", "/periods/{periodo_cerrado}/conciliar-totales",
+          params={"reparar": "false"}, repeticiones=5),
+    _get("períodos: exportar csv", "/periods/{periodo_cerrado}/exportar", repeticiones=3),
+    _get("períodos: exportar ndjson", "/periods/{periodo_cerrado}/exportar", params={"formato": "ndjson"},
+         repeticiones=3),
+    Escenario("períodos: eliminar", "DELETE", "/periods/{p0_id}", preparar=(CREAR_PERIODO,)),
+
+    # Solicitudes
+    _post("solicitudes: crear", "/request/", SOLICITUD),
+    _get("solicitudes: listado", "/request/"),
+    _get("solicitudes: por ID", "/request/{solicitud}"),
+    Escenario("solicitudes: cambiar estado", "PATCH", "/request/{solicitud}", cuerpo={"estado": "Aprobado"}),
+    Escenario("solicitudes: eliminar", "DELETE", "/request/{p0_id}",
+              preparar=(_post("crear solicitud", "/request/", SOLICITUD),)),
+
+    # Turnos
+    CREAR_TURNO,
+    _post("turnos: validar lote", "/shift/validar-lote", [
+        {"assigned_employee_id": "{empleado}", "fecha": "{hoy}", "hora_inicio_real": "09:00:00",
+         "hora_fin_real": "13:00:00"},
+        {"assigned_employee_id": "{empleado}", "fecha": "{hoy}", "hora_inicio_real": "12:00:00",
+         "hora_fin_real": "16:00:00"},
+    ]),
+    _get("turnos: listado", "/shift/"),
+    _get("turnos: por fecha", "/shift/", params={"target_date": "{hoy}"}),
+    _get("turnos: por empleado", "/shift/", params={"employee_id": "{empleado}"}),
+    _get("turnos: resumen", "/shift/", params={"vista": "resumen", "limit": 1000}),
+    _get("turnos: por ID", "/shift/{turno}"),
+    _get("turnos: candidatos", "/shift/{p0_id}/candidatos", preparar=(CREAR_TURNO,)),
+    Escenario("turnos: asignar", "PATCH", "/shift/{p0_id}/assign", cuerpo={"assigned_employee_id": "{empleado}"},
+              preparar=(CREAR_TURNO_LIBRE,)),
+    Escenario("turnos: actualizar", "PUT", "/shift/{turno}", cuerpo={"notas": "Benchmark"}),
+    Escenario("turnos: eliminar", "DELETE", "/shift/{p0_id}", preparar=(CREAR_TURNO,)),
+
+    # Capacitaciones
+    _post("capacitaciones: crear", "/training/", CAPACITACION),
+    _get("capacitaciones: listado", "/training/"),
+    _get("capacitaciones: matriz de cumplimiento", "/training/matriz-cumplimiento", repeticiones=5),
+    _get("capacitaciones: por ID", "/training/{capacitacion}"),
+    Escenario("capacitaciones: actualizar", "PUT", "/training/{capacitacion}", cuerpo={"completado": True}),
+    Escenario("capacitaciones: eliminar", "DELETE", "/training/{p0_id}",
+              preparar=(_post("crear capacitación", "/training/", CAPACITACION),)),
+
+    # Alertas y estadísticas
+    _get("alertas: resumen de estadísticas", "/alert/stats/resumen"),
+    _post("alertas: foto de métricas", "/alert/stats/snapshot", repeticiones=3),
+    _get("alertas: pendientes", "/alert/alertas/pendientes"),
+    _post("alertas: recalcular", "/alert/alertas/recalcular", repeticiones=3),
+
+    # Roles y sucursales
+    _post("roles: crear", "/roles/", ROL),
+    _get("roles: listado", "/roles/"),
+    _get("roles: por ID", "/roles/{rol}"),
+    Escenario("roles: actualizar", "PUT", "/roles/{p0_id}", cuerpo={"descripcion": "Actualizado"},
+              preparar=(_post("crear rol", "/roles/", ROL),)),
+    Escenario("roles: eliminar", "DELETE", "/roles/{p0_id}", preparar=(_post("crear rol", "/roles/", ROL),)),
+    _post("sucursales: crear", "/sucursal/", SUCURSAL),
+    _get("sucursales: listado", "/sucursal/"),
+    _get("sucursales: por ID", "/sucursal/{sucursal}"),
+    Escenario("sucursales: actualizar", "PUT", "/sucursal/{sucursal}", cuerpo=SUCURSAL),
+    Escenario("sucursales: eliminar", "DELETE", "/sucursal/{p0_id}",
+              preparar=(_post("crear sucursal", "/sucursal/", SUCURSAL),)),
+
+    # Feed de cambios y trabajos
+    _get("cambios: token actual", "/changes"),
+    _get("cambios: desde token", "/changes", params={"since": "{p1_token}"},
+         preparar=(CREAR_TURNO, _get("token", "/changes"), CREAR_TURNO)),
+    _post("trabajos: encolar", "/jobs", {"tipo": "nomina", "parametros": {"period_id": "{periodo_abierto}"}}),
+    _get("trabajos: listado", "/jobs"),
+    _get("trabajos: por ID", "/jobs/{p0_id}", preparar=(_post("encolar", "/jobs", {"tipo": "archivo"}),)),
+    _post("trabajos: cancelar", "/jobs/{p0_id}/cancelar", preparar=(_post("encolar", "/jobs", {"tipo": "archivo"}),)),
+
+    # Al final: mueve a las tablas de archivo los meses cerrados que usan los escenarios anteriores
+    _post("archivo: ejecutar", "/archive/ejecutar", repeticiones=2),
+)
+
+# Rutas que no se miden con peticiones sueltas
+EXCLUIDAS_RH = {
+    "/events/stream": "Canal SSE de larga duración (no es una petición con latencia propia).",
+    "/jobs/{job_id}/archivo": "Requiere un trabajo de exportación completado por un worker.",
+}
+
+
+# ----------------------------------------------------
+# user_service
+# ----------------------------------------------------
+
+ESCENARIOS_USUARIOS = (
+    _get("raíz", "/"),
+    _post("usuarios: crear", "/users/", USUARIO),
+    _post("usuarios: registrar", "/users/register", USUARIO),
+    _get("usuarios: listado", "/users/", repeticiones=5),
+    _get("usuarios: por username", "/users/usuario{usuario}"),
+    _post("auth: registrar", "/auth/register", USUARIO),
+    _post("auth: registrar empleado", "/auth/register-employee", dict(USUARIO, role="employee")),
+    _post("auth: login", "/auth/login", LOGIN),
+    _post("auth: refrescar token", "/auth/refresh", {"token": "{p0_access_token}"},
+          preparar=(_post("login", "/auth/login", LOGIN),)),
+)
+
+EXCLUIDAS_USUARIOS: Dict[str, str] = {}
+
+
+# ----------------------------------------------------
+# gateway (reenvía a los dos servicios levantados con uvicorn)
+# ----------------------------------------------------
+
+CREAR_EMPLEADO_GATEWAY = _post("rh: crear empleado", "/rh/employees", EMPLEADO)
+
+ESCENARIOS_GATEWAY = (
+    _get("raíz", "/"),
+    _get("health", "/health"),
+    _get("rh: empleados", "/rh/employees"),
+    _get("rh: empleado por ID", "/rh/employees/{empleado}"),
+    CREAR_EMPLEADO_GATEWAY,
+    Escenario("rh: actualizar empleado", "PUT", "/rh/employees/{empleado}", cuerpo={"puesto": "Cajero"}),
+    Escenario("rh: eliminar empleado", "DELETE", "/rh/employees/{p0_id}", preparar=(CREAR_EMPLEADO_GATEWAY,)),
+    _post("rh: empleado con usuario", "/rh/employees-with-user", dict(EMPLEADO, password="benchmark123")),
+    _post("rh: crear documento", "/rh/documents/employees/{empleado}/documents", DOCUMENTO),
+    _get("rh: documentos", "/rh/documents"),
+    _post("rh: crear horario", "/rh/schedules", HORARIO),
+    _get("rh: horarios", "/rh/schedules"),
+    _post("rh: crear solicitud", "/rh/request", SOLICITUD),
+    _get("rh: solicitudes", "/rh/request"),
+    _post("rh: crear turno", "/rh/shift", TURNO),
+    _get("rh: turnos", "/rh/shift"),
+    _post("rh: crear capacitación", "/rh/training", CAPACITACION),
+    _get("rh: capacitaciones", "/rh/training"),
+    _get("rh: exportar período", "/rh/periods/{periodo_cerrado}/exportar", repeticiones=3),
+    _post("auth: login", "/auth/login", LOGIN),
+    _post("auth: registrar", "/auth/register", USUARIO),
+    _get("auth: usuario actual", "/auth/me", cabeceras={"Authorization": "Bearer {p0_access_token}"},
+         preparar=(_post("login", "/auth/login", LOGIN),)),
+)
+
+EXCLUIDAS_GATEWAY = {
+    "/rh/events/stream": "Canal SSE de larga duración (no es una petición con latencia propia).",
+}
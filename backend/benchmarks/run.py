@@ -0,0 +1,521 @@
+# backend/benchmarks/run.py
+"""
+Benchmarks de rh_service, user_service y el gateway sobre bases SQLite sembradas.
+
+Uso (desde backend/):
+
+    # 1. Sembrar (una vez por escala; "grande" = 100k empleados, 5M turnos, 1M documentos)
+    python -m benchmarks.run sembrar --escala pequena
+    python -m benchmarks.run sembrar --escala media --turnos 2000000 --dir /tmp/rh_bench_media
+
+    # 2. Medir latencia y consultas de cada endpoint (sobre copias de las bases sembradas)
+    python -m benchmarks.run medir --salida resultados/$(git rev-parse --short HEAD).json
+    python -m benchmarks.run medir --objetivos rh --repeticiones 50 --sin-cache
+
+    # 3. Comparar dos commits (sale con código 1 si hay regresiones)
+    python -m benchmarks.run comparar resultados/abc1234.json resultados/def5678.json
+
+Cada servicio se carga en su propio proceso (los dos usan el paquete `app`). Para
+el gateway se levantan rh_service y user_service con uvicorn en puertos libres; su
+latencia incluye el salto HTTP y las consultas no se cuentan (ocurren en esos procesos).
+"""
+
+import argparse
+import json
+import platform
+import re
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import fields, replace
+from datetime import date, datetime, timedelta
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks import escenarios
+from benchmarks.datos import ESCALAS, Escala, escala_a_dict
+from benchmarks.entorno import BACKEND, CARGADORES
+
+DIRECTORIO_POR_DEFECTO = Path(tempfile.gettempdir()) / "rh_benchmarks"
+OBJETIVOS = ("rh", "usuarios", "gateway")
+BASES = {"rh": "rh.db", "usuarios": "usuarios.db"}
+ESCENARIOS = {"rh": escenarios.ESCENARIOS_RH, "usuarios": escenarios.ESCENARIOS_USUARIOS,
+              "gateway": escenarios.ESCENARIOS_GATEWAY}
+EXCLUIDAS = {"rh": escenarios.EXCLUIDAS_RH, "usuarios": escenarios.EXCLUIDAS_USUARIOS,
+             "gateway": escenarios.EXCLUIDAS_GATEWAY}
+
+MARCADOR = re.compile(r"\{(\w+)\}")
+# `{dia_n}` empieza después de los turnos sembrados (que terminan 30 días adelante)
+DIAS_SIN_TURNOS = 60
+# Segundos para que un servicio levantado con uvicorn responda
+ESPERA_SERVICIO = 60
+
+
+def _log(mensaje: str) -> None:
+    print(mensaje, file=sys.stderr, flush=True)
+
+
+def _subproceso(*args: str) -> None:
+    """Ejecuta `python -m benchmarks.run <args>` en un proceso nuevo (un servicio por proceso)."""
+    subprocess.run([sys.executable, "-m", "benchmarks.run", *args], cwd=BACKEND, check=True)
+
+
+# ----------------------------------------------------
+# Sembrado
+# ----------------------------------------------------
+
+def _borrar_base(ruta: Path) -> None:
+    for sufijo in ("", "-wal", "-shm"):
+        Path(f"{ruta}{sufijo}").unlink(missing_ok=True)
+
+
+def _informar(tabla: str, filas: int) -> None:
+    _log(f"  {tabla}: {filas:,} filas")
+
+
+def _sembrar_servicio(args) -> None:
+    """(Proceso hijo) Crea y llena la base de un servicio; guarda sus IDs de muestra."""
+    from benchmarks import datos
+
+    directorio = Path(args.dir)
+    ruta = directorio / BASES[args.servicio]
+    _borrar_base(ruta)
+    escala = Escala(**json.loads(args.escala))
+    _aplicacion, engine, metadata = CARGADORES[args.servicio](ruta)
+    if args.servicio == "rh":
+        muestras = datos.sembrar_rh(engine, metadata, escala, args.semilla, _informar)
+    else:
+        from app.utils.security import hash_password
+        muestras = datos.sembrar_usuarios(engine, metadata, escala, hash_password(datos.CONTRASENA_USUARIOS),
+                                          _informar)
+    engine.dispose()   # Vuelca el WAL en la base: se copia un solo archivo al medir
+    (directorio / f"muestras_{args.servicio}.json").write_text(json.dumps(muestras))
+
+
+def sembrar(args) -> None:
+    escala = ESCALAS[args.escala]
+    cambios = {f.name: getattr(args, f.name) for f in fields(Escala) if getattr(args, f.name) is not None}
+    escala = replace(escala, **cambios)
+    directorio = Path(args.dir)
+    directorio.mkdir(parents=True, exist_ok=True)
+
+    inicio = time.perf_counter()
+    muestras: Dict[str, Any] = {}
+    for servicio in ("rh", "usuarios"):
+        _log(f"Sembrando {servicio} en {directorio / BASES[servicio]}")
+        _subproceso("_sembrar", servicio, "--dir", str(directorio), "--semilla", str(args.semilla),
+                    "--escala", json.dumps(escala_a_dict(escala)))
+        muestras.update(json.loads((directorio / f"muestras_{servicio}.json").read_text()))
+
+    (directorio / "escala.json").write_text(json.dumps({
+        "nombre": args.escala if not cambios else f"{args.escala}+{','.join(sorted(cambios))}",
+        "escala": escala_a_dict(escala),
+        "semilla": args.semilla,
+        "sembrado_en": datetime.now().isoformat(timespec="seconds"),
+        "muestras": muestras,
+    }, indent=2))
+    _log(f"Listo en {time.perf_counter() - inicio:.1f} s")
+
+
+# ----------------------------------------------------
+# Medición
+# ----------------------------------------------------
+
+def _resolver(valor: Any, variables: Dict[str, Any]) -> Any:
+    """Sustituye los marcadores `{...}`; un marcador solo conserva el tipo de la variable."""
+    if isinstance(valor, str):
+        unico = MARCADOR.fullmatch(valor)
+        if unico:
+            return variables[unico.group(1)]
+        return MARCADOR.sub(lambda m: str(variables[m.group(1)]), valor)
+    if isinstance(valor, dict):
+        return {clave: _resolver(v, variables) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_resolver(v, variables) for v in valor]
+    return valor
+
+
+def _enviar(cliente, escenario: escenarios.Escenario, variables: Dict[str, Any]):
+    ruta = _resolver(escenario.ruta, variables)
+    respuesta = cliente.request(
+        escenario.metodo, ruta,
+        params={k: str(v) for k, v in _resolver(escenario.params, variables).items()},
+        json=_resolver(escenario.cuerpo, variables),
+        headers=_resolver(escenario.cabeceras, variables),
+    )
+    return ruta, respuesta
+
+
+def _preparar(cliente, escenario: escenarios.Escenario, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Ejecuta los pasos previos y expone su JSON como `{p<i>_<campo>}`."""
+    variables = dict(variables)
+    for i, paso in enumerate(escenario.preparar):
+        ruta, respuesta = _enviar(cliente, paso, variables)
+        if respuesta.status_code >= 400:
+            raise RuntimeError(f"{escenario.nombre}: el paso previo {paso.metodo} {ruta} "
+                               f"respondió {respuesta.status_code}: {respuesta.text[:200]}")
+        datos = respuesta.json() if respuesta.content else {}
+        if isinstance(datos, dict):
+            variables.update({f"p{i}_{clave}": v for clave, v in datos.items()})
+    return variables
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+def _medir_escenario(cliente, escenario: escenarios.Escenario, variables: Dict[str, Any], contador,
+                     consultas: Optional[List[int]], repeticiones: int, calentamiento: int) -> Dict[str, Any]:
+    """
+    La primera llamada se informa aparte (en frío: cachés vacías, páginas fuera de
+    memoria). Las de calentamiento no se cuentan. Los escenarios con tope de
+    repeticiones (operaciones pesadas) no se calientan.
+    """
+    if escenario.repeticiones is not None:
+        repeticiones, calentamiento = min(repeticiones, escenario.repeticiones), 0
+    tiempos: List[float] = []
+    por_consultas: List[int] = []
+    estados: Counter = Counter()
+    frio: Dict[str, Any] = {}
+    ruta = escenario.ruta
+    for i in range(1 + calentamiento + repeticiones):
+        n = next(contador)
+        dia_n = date.today() + timedelta(days=DIAS_SIN_TURNOS + n)
+        vars_llamada = _preparar(cliente, escenario, dict(variables, n=n, dia_n=dia_n.isoformat()))
+        antes = consultas[0] if consultas is not None else 0
+        inicio = time.perf_counter()
+        ruta, respuesta = _enviar(cliente, escenario, vars_llamada)
+        ms = (time.perf_counter() - inicio) * 1000
+        n_consultas = consultas[0] - antes if consultas is not None else None
+        estados[str(respuesta.status_code)] += 1
+        if i == 0:
+            frio = {"ms": round(ms, 3), "consultas": n_consultas}
+        elif i > calentamiento:
+            tiempos.append(ms)
+            if n_consultas is not None:
+                por_consultas.append(n_consultas)
+
+    return {
+        "nombre": escenario.nombre,
+        "metodo": escenario.metodo,
+        "ruta": escenario.ruta,
+        "ruta_resuelta": ruta,
+        "estados": dict(estados),
+        "repeticiones": len(tiempos),
+        "frio_ms": frio["ms"],
+        "frio_consultas": frio["consultas"],
+        "p50_ms": round(statistics.median(tiempos), 3),
+        "p95_ms": round(_percentil(tiempos, 95), 3),
+        "max_ms": round(max(tiempos), 3),
+        "media_ms": round(statistics.fmean(tiempos), 3),
+        "consultas": int(statistics.median(por_consultas)) if por_consultas else None,
+        "consultas_max": max(por_consultas) if por_consultas else None,
+    }
+
+
+def _cobertura(aplicacion, resultados: List[Dict[str, Any]], excluidas: Dict[str, str]) -> Dict[str, Any]:
+    """Rutas de la app sin ningún escenario que las alcance (sin contar las excluidas)."""
+    from starlette.routing import Match, Route
+
+    rutas = [r for r in aplicacion.routes if isinstance(r, Route) and r.include_in_schema]
+    medidas = set()
+    for resultado in resultados:
+        alcance = {"type": "http", "method": resultado["metodo"], "root_path": "",
+                   "path": resultado["ruta_resuelta"].split("?")[0]}
+        for ruta in rutas:
+            if ruta.matches(alcance)[0] == Match.FULL:
+                medidas.add((resultado["metodo"], ruta.path))
+                break
+    sin_medir = [f"{metodo} {ruta.path}" for ruta in rutas for metodo in sorted(ruta.methods - {"HEAD"})
+                 if (metodo, ruta.path) not in medidas and ruta.path not in excluidas]
+    return {"rutas": sum(len(r.methods - {"HEAD"}) for r in rutas), "medidas": len(medidas),
+            "sin_medir": sin_medir, "excluidas": excluidas}
+
+
+def _medir_con_cliente(aplicacion, objetivo: str, variables: Dict[str, Any], consultas: Optional[List[int]],
+                       args) -> Dict[str, Any]:
+    from fastapi.testclient import TestClient
+
+    # Sin `with`: el lifespan (tareas periódicas) no arranca. Un 500 se registra como estado, no corta la medición
+    cliente = TestClient(aplicacion, raise_server_exceptions=False)
+    contador = count(1)
+    resultados = []
+    for escenario in ESCENARIOS[objetivo]:
+        resultado = _medir_escenario(cliente, escenario, variables, contador, consultas,
+                                     args.repeticiones, args.calentamiento)
+        _log(f"  {escenario.nombre:45} p50 {resultado['p50_ms']:9.2f} ms  p95 {resultado['p95_ms']:9.2f} ms  "
+             f"consultas {resultado['consultas']}  {resultado['estados']}")
+        resultados.append(resultado)
+    return {"escenarios": resultados, "cobertura": _cobertura(aplicacion, resultados, EXCLUIDAS[objetivo])}
+
+
+def _contar_consultas(engine) -> List[int]:
+    """Contador de sentencias enviadas a la base (las peticiones se miden de a una)."""
+    from sqlalchemy import event
+
+    total = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _contar(*_args):
+        total[0] += 1
+
+    return total
+
+
+def _copiar_bases(origen: Path, destino: Path) -> None:
+    for servicio, nombre in BASES.items():
+        if not (origen / nombre).exists():
+            raise SystemExit(f"No existe {origen / nombre}: ejecutar primero `python -m benchmarks.run sembrar`.")
+        shutil.copyfile(origen / nombre, destino / nombre)
+
+
+def _variables(info: Dict[str, Any]) -> Dict[str, Any]:
+    hoy = date.today()
+    return dict(info["muestras"], hoy=hoy.isoformat(), hoy_mas_6=(hoy + timedelta(days=6)).isoformat())
+
+
+def _medir_servicio(args) -> None:
+    """(Proceso hijo) Mide un servicio en proceso con TestClient y guarda el JSON en `args.salida`."""
+    info = json.loads((Path(args.dir) / "escala.json").read_text())
+    trabajo = Path(args.trabajo)
+    if args.servicio == "rh":
+        aplicacion, engine, _metadata = CARGADORES["rh"](trabajo / BASES["rh"], cache=not args.sin_cache)
+    else:
+        aplicacion, engine, _metadata = CARGADORES["usuarios"](trabajo / BASES["usuarios"])
+    variables = _variables(info)
+    if args.servicio == "rh":
+        from app.utils.pagination import encode_cursor
+        variables["cursor_empleados"] = encode_cursor([info["muestras"]["empleado"]])
+    resultado = _medir_con_cliente(aplicacion, args.servicio, variables, _contar_consultas(engine), args)
+    Path(args.salida).write_text(json.dumps(resultado))
+
+
+def _servir(args) -> None:
+    """(Proceso hijo) Sirve un servicio con uvicorn para el gateway."""
+    import uvicorn
+
+    aplicacion, _engine, _metadata = CARGADORES[args.servicio](Path(args.db))
+    uvicorn.run(aplicacion, host="127.0.0.1", port=args.puerto, log_level="warning", lifespan="off")
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _esperar(url: str, proceso: subprocess.Popen) -> None:
+    import httpx
+
+    limite = time.monotonic() + ESPERA_SERVICIO
+    while time.monotonic() < limite:
+        if proceso.poll() is not None:
+            raise RuntimeError(f"El servicio de {url} terminó al arrancar (código {proceso.returncode}).")
+        try:
+            httpx.get(f"{url}/", timeout=1)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError(f"El servicio de {url} no respondió en {ESPERA_SERVICIO} s.")
+
+
+def _medir_gateway(args) -> None:
+    """(Proceso hijo) Levanta los dos servicios y mide el gateway en proceso."""
+    info = json.loads((Path(args.dir) / "escala.json").read_text())
+    trabajo = Path(args.trabajo)
+    procesos = {}
+    try:
+        urls = {}
+        for servicio in ("rh", "usuarios"):
+            puerto = _puerto_libre()
+            procesos[servicio] = subprocess.Popen(
+                [sys.executable, "-m", "benchmarks.run", "_servir", servicio,
+                 "--db", str(trabajo / BASES[servicio]), "--puerto", str(puerto)],
+                cwd=BACKEND,
+            )
+            urls[servicio] = f"http://127.0.0.1:{puerto}"
+        for servicio, url in urls.items():
+            _esperar(url, procesos[servicio])
+
+        sys.path.insert(0, str(BACKEND))
+        from gateway.app.config import settings
+        from gateway.app.main import app as aplicacion
+        settings.rh_service_url = urls["rh"]
+        settings.user_service_url = urls["usuarios"]
+        resultado = _medir_con_cliente(aplicacion, "gateway", _variables(info), None, args)
+    finally:
+        for proceso in procesos.values():
+            proceso.terminate()
+            proceso.wait()
+    Path(args.salida).write_text(json.dumps(resultado))
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], cwd=BACKEND, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def medir(args) -> None:
+    directorio = Path(args.dir)
+    info = json.loads((directorio / "escala.json").read_text())
+    resultado: Dict[str, Any] = {
+        "meta": {
+            "commit": _git("rev-parse", "HEAD"),
+            "cambios_sin_commit": bool(_git("status", "--porcelain", "--", ".")),
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "escala": info["nombre"],
+            "filas": info["escala"],
+            "semilla": info["semilla"],
+            "repeticiones": args.repeticiones,
+            "calentamiento": args.calentamiento,
+            "cache_consultas": not args.sin_cache,
+        },
+        "objetivos": {},
+    }
+    for objetivo in args.objetivos:
+        # Copia nueva por objetivo: los escenarios que escriben no alteran la base sembrada
+        with tempfile.TemporaryDirectory(prefix="rh_bench_") as trabajo:
+            _log(f"Midiendo {objetivo} (copiando las bases sembradas)")
+            _copiar_bases(directorio, Path(trabajo))
+            salida = Path(trabajo) / "resultado.json"
+            comando = ["_medir", objetivo, "--dir", str(directorio), "--trabajo", trabajo, "--salida", str(salida),
+                       "--repeticiones", str(args.repeticiones), "--calentamiento", str(args.calentamiento)]
+            if args.sin_cache:
+                comando.append("--sin-cache")
+            _subproceso(*comando)
+            resultado["objetivos"][objetivo] = json.loads(salida.read_text())
+            cobertura = resultado["objetivos"][objetivo]["cobertura"]
+            for ruta in cobertura["sin_medir"]:
+                _log(f"  Sin escenario: {ruta}")
+
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.salida:
+        Path(args.salida).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.salida).write_text(texto, encoding="utf-8")
+        _log(f"Resultados en {args.salida}")
+    else:
+        print(texto)
+
+
+def _medir_hijo(args) -> None:
+    if args.servicio == "gateway":
+        _medir_gateway(args)
+    else:
+        _medir_servicio(args)
+
+
+# ----------------------------------------------------
+# Comparación
+# ----------------------------------------------------
+
+def comparar(args) -> None:
+    """
+    Compara p50 y consultas por escenario. Es regresión un p50 que empeora más de
+    `--umbral` por ciento (y más de `--minimo-ms`, para ignorar ruido en endpoints
+    de décimas de milisegundo) o cualquier aumento de consultas.
+    """
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    nuevo = json.loads(Path(args.nuevo).read_text(encoding="utf-8"))
+    print(f"base:  {base['meta']['commit']} ({base['meta']['escala']}, {base['meta']['fecha']})")
+    print(f"nuevo: {nuevo['meta']['commit']} ({nuevo['meta']['escala']}, {nuevo['meta']['fecha']})")
+    if base["meta"]["filas"] != nuevo["meta"]["filas"]:
+        print("Aviso: las dos mediciones usan escalas distintas.")
+
+    regresiones = 0
+    for objetivo, datos in nuevo["objetivos"].items():
+        anteriores = {e["nombre"]: e for e in base["objetivos"].get(objetivo, {}).get("escenarios", [])}
+        print(f"\n[{objetivo}]")
+        print(f"{'escenario':45} {'p50 base':>10} {'p50 nuevo':>10} {'cambio':>8}  consultas")
+        for escenario in datos["escenarios"]:
+            anterior = anteriores.get(escenario["nombre"])
+            if anterior is None:
+                print(f"{escenario['nombre']:45} {'-':>10} {escenario['p50_ms']:>10.2f} {'nuevo':>8}")
+                continue
+            cambio = (escenario["p50_ms"] - anterior["p50_ms"]) / anterior["p50_ms"] * 100 if anterior["p50_ms"] else 0
+            peor_tiempo = (cambio > args.umbral and escenario["p50_ms"] - anterior["p50_ms"] > args.minimo_ms)
+            peor_consultas = (anterior["consultas"] is not None and escenario["consultas"] is not None
+                              and escenario["consultas"] > anterior["consultas"])
+            marca = "  <-- regresión" if peor_tiempo or peor_consultas else ""
+            regresiones += bool(marca)
+            print(f"{escenario['nombre']:45} {anterior['p50_ms']:>10.2f} {escenario['p50_ms']:>10.2f} "
+                  f"{cambio:>+7.1f}%  {anterior['consultas']} -> {escenario['consultas']}{marca}")
+
+    print(f"\n{regresiones} regresiones")
+    sys.exit(1 if regresiones else 0)
+
+
+# ----------------------------------------------------
+# CLI
+# ----------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("sembrar", help="Crea las bases SQLite con datos sintéticos.")
+    p.add_argument("--escala", choices=sorted(ESCALAS), default="pequena")
+    p.add_argument("--dir", default=str(DIRECTORIO_POR_DEFECTO))
+    p.add_argument("--semilla", type=int, default=42)
+    for campo in fields(Escala):
+        p.add_argument(f"--{campo.name.replace('_', '-')}", dest=campo.name, type=int,
+                       help=f"Reemplaza las filas de la escala elegida ({campo.name}).")
+    p.set_defaults(funcion=sembrar)
+
+    p = sub.add_parser("medir", help="Mide cada endpoint y emite JSON.")
+    p.add_argument("--dir", default=str(DIRECTORIO_POR_DEFECTO))
+    p.add_argument("--objetivos", nargs="+", choices=OBJETIVOS, default=list(OBJETIVOS))
+    p.add_argument("--repeticiones", type=int, default=20)
+    p.add_argument("--calentamiento", type=int, default=3)
+    p.add_argument("--sin-cache", action="store_true", help="Desactiva la caché de consultas de rh_service.")
+    p.add_argument("--salida", help="Archivo JSON de resultados (por defecto, la salida estándar).")
+    p.set_defaults(funcion=medir)
+
+    p = sub.add_parser("comparar", help="Compara dos resultados de `medir`.")
+    p.add_argument("base")
+    p.add_argument("nuevo")
+    p.add_argument("--umbral", type=float, default=20.0, help="Empeoramiento de p50 (%%) que cuenta como regresión.")
+    p.add_argument("--minimo-ms", type=float, default=1.0)
+    p.set_defaults(funcion=comparar)
+
+    # Subcomandos internos: cada servicio corre en su propio proceso
+    p = sub.add_parser("_sembrar")
+    p.add_argument("servicio", choices=sorted(BASES))
+    p.add_argument("--dir", required=True)
+    p.add_argument("--escala", required=True)
+    p.add_argument("--semilla", type=int, required=True)
+    p.set_defaults(funcion=_sembrar_servicio)
+
+    p = sub.add_parser("_medir")
+    p.add_argument("servicio", choices=OBJETIVOS)
+    p.add_argument("--dir", required=True)
+    p.add_argument("--trabajo", required=True)
+    p.add_argument("--salida", required=True)
+    p.add_argument("--repeticiones", type=int, required=True)
+    p.add_argument("--calentamiento", type=int, required=True)
+    p.add_argument("--sin-cache", action="store_true")
+    p.set_defaults(funcion=_medir_hijo)
+
+    p = sub.add_parser("_servir")
+    p.add_argument("servicio", choices=sorted(BASES))
+    p.add_argument("--db", required=True)
+    p.add_argument("--puerto", type=int, required=True)
+    p.set_defaults(funcion=_servir)
+
+    args = parser.parse_args(argv)
+    args.funcion(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import httpx
 from typing import Optional, Any
 import json
@@ -8,6 +8,12 @@ from gateway.app.config import settings
 # ✅ SOLUCIÓN: Deshabilitar trailing slash redirect
 router = APIRouter(redirect_slashes=False)
 
+# Headers de respuesta de los microservicios que se reenvían al cliente
+PROPAGATED_HEADERS = ["X-Next-Cursor", "X-DB-Queries", "X-DB-Time-ms", "X-DB-N-Plus-One"]
+
+# Headers de respuesta que se reenvían en las respuestas transmitidas (streaming)
+STREAM_HEADERS = ["Content-Type", "Content-Disposition", "Cache-Control", "X-Accel-Buffering"]
+
 # ========================================
 # FUNCIÓN CENTRAL: FORWARD REQUEST
 # ========================================
@@ -59,6 +65,14 @@ async def forward_request(
                 "Access-Control-Allow-Headers": "Content-Type, Authorization",
                 "Access-Control-Allow-Credentials": "true"
             }
+
+            # Headers del microservicio que sí deben llegar al cliente
+            # (p. ej. el cursor de paginación X-Next-Cursor)
+            exposed = [h for h in PROPAGATED_HEADERS if h in response.headers]
+            for h in exposed:
+                cors_headers[h] = response.headers[h]
+            if exposed:
+                cors_headers["Access-Control-Expose-Headers"] = ", ".join(exposed)
             
             return JSONResponse(
                 content=content,
@@ -83,6 +97,71 @@ async def forward_request(
             )
 
 
+async def stream_request(
+    url: str,
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None
+):
+    """
+    Reenvía un GET cuya respuesta se transmite tal como llega (exportaciones,
+    Server-Sent Events), sin acumularla en memoria ni límite de tiempo de lectura.
+    La conexión con el microservicio se cierra cuando termina la respuesta o el
+    cliente se desconecta. Los errores del microservicio se devuelven como JSON.
+    """
+    forward_headers = {
+        k: v for k, v in (headers or {}).items()
+        if k.lower() in ["authorization", "last-event-id", "accept"]
+    }
+
+    client = httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.request_timeout, connect=settings.connect_timeout, read=None),
+        follow_redirects=False
+    )
+    try:
+        response = await client.send(
+            client.build_request("GET", url, headers=forward_headers, params=params),
+            stream=True
+        )
+    except httpx.ConnectError:
+        await client.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Servicio no disponible: {url}"
+        )
+    except httpx.TimeoutException:
+        await client.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Tiempo de espera agotado para el servicio: {url}"
+        )
+
+    if response.status_code != 200:
+        try:
+            await response.aread()
+            try:
+                content = response.json()
+            except Exception:
+                content = {"detail": response.text if response.text else "Empty response"}
+        finally:
+            await response.aclose()
+            await client.aclose()
+        return JSONResponse(content=content, status_code=response.status_code)
+
+    async def contenido():
+        try:
+            async for bloque in response.aiter_raw():
+                yield bloque
+        finally:
+            await response.aclose()
+            await client.aclose()
+
+    return StreamingResponse(
+        contenido(),
+        status_code=response.status_code,
+        headers={h: response.headers[h] for h in STREAM_HEADERS if h in response.headers}
+    )
+
+
 # ========================================
 # RUTAS DE EMPLEADOS - SIN BARRA FINAL
 # ========================================
@@ -350,4 +429,28 @@ async def read_trainings_via_gateway(request: Request):
         f"{settings.rh_service_url}/training",
         params=request.query_params,
         headers=dict(request.headers.items()),
-    )
\ No newline at end of file
+    )
+
+
+# ========================================
+# RUTAS DE STREAMING (EXPORTACIONES Y EVENTOS)
+# ========================================
+
+@router.get("/periods/{period_id}/exportar")
+async def export_period_via_gateway(period_id: int, request: Request):
+    """Transmite la exportación CSV/NDJSON de la nómina de un período."""
+    return await stream_request(
+        f"{settings.rh_service_url}/periods/{period_id}/exportar",
+        params=request.query_params,
+        headers=dict(request.headers.items()),
+    )
+
+
+@router.get("/events/stream")
+async def stream_events_via_gateway(request: Request):
+    """Canal Server-Sent Events con los cambios de alertas y de cobertura de turnos."""
+    return await stream_request(
+        f"{settings.rh_service_url}/events/stream",
+        params=request.query_params,
+        headers=dict(request.headers.items()),
+    )
@@ -31,6 +31,8 @@ from app.models import shift
 from app.models import training
 from app.models import sucursal
 from app.models import role
+from app.models import metric_snapshot
+from app.models import alert
 # NOTA: Ajusta estas líneas si tus modelos están en otro lugar.
 # --------------------------------------------------------------------------
 
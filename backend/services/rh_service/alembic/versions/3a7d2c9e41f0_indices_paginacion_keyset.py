@@ -0,0 +1,30 @@
+"""indices paginacion keyset
+
+Revision ID: 3a7d2c9e41f0
+Revises: c57fa3597cb0
+Create Date: 2026-10-19 09:12:04.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7d2c9e41f0'
+down_revision: Union[str, Sequence[str], None] = 'c57fa3597cb0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_requests_fecha_solicitud_id', 'requests', ['fecha_solicitud', 'id'], unique=False)
+    op.create_index('ix_payroll_periods_fecha_inicio_id', 'payroll_periods', ['fecha_inicio', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payroll_periods_fecha_inicio_id', table_name='payroll_periods')
+    op.drop_index('ix_requests_fecha_solicitud_id', table_name='requests')
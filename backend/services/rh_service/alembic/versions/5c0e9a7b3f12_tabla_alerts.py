@@ -0,0 +1,43 @@
+"""tabla alerts
+
+Revision ID: 5c0e9a7b3f12
+Revises: 8e4b1f6a2d93
+Create Date: 2026-10-19 11:20:45.907113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c0e9a7b3f12'
+down_revision: Union[str, Sequence[str], None] = '8e4b1f6a2d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('alerts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('origen', sa.String(length=20), nullable=False),
+    sa.Column('id_entidad', sa.Integer(), nullable=False),
+    sa.Column('descripcion', sa.String(length=255), nullable=False),
+    sa.Column('prioridad', sa.String(length=10), nullable=False),
+    sa.Column('prioridad_orden', sa.Integer(), nullable=False),
+    sa.Column('fecha_referencia', sa.Date(), nullable=False),
+    sa.Column('actualizado_en', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('origen', 'id_entidad', name='uq_alerts_origen_entidad')
+    )
+    op.create_index(op.f('ix_alerts_id'), 'alerts', ['id'], unique=False)
+    op.create_index('ix_alerts_prioridad_fecha', 'alerts', ['prioridad_orden', 'fecha_referencia'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_alerts_prioridad_fecha', table_name='alerts')
+    op.drop_index(op.f('ix_alerts_id'), table_name='alerts')
+    op.drop_table('alerts')
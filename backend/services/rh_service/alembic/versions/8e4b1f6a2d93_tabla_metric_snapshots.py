@@ -0,0 +1,48 @@
+"""tabla metric_snapshots
+
+Revision ID: 8e4b1f6a2d93
+Revises: 3a7d2c9e41f0
+Create Date: 2026-10-19 10:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b1f6a2d93'
+down_revision: Union[str, Sequence[str], None] = '3a7d2c9e41f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('metric_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('fecha', sa.Date(), nullable=False),
+    sa.Column('sucursal_id', sa.Integer(), nullable=True),
+    sa.Column('total_employees', sa.Integer(), nullable=False),
+    sa.Column('employees_added_month', sa.Integer(), nullable=False),
+    sa.Column('shifts_today', sa.Integer(), nullable=False),
+    sa.Column('pending_shifts', sa.Integer(), nullable=False),
+    sa.Column('active_trainings', sa.Integer(), nullable=False),
+    sa.Column('expiring_trainings', sa.Integer(), nullable=False),
+    sa.Column('total_documentos', sa.Integer(), nullable=False),
+    sa.Column('documentos_aprobados', sa.Integer(), nullable=False),
+    sa.Column('compliance_rate', sa.Integer(), nullable=False),
+    sa.Column('actualizado_en', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['sucursal_id'], ['sucursal.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_metric_snapshots_id'), 'metric_snapshots', ['id'], unique=False)
+    op.create_index('ix_metric_snapshots_sucursal_fecha', 'metric_snapshots', ['sucursal_id', 'fecha'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_metric_snapshots_sucursal_fecha', table_name='metric_snapshots')
+    op.drop_index(op.f('ix_metric_snapshots_id'), table_name='metric_snapshots')
+    op.drop_table('metric_snapshots')
@@ -0,0 +1,28 @@
+"""fulltext busqueda empleados
+
+Revision ID: a4e9b1c7d2f6
+Revises: f3a6c2d8b915
+Create Date: 2026-10-19 20:11:36.205718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9b1c7d2f6'
+down_revision: Union[str, Sequence[str], None] = 'f3a6c2d8b915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ft_employees_busqueda', 'employees', ['nombre', 'apellido', 'email', 'puesto'], unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ft_employees_busqueda', table_name='employees')
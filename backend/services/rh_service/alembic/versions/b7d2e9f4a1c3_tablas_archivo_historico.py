@@ -0,0 +1,80 @@
+"""tablas archivo historico
+
+Revision ID: b7d2e9f4a1c3
+Revises: a4e9b1c7d2f6
+Create Date: 2026-10-19 21:14:52.630418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e9f4a1c3'
+down_revision: Union[str, Sequence[str], None] = 'a4e9b1c7d2f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('shifts_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('fecha', sa.Date(), nullable=False),
+    sa.Column('hora_inicio_real', sa.Time(), nullable=False),
+    sa.Column('hora_fin_real', sa.Time(), nullable=False),
+    sa.Column('puesto_requerido', sa.String(length=50), nullable=True),
+    sa.Column('assigned_employee_id', sa.Integer(), nullable=True),
+    sa.Column('is_covered', sa.Boolean(), nullable=True),
+    sa.Column('es_alteracion', sa.Boolean(), nullable=True),
+    sa.Column('notas', sa.String(length=255), nullable=True),
+    sa.Column('archivado_en', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_row_format='COMPRESSED'
+    )
+    op.create_index('ix_shifts_archive_fecha', 'shifts_archive', ['fecha'], unique=False)
+    op.create_index('ix_shifts_archive_employee_fecha', 'shifts_archive', ['assigned_employee_id', 'fecha'], unique=False)
+
+    op.create_table('payment_details_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('period_id', sa.Integer(), nullable=False),
+    sa.Column('horas_totales_trabajadas', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('monto_base_calculado', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('total_descuentos', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('total_bonificaciones', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('monto_neto', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('archivado_en', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_row_format='COMPRESSED'
+    )
+    op.create_index('ix_payment_details_archive_period', 'payment_details_archive', ['period_id'], unique=False)
+    op.create_index('ix_payment_details_archive_employee', 'payment_details_archive', ['employee_id'], unique=False)
+
+    op.create_table('pay_components_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('payment_detail_id', sa.Integer(), nullable=False),
+    sa.Column('tipo', sa.String(length=50), nullable=False),
+    sa.Column('descripcion', sa.String(length=255), nullable=True),
+    sa.Column('monto', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    mysql_row_format='COMPRESSED'
+    )
+    op.create_index('ix_pay_components_archive_detail', 'pay_components_archive', ['payment_detail_id'], unique=False)
+
+    op.add_column('payroll_periods', sa.Column('archivado', sa.Boolean(), server_default=sa.false(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('payroll_periods', 'archivado')
+    op.drop_index('ix_pay_components_archive_detail', table_name='pay_components_archive')
+    op.drop_table('pay_components_archive')
+    op.drop_index('ix_payment_details_archive_employee', table_name='payment_details_archive')
+    op.drop_index('ix_payment_details_archive_period', table_name='payment_details_archive')
+    op.drop_table('payment_details_archive')
+    op.drop_index('ix_shifts_archive_employee_fecha', table_name='shifts_archive')
+    op.drop_index('ix_shifts_archive_fecha', table_name='shifts_archive')
+    op.drop_table('shifts_archive')
@@ -0,0 +1,28 @@
+"""indice turnos empleado fecha
+
+Revision ID: b7d4e2a9c6f1
+Revises: 5c0e9a7b3f12
+Create Date: 2026-10-19 15:41:27.530184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d4e2a9c6f1'
+down_revision: Union[str, Sequence[str], None] = '5c0e9a7b3f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_shifts_employee_fecha', 'shifts', ['assigned_employee_id', 'fecha'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_shifts_employee_fecha', table_name='shifts')
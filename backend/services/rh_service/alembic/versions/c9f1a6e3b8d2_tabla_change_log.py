@@ -0,0 +1,37 @@
+"""tabla change_log
+
+Revision ID: c9f1a6e3b8d2
+Revises: b7d2e9f4a1c3
+Create Date: 2026-10-19 23:02:17.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f1a6e3b8d2'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e9f4a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_log',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entidad', sa.String(length=50), nullable=False),
+    sa.Column('id_entidad', sa.Integer(), nullable=True),
+    sa.Column('operacion', sa.String(length=10), nullable=False),
+    sa.Column('creado_en', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_creado_en', 'change_log', ['creado_en'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_change_log_creado_en', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,62 @@
+"""unique detalle pago empleado periodo
+
+Revision ID: d1c8f5a0e7b4
+Revises: b7d4e2a9c6f1
+Create Date: 2026-10-19 17:08:52.904316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1c8f5a0e7b4'
+down_revision: Union[str, Sequence[str], None] = 'b7d4e2a9c6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _fusionar_duplicados() -> None:
+    """
+    Antes de la restricción única, fusiona los detalles repetidos de un mismo
+    (empleado, período), que el alta permitía: se conserva el más reciente (mayor id)
+    con el cálculo base de ese detalle, sus componentes pasan a apuntar a él y sus
+    totales suman los de todos los duplicados. Luego se borran los demás.
+    """
+    conexion = op.get_bind()
+    grupos = conexion.execute(sa.text(
+        "SELECT employee_id, period_id, MAX(id) AS conservar, "
+        "COALESCE(SUM(total_bonificaciones), 0) AS bonificaciones, "
+        "COALESCE(SUM(total_descuentos), 0) AS descuentos "
+        "FROM payment_details GROUP BY employee_id, period_id HAVING COUNT(*) > 1"
+    )).all()
+    for grupo in grupos:
+        claves = {"employee_id": grupo.employee_id, "period_id": grupo.period_id, "conservar": grupo.conservar}
+        conexion.execute(sa.text(
+            "UPDATE pay_components SET payment_detail_id = :conservar WHERE payment_detail_id IN "
+            "(SELECT id FROM payment_details "
+            "WHERE employee_id = :employee_id AND period_id = :period_id AND id <> :conservar)"
+        ), claves)
+        conexion.execute(sa.text(
+            "DELETE FROM payment_details "
+            "WHERE employee_id = :employee_id AND period_id = :period_id AND id <> :conservar"
+        ), claves)
+        conexion.execute(sa.text(
+            "UPDATE payment_details SET total_bonificaciones = :bonificaciones, "
+            "total_descuentos = :descuentos, "
+            "monto_neto = COALESCE(monto_base_calculado, 0) + :bonificaciones - :descuentos "
+            "WHERE id = :conservar"
+        ), {"conservar": grupo.conservar, "bonificaciones": grupo.bonificaciones, "descuentos": grupo.descuentos})
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _fusionar_duplicados()
+    op.create_unique_constraint('uq_payment_details_employee_period', 'payment_details', ['employee_id', 'period_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_payment_details_employee_period', 'payment_details', type_='unique')
@@ -0,0 +1,52 @@
+"""tabla jobs
+
+Revision ID: d4b8e2f7c1a9
+Revises: c9f1a6e3b8d2
+Create Date: 2026-10-19 23:48:05.261734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8e2f7c1a9'
+down_revision: Union[str, Sequence[str], None] = 'c9f1a6e3b8d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tipo', sa.String(length=50), nullable=False),
+    sa.Column('parametros', sa.Text(), nullable=False),
+    sa.Column('estado', sa.String(length=20), nullable=False),
+    sa.Column('prioridad', sa.Integer(), nullable=False),
+    sa.Column('intentos', sa.Integer(), nullable=False),
+    sa.Column('max_intentos', sa.Integer(), nullable=False),
+    sa.Column('progreso', sa.Integer(), nullable=False),
+    sa.Column('mensaje', sa.String(length=255), nullable=True),
+    sa.Column('resultado', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('cancelacion_solicitada', sa.Boolean(), nullable=False),
+    sa.Column('worker', sa.String(length=100), nullable=True),
+    sa.Column('disponible_desde', sa.DateTime(), nullable=False),
+    sa.Column('latido_en', sa.DateTime(), nullable=True),
+    sa.Column('creado_en', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.Column('iniciado_en', sa.DateTime(), nullable=True),
+    sa.Column('terminado_en', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_jobs_id'), 'jobs', ['id'], unique=False)
+    op.create_index('ix_jobs_estado_prioridad', 'jobs', ['estado', 'prioridad', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_estado_prioridad', table_name='jobs')
+    op.drop_index(op.f('ix_jobs_id'), table_name='jobs')
+    op.drop_table('jobs')
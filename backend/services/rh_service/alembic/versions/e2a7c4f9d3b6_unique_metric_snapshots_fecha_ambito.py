@@ -0,0 +1,53 @@
+"""unique metric snapshots fecha ambito
+
+Revision ID: e2a7c4f9d3b6
+Revises: d4b8e2f7c1a9
+Create Date: 2026-10-19 18:42:15.316208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c4f9d3b6'
+down_revision: Union[str, Sequence[str], None] = 'd4b8e2f7c1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _borrar_duplicados() -> None:
+    """
+    Antes de la restricción única, deja una sola foto por (fecha, sucursal): la
+    generación concurrente pudo escribir varias; se conserva la última (mayor id).
+    """
+    conexion = op.get_bind()
+    duplicados = [fila.id for fila in conexion.execute(sa.text(
+        "SELECT s.id FROM metric_snapshots s JOIN ("
+        "SELECT fecha, COALESCE(sucursal_id, 0) AS ambito, MAX(id) AS conservar "
+        "FROM metric_snapshots GROUP BY fecha, COALESCE(sucursal_id, 0)"
+        ") u ON u.fecha = s.fecha AND u.ambito = COALESCE(s.sucursal_id, 0) "
+        "WHERE s.id <> u.conservar"
+    ))]
+    for inicio in range(0, len(duplicados), 1000):
+        conexion.execute(
+            sa.text("DELETE FROM metric_snapshots WHERE id IN :ids").bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": duplicados[inicio:inicio + 1000]},
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _borrar_duplicados()
+    op.add_column('metric_snapshots', sa.Column(
+        'ambito', sa.Integer(), sa.Computed('coalesce(sucursal_id, 0)', persisted=True), nullable=False
+    ))
+    op.create_unique_constraint('uq_metric_snapshots_fecha_ambito', 'metric_snapshots', ['fecha', 'ambito'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_metric_snapshots_fecha_ambito', 'metric_snapshots', type_='unique')
+    op.drop_column('metric_snapshots', 'ambito')
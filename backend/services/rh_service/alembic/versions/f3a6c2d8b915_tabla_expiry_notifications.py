@@ -0,0 +1,39 @@
+"""tabla expiry notifications
+
+Revision ID: f3a6c2d8b915
+Revises: d1c8f5a0e7b4
+Create Date: 2026-10-19 19:02:17.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a6c2d8b915'
+down_revision: Union[str, Sequence[str], None] = 'd1c8f5a0e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('expiry_notifications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('origen', sa.String(length=20), nullable=False),
+    sa.Column('id_entidad', sa.Integer(), nullable=False),
+    sa.Column('fecha_objetivo', sa.Date(), nullable=False),
+    sa.Column('umbral', sa.Integer(), nullable=False),
+    sa.Column('disparado_en', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('origen', 'id_entidad', 'fecha_objetivo', 'umbral', name='uq_expiry_notifications_disparo')
+    )
+    op.create_index(op.f('ix_expiry_notifications_id'), 'expiry_notifications', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_expiry_notifications_id'), table_name='expiry_notifications')
+    op.drop_table('expiry_notifications')
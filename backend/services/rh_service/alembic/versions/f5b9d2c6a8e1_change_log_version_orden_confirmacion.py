@@ -0,0 +1,41 @@
+"""change_log version en orden de confirmacion
+
+Revision ID: f5b9d2c6a8e1
+Revises: e2a7c4f9d3b6
+Create Date: 2026-10-19 19:27:41.208734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b9d2c6a8e1'
+down_revision: Union[str, Sequence[str], None] = 'e2a7c4f9d3b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('change_log', sa.Column('version', sa.Integer(), nullable=True))
+    # Los registros existentes conservan su posición: version = id (los tokens emitidos siguen valiendo)
+    op.execute("UPDATE change_log SET version = id")
+    op.create_index('ix_change_log_version', 'change_log', ['version'], unique=True)
+
+    op.create_table('change_log_secuencia',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('ultima_version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO change_log_secuencia (id, ultima_version) "
+               "SELECT 1, COALESCE(MAX(id), 0) FROM change_log")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('change_log_secuencia')
+    op.drop_index('ix_change_log_version', table_name='change_log')
+    op.drop_column('change_log', 'version')
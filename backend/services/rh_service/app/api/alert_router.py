@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date
 
 from app.database import get_db
 from app.services.rh_service import HRGatewayService
-from app.schemas.alert import AlertaResponse, ResumenStatsResponse 
+from app.services.metric_snapshot_service import MetricSnapshotService
+from app.services.alert_service import AlertService
+from app.schemas.alert import AlertaResponse, ResumenStatsResponse, MetricSnapshotResponse, OrigenAlerta, PrioridadAlerta 
+from app.utils.pagination import with_next_cursor
+from app.utils.query_metrics import presupuesto_consultas
 
 # ✅ CORRECCIÓN: Usar prefijo vacío porque se agrega en base.py
 router = APIRouter(
@@ -26,9 +31,13 @@ def get_gateway_service(db: Session = Depends(get_db)) -> HRGatewayService:
 @router.get(
     "/stats/resumen", 
     response_model=ResumenStatsResponse, 
-    summary="Obtiene el resumen de estadísticas consolidadas para el dashboard"
+    summary="Obtiene el resumen de estadísticas consolidadas para el dashboard",
+    # Foto del día + referencia (una consulta) y próximo corte de nómina;
+    # sin foto del ámbito, 5 consultas agregadas más para calcularla en vivo
+    dependencies=[Depends(presupuesto_consultas(7))]
 )
 async def get_resumen_stats(
+    sucursal_id: Optional[int] = Query(None, description="Métricas de una sucursal. Si es `None`, total de la empresa."),
     gateway_service: HRGatewayService = Depends(get_gateway_service) 
 ):
     """
@@ -43,10 +52,14 @@ async def get_resumen_stats(
     - expiring_trainings: Capacitaciones por vencer
     - compliance_rate: Porcentaje de cumplimiento
     - compliance_change: Cambio de cumplimiento vs mes anterior
+    
+    Los valores se leen de la foto diaria precalculada (ver /alert/stats/snapshot).
     """
     try:
-        stats = await gateway_service.get_resumen_stats() 
+        stats = await gateway_service.get_resumen_stats(sucursal_id=sucursal_id) 
         return stats
+    except HTTPException:
+        raise
     except Exception as e:
         # ✅ Log del error completo
         import traceback
@@ -56,6 +69,23 @@ async def get_resumen_stats(
             detail=f"Error al obtener estadísticas: {str(e)}"
         )
 
+# --------------------------------------------------------------------
+# RUTA 1.1: REGENERAR LA FOTO DIARIA DE MÉTRICAS
+# Ruta completa: /alert/stats/snapshot
+# --------------------------------------------------------------------
+@router.post(
+    "/stats/snapshot",
+    response_model=MetricSnapshotResponse,
+    summary="Regenera la foto del día de las métricas del dashboard"
+)
+def create_metric_snapshot(db: Session = Depends(get_db)):
+    """
+    Recalcula y guarda la foto del día (total y por sucursal). La tarea periódica
+    del servicio lo hace automáticamente; este endpoint permite forzarlo.
+    Devuelve la foto global.
+    """
+    return MetricSnapshotService().generar_snapshot(db)
+
 # --------------------------------------------------------------------
 # RUTA 2: ALERTAS PENDIENTES
 # Ruta completa: /alert/alertas/pendientes
@@ -64,24 +94,42 @@ async def get_resumen_stats(
 @router.get(
     "/alertas/pendientes", 
     response_model=List[AlertaResponse],
-    summary="Obtiene todas las alertas pendientes consolidadas"
+    summary="Obtiene todas las alertas pendientes consolidadas",
+    dependencies=[Depends(presupuesto_consultas(1))]
 )
 async def get_pending_alerts(
+    response: Response,
+    origen: Optional[List[OrigenAlerta]] = Query(None, description="Filtra por uno o varios orígenes."),
+    prioridad: Optional[List[PrioridadAlerta]] = Query(None, description="Filtra por una o varias prioridades."),
+    fecha_desde: Optional[date] = Query(None, description="Fecha de referencia mínima (YYYY-MM-DD)."),
+    fecha_hasta: Optional[date] = Query(None, description="Fecha de referencia máxima (YYYY-MM-DD)."),
+    skip: int = Query(0, description="Número de registros a omitir para paginación"),
+    limit: int = Query(100, description="Límite de registros a devolver"),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     gateway_service: HRGatewayService = Depends(get_gateway_service)
 ):
     """
     Endpoint para obtener todas las alertas pendientes consolidadas.
     
-    Consolida alertas de:
+    Lee la tabla de alertas mantenida incrementalmente. Consolida alertas de:
     - REQUEST: Solicitudes pendientes de aprobación
     - SHIFT: Turnos sin cubrir
     - DOCUMENT: Documentos pendientes o por vencer
     - TRAINING: Capacitaciones pendientes
     - PAYROLL: Cierres de nómina próximos
+    
+    Admite filtros por `origen`, `prioridad` y ventana de fechas, y paginación
+    ordenada por prioridad (offset o cursor con `after` / header `X-Next-Cursor`).
     """
     try:
-        alertas = await gateway_service.get_pending_alerts()
-        return alertas
+        page = await gateway_service.get_pending_alerts(
+            origenes=origen, prioridades=prioridad,
+            fecha_desde=fecha_desde, fecha_hasta=fecha_hasta,
+            skip=skip, limit=limit, after=after,
+        )
+        return with_next_cursor(response, page)
+    except HTTPException:
+        raise
     except Exception as e:
         # ✅ Log del error completo
         import traceback
@@ -89,4 +137,20 @@ async def get_pending_alerts(
         raise HTTPException(
             status_code=500,
             detail=f"Error al obtener alertas: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+# --------------------------------------------------------------------
+# RUTA 3: RECALCULAR ALERTAS
+# Ruta completa: /alert/alertas/recalcular
+# --------------------------------------------------------------------
+@router.post(
+    "/alertas/recalcular",
+    summary="Reconstruye la tabla de alertas desde las entidades de origen"
+)
+def recalculate_alerts(db: Session = Depends(get_db)):
+    """
+    Recalcula todas las alertas. El barrido diario lo hace automáticamente a
+    medianoche; este endpoint permite forzarlo (p. ej. tras una carga masiva).
+    """
+    total = AlertService().recalcular_alertas(db)
+    return {"message": "Alertas recalculadas exitosamente.", "total_alertas": total}
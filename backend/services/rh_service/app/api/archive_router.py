@@ -0,0 +1,35 @@
+# rh_service/app/api/archive_router.py
+# Rutas del archivo histórico de turnos y pagos.
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.schema_archive import ArchiveRunResponse
+from app.services.archive_service import ArchiveService
+
+router = APIRouter()
+service = ArchiveService()
+
+
+@router.post(
+    "/ejecutar",
+    response_model=ArchiveRunResponse,
+    summary="Mueve turnos y pagos de meses cerrados a las tablas de archivo"
+)
+def run_archive_route(
+    db: Session = Depends(get_db)
+):
+    """
+    Archiva los turnos anteriores al corte (mes en curso y `ARCHIVE_HOT_MONTHS`
+    meses cerrados se conservan) y los pagos de los períodos finalizados que
+    terminaron antes del corte. Con `ARCHIVE_ENABLED` también se ejecuta al arrancar
+    y cada medianoche.
+
+    Las lecturas siguen devolviendo lo archivado: las consultas por fecha (turnos de
+    un día, ventana del perfil, cálculo de nómina) y la exportación de un período
+    leen el archivo cuando el rango lo requiere; las lecturas por ID buscan en el
+    archivo si no encuentran la fila, y las de un empleado (turnos, detalles de pago,
+    secciones del perfil) unen ambas tablas. Lo archivado es de solo lectura.
+    """
+    return service.archivar(db)
@@ -14,6 +14,10 @@ from app.api import training_router
 from app.api import alert_router
 from app.api import role_router
 from app.api import sucursal_router
+from app.api import event_router
+from app.api import archive_router
+from app.api import change_router
+from app.api import job_router
 # El router principal
 api_router = APIRouter()
 
@@ -62,4 +66,20 @@ api_router.include_router(role_router.router, tags=["Roles"], prefix="/roles")
 
 #11 Ruta para roles
 
-api_router.include_router(sucursal_router.router, tags=["Sucursal"], prefix="/sucursal")
\ No newline at end of file
+api_router.include_router(sucursal_router.router, tags=["Sucursal"], prefix="/sucursal")
+
+#12 Eventos en tiempo real (SSE)
+
+api_router.include_router(event_router.router, tags=["Eventos"], prefix="/events")
+
+#13 Archivo histórico de turnos y pagos
+
+api_router.include_router(archive_router.router, tags=["Archivo"], prefix="/archive")
+
+#14 Feed de cambios (sincronización incremental)
+
+api_router.include_router(change_router.router, tags=["Cambios"], prefix="/changes")
+
+#15 Trabajos en segundo plano
+
+api_router.include_router(job_router.router, tags=["Trabajos"], prefix="/jobs")
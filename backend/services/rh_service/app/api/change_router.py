@@ -0,0 +1,38 @@
+# rh_service/app/api/change_router.py
+# Feed incremental de altas, modificaciones y bajas.
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.schema_change import ChangeFeedResponse
+from app.services.change_feed_service import ChangeFeedService
+from app.utils.query_metrics import presupuesto_consultas
+
+router = APIRouter(redirect_slashes=False)
+
+
+@router.get(
+    "",
+    response_model=ChangeFeedResponse,
+    summary="Cambios posteriores a un token",
+    # Máximo + mínimo de change_log y la página de cambios
+    dependencies=[Depends(presupuesto_consultas(2))]
+)
+def read_changes_route(
+    since: Optional[str] = Query(None, description="Token de la respuesta anterior. Sin token: solo devuelve el token actual."),
+    entidades: Optional[str] = Query(None, description="Tablas separadas por coma (p. ej. `employees,shifts`). Por defecto, todas."),
+    limit: int = Query(500, ge=1, le=1000, description="Máximo de cambios por respuesta"),
+    db: Session = Depends(get_db)
+):
+    """
+    Devuelve, en orden, los cambios confirmados después de `since` y el token para la
+    siguiente llamada. Con `hay_mas = true` conviene volver a llamar de inmediato.
+
+    Lanza HTTPException 400 si el token no es válido y 410 (Gone) si es más antiguo
+    que los cambios conservados: el cliente debe recargar los datos completos.
+    """
+    service = ChangeFeedService()
+    filtro = [e.strip() for e in entidades.split(",") if e.strip()] if entidades else None
+    return service.get_cambios(db, since=since, entidades=filtro, limit=limit)
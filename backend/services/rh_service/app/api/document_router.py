@@ -1,15 +1,17 @@
 # rh_service/app/api/document_router.py
 # Rutas para la gestión de la entidad Document (Documentos Legales).
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 # Importación de dependencias y servicios
 from app.database import get_db
-from app.services.document_service import DocumentService
+from app.services.document_service import DocumentService, PROYECCION_DOCUMENTOS
 from app.schemas.schema_document import DocumentCreate, DocumentUpdate, DocumentResponse
+from app.utils.pagination import with_next_cursor
+from app.utils.projection import respuesta_proyectada
 
 # Inicialización del router
 router = APIRouter()
@@ -47,19 +49,31 @@ def create_document_route(
     summary="Obtiene todos los documentos o filtra por ID de empleado"
 )
 def read_documents_route(
+    response: Response,
     employee_id: Optional[int] = Query(None, description="Filtra documentos por ID de empleado. Si es `None`, trae todos."),
     skip: int = 0, 
     limit: int = 100, 
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
+    fields: Optional[str] = Query(None, description="Campos separados por coma para un listado compacto (solo esas columnas). Tiene prioridad sobre `vista`."),
+    vista: Literal["completa", "resumen"] = Query("completa", description="`resumen`: listado compacto con los campos más usados."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista paginada de todos los documentos. 
     Permite filtrar por `employee_id` como parámetro de consulta (`query parameter`).
+    Sin filtro, admite paginación por cursor (`after` / header `X-Next-Cursor`).
+    Con `fields` o `vista=resumen` devuelve objetos planos con solo esos campos (más `id`).
     """
+    campos = PROYECCION_DOCUMENTOS.seleccion(fields, vista)
+    if campos is not None:
+        return respuesta_proyectada(service.get_documents_proyectados(
+            db, campos, employee_id=employee_id, skip=skip, limit=limit, after=after
+        ))
     if employee_id is not None:
         documents = service.get_documents_by_employee(db, employee_id=employee_id)
     else:
-        documents = service.get_all_documents(db, skip=skip, limit=limit)
+        page = service.get_documents_page(db, skip=skip, limit=limit, after=after)
+        documents = with_next_cursor(response, page)
     return documents
 
 @router.get(
@@ -1,15 +1,22 @@
 # rh_service/app/api/employee_router.py
 # Rutas para la gestión de la entidad Employee.
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # Importación de dependencias y servicios
 from app.database import get_db
-from app.services.employee_service import EmployeeService
-from app.schemas.schema_employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
+from app.services.employee_service import EmployeeService, PROYECCION_EMPLEADOS, SECCIONES_PERFIL
+from app.services.employee_search_service import EmployeeSearchService
+from app.schemas.schema_employee import (
+    EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeSearchResult, EmployeeProfileResponse,
+)
+from app.utils.pagination import with_next_cursor
+from app.utils.projection import respuesta_proyectada
+from app.utils.query_metrics import presupuesto_consultas
 
 # ✅ SOLUCIÓN: Deshabilitar trailing slash redirect
 router = APIRouter(redirect_slashes=False)
@@ -43,24 +50,62 @@ def create_employee_route(
 @router.get(
     "", 
     response_model=List[EmployeeResponse],
-    summary="Obtiene todos los empleados"
+    summary="Obtiene todos los empleados",
+    # Rol y sucursal se cargan con JOIN: el listado completo es una sola consulta
+    dependencies=[Depends(presupuesto_consultas(1))]
 )
 def read_all_employees_route(
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
+    fields: Optional[str] = Query(None, description="Campos separados por coma para un listado compacto (solo esas columnas). Tiene prioridad sobre `vista`."),
+    vista: Literal["completa", "resumen"] = Query("completa", description="`resumen`: listado compacto con los campos más usados."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista paginada de todos los empleados activos e inactivos.
+    
+    Si se envía `after`, pagina por cursor; el cursor de la siguiente página
+    se devuelve en el header `X-Next-Cursor`.
+
+    Con `fields` (p. ej. `nombre,apellido,rol_nombre`) o `vista=resumen` devuelve
+    objetos planos con solo esos campos (más `id`): rol y sucursal como
+    `rol_nombre` / `sucursal_nombre` en lugar de objetos anidados.
     """
     service = EmployeeService()
-    employees = service.get_all_employees(db, skip=skip, limit=limit)
-    return employees
+    campos = PROYECCION_EMPLEADOS.seleccion(fields, vista)
+    if campos is not None:
+        return respuesta_proyectada(service.get_employees_proyectados(db, campos, skip=skip, limit=limit, after=after))
+    page = service.get_employees_page(db, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
+
+@router.get(
+    "/buscar",
+    response_model=List[EmployeeSearchResult],
+    summary="Busca empleados por nombre, apellido, email o puesto"
+)
+def search_employees_route(
+    q: str = Query(..., min_length=1, max_length=100, description="Texto a buscar (todas las palabras deben coincidir)."),
+    sucursal_id: Optional[int] = Query(None, description="Filtrar por sucursal"),
+    rol_id: Optional[int] = Query(None, description="Filtrar por rol"),
+    is_active: Optional[bool] = Query(None, description="Filtrar por estado activo/inactivo"),
+    limit: int = Query(20, ge=1, le=100, description="Número máximo de resultados"),
+    db: Session = Depends(get_db)
+):
+    """
+    Búsqueda sin distinguir acentos ni mayúsculas, por palabra completa, prefijo
+    (`gonz` encuentra `González`) o parecida (`gonsalez`). Resultados ordenados por
+    relevancia. Debe declararse antes de `/{employee_id}`.
+    """
+    service = EmployeeSearchService()
+    return service.buscar(db, q, sucursal_id=sucursal_id, rol_id=rol_id, is_active=is_active, limit=limit)
 
 @router.get(
     "/{employee_id}", 
     response_model=EmployeeResponse,
-    summary="Obtiene un empleado por ID"
+    summary="Obtiene un empleado por ID",
+    dependencies=[Depends(presupuesto_consultas(1))]
 )
 def read_employee_route(
     employee_id: int, 
@@ -80,6 +125,40 @@ def read_employee_route(
         )
     return db_employee
 
+@router.get(
+    "/{employee_id}/perfil-completo",
+    response_model=EmployeeProfileResponse,
+    summary="Perfil completo del empleado (documentos, capacitaciones, turnos, solicitudes y pagos)",
+    # Empleado con rol y sucursal (1) + una consulta por sección con su límite
+    # (los turnos archivados van en la misma consulta que los actuales)
+    dependencies=[Depends(presupuesto_consultas(1 + len(SECCIONES_PERFIL)))]
+)
+def read_employee_profile_route(
+    employee_id: int,
+    secciones: Optional[str] = Query(None, description=f"Secciones separadas por coma ({', '.join(SECCIONES_PERFIL)}). Por defecto, todas."),
+    desde: Optional[date] = Query(None, description="Inicio de la ventana de turnos y solicitudes (por defecto, hace 30 días)."),
+    hasta: Optional[date] = Query(None, description="Fin de la ventana de turnos y solicitudes (por defecto, dentro de 30 días)."),
+    limite: int = Query(20, ge=1, le=200, description="Máximo de registros por sección"),
+    db: Session = Depends(get_db)
+):
+    """
+    Devuelve en una sola llamada lo que la ficha del empleado pedía a cinco rutas
+    distintas, con un número fijo de consultas sin importar cuántos registros tenga.
+
+    Lanza HTTPException 404 si el empleado no existe.
+    """
+    pedidas = tuple(SECCIONES_PERFIL)
+    if secciones:
+        pedidas = tuple(dict.fromkeys(s.strip() for s in secciones.split(",") if s.strip()))
+        desconocidas = set(pedidas) - SECCIONES_PERFIL.keys()
+        if desconocidas:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Secciones desconocidas: {', '.join(sorted(desconocidas))}."
+            )
+    service = EmployeeService()
+    return service.get_employee_profile(db, employee_id, secciones=pedidas, desde=desde, hasta=hasta, limite=limite)
+
 @router.put(
     "/{employee_id}", 
     response_model=EmployeeResponse,
@@ -110,7 +189,7 @@ def update_employee_route(
     try:
         updated_employee = service.update_employee(
             db=db, 
-            db_employee=db_employee, 
+            employee_id=employee_id, 
             employee_update=employee_in
         )
         return updated_employee
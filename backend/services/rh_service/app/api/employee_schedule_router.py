@@ -2,14 +2,18 @@
 # Rutas para la gestión de patrones de horario semanales recurrentes (EmployeeSchedule).
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # Importación de dependencias y servicios
 from app.database import get_db
 from app.services.employee_Schedule_service import EmployeeScheduleService
-from app.schemas.schema_employee_schedule import EmployeeScheduleCreate, EmployeeScheduleUpdate, EmployeeScheduleResponse
+from app.schemas.schema_employee_schedule import (
+    EmployeeScheduleCreate, EmployeeScheduleUpdate, EmployeeScheduleResponse,
+    ShiftGenerationRequest, ShiftGenerationResponse,
+)
+from app.utils.pagination import with_next_cursor
 
 # Inicialización del router
 router = APIRouter()
@@ -47,6 +51,26 @@ def create_schedule_route(
         )
 
 
+# --------------------------------------------------------------------
+# RUTA 1b: GENERAR TURNOS A PARTIR DE LOS PATRONES (POST)
+# --------------------------------------------------------------------
+@router.post(
+    "/generar-turnos",
+    response_model=ShiftGenerationResponse,
+    summary="Genera los turnos de un rango de fechas a partir de los patrones vigentes"
+)
+def generate_shifts_route(
+    params: ShiftGenerationRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Crea en bloque los turnos que correspondan a los patrones de horario vigentes
+    en el rango indicado. Es idempotente: los turnos ya generados no se duplican, y
+    los turnos existentes que difieren de su patrón quedan marcados como alteración.
+    """
+    return service.generate_shifts(db=db, params=params)
+
+
 # --------------------------------------------------------------------
 # RUTA 2: OBTENER HORARIOS (GET - General o por Empleado)
 # --------------------------------------------------------------------
@@ -56,14 +80,17 @@ def create_schedule_route(
     summary="Obtiene todos los patrones de horario o filtra por empleado"
 )
 def read_schedules_route(
+    response: Response,
     employee_id: int | None = Query(None, description="ID del empleado para filtrar sus horarios."),
     skip: int = 0,
     limit: int = 100,
+    after: str | None = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     db: Session = Depends(get_db)
 ):
     """
     Si se proporciona `employee_id`, devuelve todos los patrones de horario de ese empleado.
-    De lo contrario, devuelve una lista paginada de todos los patrones de horario en el sistema.
+    De lo contrario, devuelve una lista paginada de todos los patrones de horario en el sistema
+    (por offset o por cursor con `after` / header `X-Next-Cursor`).
     """
     if employee_id is not None:
         schedules = service.get_schedules_by_employee(db, employee_id=employee_id)
@@ -72,7 +99,8 @@ def read_schedules_route(
              # Optamos por devolver una lista vacía si el empleado no tiene horarios
              pass 
     else:
-        schedules = service.get_all_schedules(db, skip=skip, limit=limit)
+        page = service.get_schedules_page(db, skip=skip, limit=limit, after=after)
+        schedules = with_next_cursor(response, page)
         
     return schedules
 
@@ -0,0 +1,62 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.utils.config import settings
+from app.utils.event_hub import formatear_sse, hub
+
+router = APIRouter(
+    tags=["Eventos"]
+)
+
+# Tipos de evento que se difunden
+TIPOS_EVENTO = ("alerta", "alertas_recalculadas", "turno", "turnos_generados", "vencimiento")
+
+
+@router.get(
+    "/stream",
+    summary="Canal Server-Sent Events con los cambios de alertas y de cobertura de turnos"
+)
+async def stream_events_route(
+    tipos: Optional[str] = Query(None, description=f"Tipos separados por coma ({', '.join(TIPOS_EVENTO)}). Por defecto, todos."),
+    ultimo_id: Optional[int] = Query(None, description="Reanuda después de este evento (alternativa al header Last-Event-ID)."),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Mantiene la conexión abierta y envía cada cambio confirmado:
+
+    - `alerta`: alerta creada/actualizada o eliminada (`accion`, `origen`, `id_entidad`, `alerta`).
+    - `alertas_recalculadas`: la tabla se reconstruyó; recargar `/alert/alertas/pendientes`.
+    - `turno`: turno creado, eliminado o con cambio de asignación/cobertura.
+    - `turnos_generados`: generación desde patrones (`fecha_inicio`, `fecha_fin`, `creados`);
+      recargar los turnos del rango.
+    - `vencimiento`: un documento o capacitación cruzó un umbral de vencimiento (`umbral`, `dias_restantes`).
+    - `reinicio`: no se pudo reanudar desde el último ID; recargar el estado completo.
+
+    Cada evento lleva `id`; el navegador lo reenvía en `Last-Event-ID` al reconectar.
+    Si no hay eventos se envía un comentario de latido periódico.
+    """
+    filtro = None
+    if tipos:
+        filtro = frozenset(t.strip() for t in tipos.split(",") if t.strip())
+        desconocidos = filtro - set(TIPOS_EVENTO)
+        if desconocidos:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                detail=f"Tipos de evento desconocidos: {', '.join(sorted(desconocidos))}.")
+    if hub.conexiones >= settings.EVENTS_MAX_CONNECTIONS:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Demasiadas conexiones de eventos abiertas.")
+
+    desde = last_event_id if last_event_id is not None else ultimo_id
+
+    async def contenido():
+        yield "retry: 3000\n\n"
+        async for evento in hub.escuchar(desde, filtro):
+            yield formatear_sse(evento)
+
+    return StreamingResponse(
+        contenido(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
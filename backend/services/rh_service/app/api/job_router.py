@@ -0,0 +1,104 @@
+# rh_service/app/api/job_router.py
+# Trabajos en segundo plano: nómina, conciliación, exportación, generación de turnos y archivo.
+
+import os
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.schema_job import JobCreate, JobResponse
+from app.services.job_service import JobService
+from app.utils.pagination import with_next_cursor
+
+router = APIRouter(redirect_slashes=False)
+service = JobService()
+
+
+@router.post(
+    "",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Encola un trabajo pesado"
+)
+def create_job_route(
+    job_in: JobCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Registra el trabajo y responde de inmediato; su avance se consulta en
+    `GET /jobs/{id}`. Tipos y parámetros:
+
+    - `nomina`: `period_id` (lo mismo que `POST /periods/{id}/ejecutar-nomina`);
+    - `conciliar_nomina`: `period_id`, `reparar`;
+    - `exportar_nomina`: `period_id`, `formato` (csv o ndjson); descarga en `GET /jobs/{id}/archivo`;
+    - `generar_turnos`: `fecha_inicio`, `fecha_fin`, `employee_ids`;
+    - `archivo`: sin parámetros.
+
+    Lanza 422 si el tipo no existe o los parámetros no son válidos.
+    """
+    return service.encolar(db, job_in)
+
+
+@router.get(
+    "",
+    response_model=List[JobResponse],
+    summary="Lista los trabajos, más recientes primero"
+)
+def read_jobs_route(
+    response: Response,
+    estado: Optional[Literal["pendiente", "en_curso", "completado", "fallido", "cancelado"]] = Query(None),
+    tipo: Optional[str] = Query(None),
+    skip: int = 0,
+    limit: int = Query(100, le=500),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
+    db: Session = Depends(get_db)
+):
+    page = service.get_jobs_page(db, estado=estado, tipo=tipo, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Estado, avance y resultado de un trabajo"
+)
+def read_job_route(
+    job_id: int,
+    db: Session = Depends(get_db)
+):
+    """Lanza 404 si el trabajo no existe."""
+    return service.get_job(db, job_id)
+
+
+@router.post(
+    "/{job_id}/cancelar",
+    response_model=JobResponse,
+    summary="Cancela un trabajo pendiente o en curso"
+)
+def cancel_job_route(
+    job_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Un trabajo pendiente queda cancelado de inmediato; uno en curso se detiene en
+    su próximo informe de progreso (`cancelacion_solicitada = true` mientras tanto)
+    sin guardar lo que no confirmó. El archivo confirma por lote: los lotes ya
+    archivados se conservan.
+    Lanza 404 si no existe y 409 si ya terminó.
+    """
+    return service.cancelar(db, job_id)
+
+
+@router.get(
+    "/{job_id}/archivo",
+    summary="Descarga el archivo generado por un trabajo de exportación"
+)
+def download_job_file_route(
+    job_id: int,
+    db: Session = Depends(get_db)
+):
+    """Lanza 404 si el trabajo no existe, no genera archivos o aún no terminó."""
+    ruta = service.ruta_archivo(db, job_id)
+    return FileResponse(ruta, filename=os.path.basename(ruta))
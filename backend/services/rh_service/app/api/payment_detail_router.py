@@ -1,14 +1,15 @@
 # rh_service/app/api/payment_detail_router.py
 # Rutas para la gestión de la entidad PaymentDetail.
 
-from typing import List
-from fastapi import APIRouter, Depends, status, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, status, Query, Response
 from sqlalchemy.orm import Session
 
 # Importación de dependencias y servicios
 from app.database import get_db
 from app.services.payment_detail_service import PaymentDetailService
 from app.schemas.schema_payment_detail import PaymentDetailCreate, PaymentDetailUpdate, PaymentDetailResponse
+from app.utils.pagination import with_next_cursor
 
 # Inicialización del router
 router = APIRouter()
@@ -30,7 +31,8 @@ def create_payment_detail_route(
 ):
     """
     Registra el resumen de pago de un empleado para un período de nómina específico.
-    El monto neto se calcula automáticamente.
+    Bonificaciones y descuentos empiezan en 0 (se acumulan con los componentes de
+    pago) y el monto neto se calcula automáticamente.
     """
     return service.create_detail(db=db, detail_data=detail_in)
 
@@ -41,16 +43,22 @@ def create_payment_detail_route(
     summary="Lista todos los detalles de pago o filtra por empleado"
 )
 def read_payment_details_route(
+    response: Response,
     employee_id: int = Query(None, description="Filtrar por ID de empleado"),
+    skip: int = Query(0, description="Número de registros a omitir para paginación"),
+    limit: int = Query(100, description="Límite de registros a devolver"),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista de todos los detalles de pago. Opcionalmente, se puede 
     filtrar la lista para obtener solo los pagos de un empleado específico.
+    Sin filtro, admite paginación por cursor (`after` / header `X-Next-Cursor`).
     """
     if employee_id is not None:
         return service.get_details_by_employee(db, employee_id=employee_id)
-    return service.get_all_details(db)
+    page = service.get_details_page(db, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
 
 
 @router.get(
@@ -63,10 +71,10 @@ def read_payment_detail_route(
     db: Session = Depends(get_db)
 ):
     """
-    Obtiene los detalles completos de un pago específico.
-    Lanza 404 si no existe.
+    Obtiene los detalles completos de un pago específico, también si su período
+    fue archivado. Lanza 404 si no existe.
     """
-    return service.get_detail_by_id(db, detail_id=detail_id)
+    return service.get_detail_by_id(db, detail_id=detail_id, archivo=True)
 
 
 @router.put(
@@ -80,8 +88,8 @@ def update_payment_detail_route(
     db: Session = Depends(get_db)
 ):
     """
-    Actualiza la información de un detalle de pago. El monto neto se recalcula 
-    si se modifican los campos base (monto_base, bonificaciones, descuentos).
+    Actualiza la información de un detalle de pago. El monto neto se recalcula
+    si se modifica el monto base; los totales solo cambian con los componentes.
     """
     return service.update_detail(
         db=db, 
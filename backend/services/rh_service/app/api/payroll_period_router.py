@@ -1,20 +1,29 @@
 # rh_service/app/api/payroll_period_router.py
 # Rutas para la gestión de la entidad PayrollPeriod (Ciclos de Nómina).
 
-from typing import List
-from fastapi import APIRouter, Depends, status, Query
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 # Importación de dependencias, servicios y schemas
 from app.database import get_db
 # Asegúrate de que el path de importación sea correcto en tu entorno
 from app.services.payroll_period_service import PayrollPeriodService
+from app.services.payroll_run_service import PayrollRunService
 from app.schemas.payroll_period import PayrollPeriodCreate, PayrollPeriodUpdate, PayrollPeriodResponse 
+from app.schemas.schema_payment_detail import PayrollRunResponse, ReconciliationResponse
+from app.services.payment_detail_service import PaymentDetailService
+from app.services.payroll_export_service import PayrollExportService
+from app.utils.pagination import with_next_cursor
 # Asumo que tienes un schema 'PayrollPeriodResponse' para la salida
 
 # Inicialización del router
 router = APIRouter()
 service = PayrollPeriodService()
+run_service = PayrollRunService()
+detail_service = PaymentDetailService()
+export_service = PayrollExportService()
 
 # ----------------------------------------------------------------------
 # ENDPOINTS CRUD
@@ -44,15 +53,19 @@ def create_payroll_period_route(
     summary="Lista todos los períodos de nómina, con paginación"
 )
 def read_payroll_periods_route(
+    response: Response,
     skip: int = Query(0, description="Número de registros a omitir para paginación"),
     limit: int = Query(100, description="Límite de registros a devolver"),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista de todos los períodos de nómina disponibles, ordenados 
     de forma descendente por su fecha de inicio.
+    Admite paginación por cursor (`after` / header `X-Next-Cursor`).
     """
-    return service.get_all_periods(db, skip=skip, limit=limit)
+    page = service.get_periods_page(db, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
 
 
 @router.get(
@@ -93,6 +106,68 @@ def update_payroll_period_route(
     )
 
 
+@router.post(
+    "/{period_id}/ejecutar-nomina",
+    response_model=PayrollRunResponse,
+    summary="Calcula la nómina de todos los empleados del período"
+)
+def run_payroll_route(
+    period_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Calcula (o recalcula) en una sola transacción el detalle de pago de cada
+    empleado: horas de los turnos cubiertos por su tarifa (o salario fijo) más
+    bonificaciones y menos descuentos de sus componentes.
+    Lanza 404 si no existe y 409 si el período ya está finalizado.
+    """
+    return run_service.run_payroll(db, period_id=period_id)
+
+
+@router.post(
+    "/{period_id}/conciliar-totales",
+    response_model=ReconciliationResponse,
+    summary="Verifica y repara los totales de los detalles de pago del período"
+)
+def reconcile_period_totals_route(
+    period_id: int,
+    reparar: bool = Query(True, description="Guardar las correcciones (False: solo informar)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Compara los totales de bonificaciones y descuentos de cada detalle de pago con
+    la suma de sus componentes y corrige las diferencias (p. ej. totales editados
+    manualmente). Lanza 404 si el período no existe.
+    """
+    return detail_service.reconcile_period_totals(db, period_id=period_id, reparar=reparar)
+
+
+@router.get(
+    "/{period_id}/exportar",
+    summary="Exporta en streaming los detalles de pago del período con sus componentes"
+)
+def export_period_route(
+    period_id: int,
+    formato: Literal["csv", "ndjson"] = Query("csv", description="Formato de salida: csv o ndjson"),
+    db: Session = Depends(get_db)
+):
+    """
+    Transmite los detalles de pago del período (con nombre del empleado y sus
+    componentes) a medida que se leen, sin cargar el período completo en memoria.
+    Lanza 404 si el período no existe.
+    """
+    export_service.validar_periodo(db, period_id)
+    if formato == "ndjson":
+        contenido, media_type = export_service.exportar_ndjson(period_id), "application/x-ndjson"
+    else:
+        contenido, media_type = export_service.exportar_csv(period_id), "text/csv; charset=utf-8"
+    return StreamingResponse(
+        contenido,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="nomina_periodo_{period_id}.{formato}"'},
+    )
+
+
 @router.delete(
     "/{period_id}", 
     status_code=status.HTTP_204_NO_CONTENT,
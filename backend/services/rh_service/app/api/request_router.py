@@ -2,7 +2,7 @@
 # Rutas para la gestión de la entidad Request (Vacaciones, Permisos, etc.).
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Response
 from sqlalchemy.orm import Session
 
 # Importación de dependencias, servicios y schemas
@@ -10,6 +10,7 @@ from app.database import get_db
 # Asegúrate de que el path de importación sea correcto en tu entorno
 from app.services.request_service import RequestService
 from app.schemas.request import RequestCreate, RequestUpdate, RequestResponse 
+from app.utils.pagination import with_next_cursor
 
 # Inicialización del router
 router = APIRouter()
@@ -43,18 +44,22 @@ def create_request_route(
     summary="Lista todas las solicitudes o filtra por empleado"
 )
 def read_requests_route(
+    response: Response,
     employee_id: Optional[int] = Query(None, description="Filtrar por ID de empleado"),
     skip: int = Query(0, description="Número de registros a omitir para paginación"),
     limit: int = Query(100, description="Límite de registros a devolver"),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista de todas las solicitudes. Opcionalmente, permite filtrar 
     para ver solo las solicitudes de un empleado específico usando 'employee_id'.
+    Sin filtro, admite paginación por cursor (`after` / header `X-Next-Cursor`).
     """
     if employee_id is not None:
         return service.get_requests_by_employee(db, employee_id=employee_id)
-    return service.get_all_requests(db, skip=skip, limit=limit)
+    page = service.get_requests_page(db, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
 
 
 @router.get(
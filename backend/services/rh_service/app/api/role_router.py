@@ -1,10 +1,11 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.schema_role import RoleCreate, RoleResponse,RoleUpdate
 from app.services.role_service import RoleService
+from app.utils.pagination import with_next_cursor
 
 router=APIRouter()
 
@@ -27,14 +28,17 @@ def create_role_route(role_in:RoleCreate,db:Session=Depends(get_db)):
             summary="Obtiene datos de roles "
             )
 def read_all_roles_route(
+    response:Response,
     skip:int = 0 ,
     limit:int=100,
+    after:Optional[str]=Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     db:Session=Depends(get_db)
 ):
     #lista de todos los empleados activos 
+    #con after se pagina por cursor (siguiente cursor en el header X-Next-Cursor)
     service=RoleService()
-    roles=service.get_all_roles(db,skip=skip,limit=limit)
-    return roles 
+    page=service.get_roles_page(db,skip=skip,limit=limit,after=after)
+    return with_next_cursor(response,page)
 
 @router.get("/{rol_id}", response_model=RoleResponse, summary="Rol por id")
 def read_roles_route(
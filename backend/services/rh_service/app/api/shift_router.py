@@ -1,20 +1,27 @@
 # rh_service/app/api/shift_router.py
 # Rutas para la gestión de la entidad Shift (Turnos de Trabajo).
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, status, Query
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, status, Query, Response
 from sqlalchemy.orm import Session
 from datetime import date # Necesario para filtrar por fecha
 
 # Importación de dependencias, servicios y schemas
 from app.database import get_db
-from app.services.shift_service import ShiftService
+from app.services.shift_service import ShiftService, PROYECCION_TURNOS
+from app.services.availability_service import AvailabilityService
 # Importación de los schemas correctos
-from app.schemas.schema_shift import ShiftCreate, ShiftUpdate, ShiftAssign, ShiftResponse 
+from app.schemas.schema_shift import (
+    ShiftCreate, ShiftUpdate, ShiftAssign, ShiftResponse, ShiftCandidateResponse,
+    ShiftAssignmentCheck, ShiftBatchValidationResponse,
+)
+from app.utils.pagination import with_next_cursor
+from app.utils.projection import respuesta_proyectada
 
 # Inicialización del router
 router = APIRouter()
 service = ShiftService()
+availability_service = AvailabilityService()
 
 # ----------------------------------------------------------------------
 # ENDPOINTS CRUD & Funcional
@@ -37,29 +44,59 @@ def create_shift_route(
     return service.create_shift(db=db, shift_data=shift_in)
 
 
+@router.post(
+    "/validar-lote",
+    response_model=ShiftBatchValidationResponse,
+    summary="Valida un lote de asignaciones sin guardarlas"
+)
+def validate_assignments_batch_route(
+    asignaciones: List[ShiftAssignmentCheck],
+    db: Session = Depends(get_db)
+):
+    """
+    Detecta en una sola pasada los solapamientos de un lote de asignaciones
+    (p. ej. la planificación de una semana) entre sí y con los turnos ya existentes.
+    """
+    conflictos = service.validate_assignments_batch(db, asignaciones=asignaciones)
+    return ShiftBatchValidationResponse(valido=not conflictos, conflictos=conflictos)
+
+
 @router.get(
     "/", 
     response_model=List[ShiftResponse],
     summary="Lista turnos o filtra por empleado o fecha"
 )
 def read_shifts_route(
+    response: Response,
     employee_id: Optional[int] = Query(None, description="Filtrar por ID de empleado asignado"),
     target_date: Optional[date] = Query(None, description="Filtrar por fecha específica (YYYY-MM-DD)"),
     skip: int = Query(0, description="Número de registros a omitir para paginación"),
     limit: int = Query(100, description="Límite de registros a devolver"),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
+    fields: Optional[str] = Query(None, description="Campos separados por coma para un listado compacto (solo esas columnas). Tiene prioridad sobre `vista`."),
+    vista: Literal["completa", "resumen"] = Query("completa", description="`resumen`: listado compacto con los campos más usados."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista de turnos. Permite filtrado por:
     - ID de empleado (`employee_id`)
     - Fecha específica (`target_date`)
-    Si no se provee filtro, devuelve la lista paginada de todos los turnos.
+    Si no se provee filtro, devuelve la lista paginada de todos los turnos
+    (por offset o por cursor con `after` / header `X-Next-Cursor`).
+    Con `fields` o `vista=resumen` devuelve objetos planos con solo esos campos
+    (más `id`), incluido el nombre del empleado asignado si se pide.
     """
+    campos = PROYECCION_TURNOS.seleccion(fields, vista)
+    if campos is not None:
+        return respuesta_proyectada(service.get_shifts_proyectados(
+            db, campos, employee_id=employee_id, target_date=target_date, skip=skip, limit=limit, after=after
+        ))
     if employee_id is not None:
         return service.get_shifts_by_employee(db, employee_id=employee_id)
     if target_date is not None:
         return service.get_shifts_by_date(db, target_date=target_date)
-    return service.get_all_shifts(db, skip=skip, limit=limit)
+    page = service.get_shifts_page(db, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
 
 
 @router.get(
@@ -72,10 +109,30 @@ def read_shift_route(
     db: Session = Depends(get_db)
 ):
     """
-    Obtiene los detalles completos de un turno específico.
+    Obtiene los detalles completos de un turno específico, también si fue archivado.
     Lanza 404 si no existe.
     """
-    return service.get_shift_by_id(db, shift_id=shift_id)
+    return service.get_shift_by_id(db, shift_id=shift_id, archivo=True)
+
+
+@router.get(
+    "/{shift_id}/candidatos",
+    response_model=List[ShiftCandidateResponse],
+    summary="Empleados disponibles para cubrir un turno"
+)
+def read_shift_candidates_route(
+    shift_id: int,
+    sucursal_id: Optional[int] = Query(None, description="Limitar a empleados de una sucursal"),
+    limit: int = Query(20, ge=1, le=200, description="Número máximo de candidatos"),
+    db: Session = Depends(get_db)
+):
+    """
+    Devuelve los empleados que pueden cubrir el turno, ordenados por recomendación:
+    mismo puesto, horario base que cubre el turno, sin turnos solapados ni ausencias
+    aprobadas ese día, priorizando a quienes tienen menos turnos en la semana.
+    Lanza 404 si el turno no existe.
+    """
+    return availability_service.get_candidatos(db, shift_id=shift_id, sucursal_id=sucursal_id, limit=limit)
 
 
 @router.patch(
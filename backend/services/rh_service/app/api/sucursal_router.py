@@ -1,10 +1,11 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.schema_sucursal import SucursalCreate,SucursalResponse,SucursalUpdate
 from app.services.sucursal_service import SucursalService
+from app.utils.pagination import with_next_cursor
 
 router= APIRouter()
 
@@ -23,14 +24,17 @@ def create_sucursal_route(sucursal_in:SucursalCreate,db:Session=Depends(get_db))
             )
 @router.get("/", response_model=List[SucursalResponse], summary="Obtener los datos de las sucursales ")
 def read_all_sucursales(
+    response:Response,
     skip:int= 0 ,
     limit:int = 100, 
+    after:Optional[str]=Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
     db: Session=Depends(get_db)
 ):
     #lsita todas las sucursales 
+    #con after se pagina por cursor (siguiente cursor en el header X-Next-Cursor)
     service=SucursalService()
-    sucursal=service.get_all_sucursales(db,skip=skip,limit=limit)
-    return sucursal
+    page=service.get_sucursales_page(db,skip=skip,limit=limit,after=after)
+    return with_next_cursor(response,page)
 @router.get("/{sucursal_id}", response_model=SucursalResponse,summary="Obtener sucrusal por id ")
 def read_sucursal_route(sucursal_id:int, db:Session=Depends(get_db)):
     service=SucursalService()
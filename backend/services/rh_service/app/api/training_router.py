@@ -1,18 +1,22 @@
 # rh_service/app/api/training_router.py
 # Rutas para la gestión de la entidad Training (Registros de Capacitación).
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, status, Query
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, status, Query, Response
 from sqlalchemy.orm import Session
 
 # Importación de dependencias, servicios y schemas
 from app.database import get_db
-from app.services.training_service import TrainingService
-from app.schemas.schema_training import TrainingCreate, TrainingUpdate, TrainingResponse 
+from app.services.training_service import TrainingService, PROYECCION_CAPACITACIONES
+from app.services.compliance_service import ComplianceService
+from app.schemas.schema_training import TrainingCreate, TrainingUpdate, TrainingResponse, ComplianceMatrixResponse
+from app.utils.pagination import with_next_cursor
+from app.utils.projection import respuesta_proyectada
 
 # Inicialización del router
 router = APIRouter()
 service = TrainingService()
+compliance_service = ComplianceService()
 
 # ----------------------------------------------------------------------
 # ENDPOINTS CRUD
@@ -42,18 +46,49 @@ def create_training_route(
     summary="Lista todas las capacitaciones o filtra por empleado"
 )
 def read_trainings_route(
+    response: Response,
     employee_id: Optional[int] = Query(None, description="Filtrar por ID del empleado"),
     skip: int = Query(0, description="Número de registros a omitir para paginación"),
     limit: int = Query(100, description="Límite de registros a devolver"),
+    after: Optional[str] = Query(None, description="Cursor opaco (`X-Next-Cursor` de la página anterior) para paginar por keyset."),
+    fields: Optional[str] = Query(None, description="Campos separados por coma para un listado compacto (solo esas columnas). Tiene prioridad sobre `vista`."),
+    vista: Literal["completa", "resumen"] = Query("completa", description="`resumen`: listado compacto con los campos más usados."),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene una lista de todos los registros de capacitación. Opcionalmente,
     permite filtrar la lista para obtener solo las capacitaciones de un empleado.
+    Sin filtro, admite paginación por cursor (`after` / header `X-Next-Cursor`).
+    Con `fields` o `vista=resumen` devuelve objetos planos con solo esos campos (más `id`).
     """
+    campos = PROYECCION_CAPACITACIONES.seleccion(fields, vista)
+    if campos is not None:
+        return respuesta_proyectada(service.get_trainings_proyectados(
+            db, campos, employee_id=employee_id, skip=skip, limit=limit, after=after
+        ))
     if employee_id is not None:
         return service.get_trainings_by_employee(db, employee_id=employee_id)
-    return service.get_all_trainings(db, skip=skip, limit=limit)
+    page = service.get_trainings_page(db, skip=skip, limit=limit, after=after)
+    return with_next_cursor(response, page)
+
+
+@router.get(
+    "/matriz-cumplimiento",
+    response_model=ComplianceMatrixResponse,
+    summary="Matriz de cumplimiento de capacitaciones por empleado"
+)
+def read_compliance_matrix_route(
+    sucursal_id: Optional[int] = Query(None, description="Filtrar por sucursal"),
+    rol_id: Optional[int] = Query(None, description="Filtrar por rol"),
+    puesto: Optional[str] = Query(None, description="Filtrar por puesto"),
+    db: Session = Depends(get_db)
+):
+    """
+    Empleados activos x capacitaciones (por nombre) con el estado de cada asignación
+    (completada, pendiente o vencida) y su fecha límite, en formato columnar disperso:
+    las combinaciones ausentes son capacitaciones no asignadas al empleado.
+    """
+    return compliance_service.get_matriz(db, sucursal_id=sucursal_id, rol_id=rol_id, puesto=puesto)
 
 
 @router.get(
@@ -20,6 +20,15 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base para los modelos declarativos
 Base = declarative_base()
 
+# Ejecuta `fn(db, *args, **kwargs)` con una sesión propia que se cierra al terminar:
+# tareas en segundo plano, fuera del ciclo de una petición (p. ej. con asyncio.to_thread)
+def con_sesion_propia(fn, *args, **kwargs):
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
 # Función de utilidad para obtener la sesión de DB
 def get_db():
     db = SessionLocal()
@@ -1,14 +1,50 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.base import api_router 
 from app.utils.config import settings 
+from app.utils.query_metrics import metricas, middleware_metricas_consultas
+from app.services.metric_snapshot_service import ejecutar_snapshots_periodicos
+from app.services.alert_service import ejecutar_barrido_alertas
+from app.services.expiry_service import ejecutar_programador_vencimientos
+from app.services.archive_service import ejecutar_archivo_periodico
+from app.services.change_feed_service import ejecutar_depuracion_cambios
+from app.services.job_service import ejecutar_workers_jobs
+from app.utils.event_hub import hub
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Arranca las tareas periódicas del servicio y las detiene al apagarlo."""
+    tareas = []
+    if settings.METRICS_SNAPSHOT_ENABLED:
+        tareas.append(asyncio.create_task(
+            ejecutar_snapshots_periodicos(settings.METRICS_SNAPSHOT_INTERVAL_MINUTES)
+        ))
+    if settings.ALERTS_SWEEP_ENABLED:
+        tareas.append(asyncio.create_task(ejecutar_barrido_alertas()))
+    if settings.EXPIRY_SCHEDULER_ENABLED:
+        tareas.append(asyncio.create_task(ejecutar_programador_vencimientos()))
+    if settings.ARCHIVE_ENABLED:
+        tareas.append(asyncio.create_task(ejecutar_archivo_periodico()))
+    if settings.CHANGE_LOG_ENABLED:
+        tareas.append(asyncio.create_task(ejecutar_depuracion_cambios()))
+    if settings.JOBS_ENABLED:
+        tareas.append(asyncio.create_task(ejecutar_workers_jobs()))
+    yield
+    hub.cerrar()
+    for tarea in tareas:
+        tarea.cancel()
+
 
 # 1. Inicialización de la aplicación FastAPI
 app = FastAPI(
     title="RH Service API",
     description="Microservicio para la gestión de Recursos Humanos (HR).",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 # 2. Configuración del Middleware CORS 
@@ -26,6 +62,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 3. Medición de consultas SQL por petición (headers X-DB-* en DEBUG, /metrics en producción)
+app.middleware("http")(middleware_metricas_consultas)
+
 # 4. Inclusión de las Rutas (Endpoints)
 # ✅ CORRECCIÓN: SIN prefijo /rh porque el gateway ya lo maneja
 app.include_router(
@@ -40,4 +79,9 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok", "service": "rh_service"}
\ No newline at end of file
+    return {"status": "ok", "service": "rh_service"}
+
+@app.get("/metrics")
+def read_metrics():
+    """Consultas SQL y tiempo de base de datos por endpoint, y duración de tareas internas."""
+    return metricas.snapshot()
@@ -7,4 +7,15 @@ from .payroll_period import  PayrollPeriod
 from .request import  Request
 from .shift import Shift
 from .training import  Training
+from .role import Role
+from .sucursal import Sucursal
+from .metric_snapshot import MetricSnapshot
+from .alert import Alert
+from .expiry_notification import ExpiryNotification
+from .shift_archive import ShiftArchive
+from .payment_detail_archive import PaymentDetailArchive
+from .pay_component_archive import PayComponentArchive
+from .change_log import ChangeLog
+from .change_log_secuencia import ChangeLogSecuencia
+from .job import Job
 from app.database import Base 
\ No newline at end of file
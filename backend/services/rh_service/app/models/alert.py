@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Index, UniqueConstraint, func
+from app.database import Base 
+
+class Alert(Base):
+    """
+    Alertas pendientes del dashboard, mantenidas de forma incremental.
+    Cada fila se actualiza cuando cambia la entidad que la origina (solicitud, turno,
+    documento, capacitación o período de nómina) y un barrido diario recalcula las
+    prioridades que dependen de la fecha.
+    """
+    __tablename__ = "alerts"
+    __table_args__ = (
+        # Una alerta como máximo por entidad de origen
+        UniqueConstraint("origen", "id_entidad", name="uq_alerts_origen_entidad"),
+        # Lectura ordenada por prioridad y fecha
+        Index("ix_alerts_prioridad_fecha", "prioridad_orden", "fecha_referencia"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    origen = Column(String(20), nullable=False)      # REQUEST, SHIFT, DOCUMENT, TRAINING, PAYROLL
+    id_entidad = Column(Integer, nullable=False)     # ID de la entidad que genera la alerta
+    descripcion = Column(String(255), nullable=False)
+    prioridad = Column(String(10), nullable=False)   # CRITICA, ALTA, MEDIA, BAJA
+    prioridad_orden = Column(Integer, nullable=False) # 3 = CRITICA ... 0 = BAJA (para ordenar en SQL)
+    fecha_referencia = Column(Date, nullable=False)
+    actualizado_en = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Alert(origen='{self.origen}', id_entidad={self.id_entidad}, prioridad='{self.prioridad}')>"
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from app.database import Base 
+
+class ChangeLog(Base):
+    """
+    Registro de cambios (outbox transaccional): una fila por alta, modificación o
+    baja de una entidad, escrita en la misma transacción que el cambio.
+
+    El `id` sigue el orden de inserción, no el de confirmación: una transacción
+    larga puede confirmar un id menor después de otros mayores. Por eso la posición
+    del feed `/changes` es `version`, que se asigna después del commit en orden de
+    confirmación (ver app/utils/change_log.py); NULL mientras no se asignó.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        # Depuración de registros antiguos
+        Index("ix_change_log_creado_en", "creado_en"),
+        # Lectura del feed y filas pendientes de secuenciar (version NULL)
+        Index("ix_change_log_version", "version", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entidad = Column(String(50), nullable=False)       # Nombre de la tabla (employees, shifts, ...)
+    id_entidad = Column(Integer, nullable=True)        # NULL: cambio masivo, recargar la entidad completa
+    operacion = Column(String(10), nullable=False)     # insert, update, delete, recarga
+    creado_en = Column(DateTime, nullable=False)
+    version = Column(Integer, nullable=True)           # Posición en el feed, en orden de confirmación
+
+    def __repr__(self):
+        return f"<ChangeLog(id={self.id}, version={self.version}, entidad='{self.entidad}', id_entidad={self.id_entidad}, operacion='{self.operacion}')>"
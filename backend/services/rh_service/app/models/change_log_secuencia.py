@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer
+from app.database import Base 
+
+class ChangeLogSecuencia(Base):
+    """
+    Contador de versiones del registro de cambios (una sola fila, id = 1). El
+    secuenciador la bloquea (FOR UPDATE) para asignar versiones de a un proceso a la vez.
+    """
+    __tablename__ = "change_log_secuencia"
+
+    id = Column(Integer, primary_key=True)
+    ultima_version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ChangeLogSecuencia(ultima_version={self.ultima_version})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, func, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, String, Date, Boolean, func, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 from app.database import Base # Importa la Base declarativa
 
@@ -10,6 +10,10 @@ class Employee(Base):
     Incluye las relaciones (mappings) con otras tablas del servicio (Horarios, Documentos, Pagos).
     """
     __tablename__ = "employees"
+    __table_args__ = (
+        # Búsqueda por texto en la base de datos (EMPLOYEE_SEARCH_BACKEND = "fulltext")
+        Index("ft_employees_busqueda", "nombre", "apellido", "email", "puesto", mysql_prefix="FULLTEXT"),
+    )
 
     # --- Campos Básicos y de Identificación ---
     id = Column(Integer, primary_key=True, index=True)
@@ -25,7 +29,7 @@ class Employee(Base):
     es_salario_fijo = Column(Boolean, default=False) 
     
     # --- Campos de Estado y Métricas para Dashboards ---
-    fecha_ingreso = Column(Date, nullable=False, default=func.curdate())
+    fecha_ingreso = Column(Date, nullable=False, default=func.current_date())
     is_active = Column(Boolean, default=True)  # Usado para el dashboard de Empleados Activos.
     desempeño_score = Column(Integer, default=50) # Usado para métricas de Cumplimiento/Desempeño.
     
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint, func
+from app.database import Base 
+
+class ExpiryNotification(Base):
+    """
+    Umbrales de vencimiento ya disparados (p. ej. 30, 7 y 0 días antes de que venza
+    un documento). Garantiza que cada umbral se informe una sola vez, aunque el
+    servicio se reinicie o corra en varios procesos.
+    """
+    __tablename__ = "expiry_notifications"
+    __table_args__ = (
+        # Un disparo por entidad, fecha de vencimiento y umbral
+        UniqueConstraint("origen", "id_entidad", "fecha_objetivo", "umbral",
+                         name="uq_expiry_notifications_disparo"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    origen = Column(String(20), nullable=False)      # DOCUMENT, TRAINING
+    id_entidad = Column(Integer, nullable=False)
+    fecha_objetivo = Column(Date, nullable=False)    # Vencimiento al que corresponde el umbral
+    umbral = Column(Integer, nullable=False)         # Días antes del vencimiento (negativo: después)
+    disparado_en = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ExpiryNotification(origen='{self.origen}', id_entidad={self.id_entidad}, umbral={self.umbral})>"
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index, func
+from app.database import Base 
+
+class Job(Base):
+    """
+    Trabajo en segundo plano (nómina, generación de turnos, exportación, archivo).
+    La tabla es la cola: sobrevive a reinicios y la comparten todos los procesos;
+    un worker toma un trabajo cambiando su estado de forma atómica.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Siguiente trabajo a ejecutar: pendientes por prioridad y antigüedad
+        Index("ix_jobs_estado_prioridad", "estado", "prioridad", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    tipo = Column(String(50), nullable=False)               # nomina, generar_turnos, exportar_nomina, ...
+    parametros = Column(Text, nullable=False)               # JSON validado al encolar
+    estado = Column(String(20), nullable=False, default="pendiente")  # pendiente, en_curso, completado, fallido, cancelado
+    prioridad = Column(Integer, nullable=False, default=0)  # Mayor primero
+    intentos = Column(Integer, nullable=False, default=0)
+    max_intentos = Column(Integer, nullable=False)
+    progreso = Column(Integer, nullable=False, default=0)   # 0 a 100
+    mensaje = Column(String(255), nullable=True)            # Paso en curso
+    resultado = Column(Text, nullable=True)                 # JSON devuelto por la tarea
+    error = Column(Text, nullable=True)
+    cancelacion_solicitada = Column(Boolean, nullable=False, default=False)
+    worker = Column(String(100), nullable=True)             # Proceso e hilo que lo ejecuta
+    disponible_desde = Column(DateTime, nullable=False)     # Reintentos: no antes de esta hora
+    latido_en = Column(DateTime, nullable=True)             # Sin latido reciente: el worker murió
+    creado_en = Column(DateTime, server_default=func.now())
+    iniciado_en = Column(DateTime, nullable=True)
+    terminado_en = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, tipo='{self.tipo}', estado='{self.estado}', progreso={self.progreso})>"
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Computed, Integer, Date, DateTime, ForeignKey, Index, UniqueConstraint, func
+from app.database import Base 
+
+class MetricSnapshot(Base):
+    """
+    Foto diaria de las métricas del dashboard (plantilla, cobertura de turnos,
+    capacitaciones y cumplimiento documental).
+    Una fila por día y sucursal; `sucursal_id` NULL es el total de la empresa.
+    Permite leer el resumen y sus tendencias sin recorrer las tablas actuales.
+    """
+    __tablename__ = "metric_snapshots"
+    __table_args__ = (
+        # Lectura del día y de la fecha de referencia para la tendencia
+        Index("ix_metric_snapshots_sucursal_fecha", "sucursal_id", "fecha"),
+        # Una sola foto por día y ámbito: la generación hace upsert sobre esta clave
+        UniqueConstraint("fecha", "ambito", name="uq_metric_snapshots_fecha_ambito"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    fecha = Column(Date, nullable=False)
+    sucursal_id = Column(Integer, ForeignKey('sucursal.id'), nullable=True)
+    # sucursal_id sin NULL (0 = total de la empresa), para la clave única
+    ambito = Column(Integer, Computed("coalesce(sucursal_id, 0)", persisted=True), nullable=False)
+
+    # --- Plantilla ---
+    total_employees = Column(Integer, nullable=False, default=0)
+    employees_added_month = Column(Integer, nullable=False, default=0)
+
+    # --- Cobertura de turnos del día ---
+    shifts_today = Column(Integer, nullable=False, default=0)
+    pending_shifts = Column(Integer, nullable=False, default=0)
+
+    # --- Capacitaciones ---
+    active_trainings = Column(Integer, nullable=False, default=0)
+    expiring_trainings = Column(Integer, nullable=False, default=0)
+
+    # --- Cumplimiento documental ---
+    total_documentos = Column(Integer, nullable=False, default=0)
+    documentos_aprobados = Column(Integer, nullable=False, default=0)
+    compliance_rate = Column(Integer, nullable=False, default=100)
+
+    actualizado_en = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<MetricSnapshot(fecha={self.fecha}, sucursal_id={self.sucursal_id})>"
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, Numeric, Index
+from app.database import Base 
+
+class PayComponentArchive(Base):
+    """
+    Componentes de los detalles de pago archivados (ver PaymentDetailArchive).
+    Mismas columnas y mismos IDs que PayComponent.
+    """
+    __tablename__ = "pay_components_archive"
+    __table_args__ = (
+        Index("ix_pay_components_archive_detail", "payment_detail_id"),
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    payment_detail_id = Column(Integer, nullable=False)
+    tipo = Column(String(50), nullable=False)
+    descripcion = Column(String(255))
+    monto = Column(Numeric(10, 2), nullable=False)
+
+    def __repr__(self):
+        return f"<PayComponentArchive(id={self.id}, tipo='{self.tipo}', monto={self.monto})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Numeric, ForeignKey, Date
+from sqlalchemy import Column, Integer, Numeric, ForeignKey, Date, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.database import Base 
 
@@ -9,6 +9,10 @@ class PaymentDetail(Base):
     Se adapta para manejar pagos por horas o salario fijo.
     """
     __tablename__ = "payment_details"
+    __table_args__ = (
+        # Un solo detalle por empleado y período (permite recalcular la nómina con upsert)
+        UniqueConstraint("employee_id", "period_id", name="uq_payment_details_employee_period"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False, doc="ID del empleado receptor del pago.")
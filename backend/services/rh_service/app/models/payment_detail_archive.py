@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, Numeric, DateTime, Index, func
+from app.database import Base 
+
+class PaymentDetailArchive(Base):
+    """
+    Detalles de pago de períodos finalizados y archivados (PayrollPeriod.archivado),
+    movidos desde 'payment_details'. Mismas columnas y mismos IDs que PaymentDetail.
+    """
+    __tablename__ = "payment_details_archive"
+    __table_args__ = (
+        Index("ix_payment_details_archive_period", "period_id"),
+        Index("ix_payment_details_archive_employee", "employee_id"),
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    employee_id = Column(Integer, nullable=False)
+    period_id = Column(Integer, nullable=False)
+    horas_totales_trabajadas = Column(Numeric(5, 2), nullable=True)
+    monto_base_calculado = Column(Numeric(10, 2), nullable=True)
+    total_descuentos = Column(Numeric(10, 2), default=0.00)
+    total_bonificaciones = Column(Numeric(10, 2), default=0.00)
+    monto_neto = Column(Numeric(10, 2), nullable=True)
+    archivado_en = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<PaymentDetailArchive(id={self.id}, period_id={self.period_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean
+from sqlalchemy import Column, Integer, String, Date, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.database import Base 
 
@@ -7,6 +7,10 @@ class PayrollPeriod(Base):
     Define un ciclo de pago. Crucial para la alerta de 'Planillas'.
     """
     __tablename__ = "payroll_periods"
+    __table_args__ = (
+        # Índice para la paginación por cursor (orden por fecha_inicio, id)
+        Index("ix_payroll_periods_fecha_inicio_id", "fecha_inicio", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     nombre_periodo = Column(String(100), nullable=False)
@@ -15,6 +19,7 @@ class PayrollPeriod(Base):
     fecha_corte_revision = Column(Date, nullable=False) # Fecha límite para revisar la planilla
     estado = Column(String(20), default="Pendiente de Revisión") # Para la alerta
     finalizado = Column(Boolean, default=False)
+    archivado = Column(Boolean, default=False) # Detalles de pago movidos a payment_details_archive
 
     # Relación a los detalles de pago de este período
     details = relationship("PaymentDetail", back_populates="period")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.database import Base 
 
@@ -8,12 +8,16 @@ class Request(Base):
     Soporta la alerta de 'Permisos Pendientes de Revisión'.
     """
     __tablename__ = "requests"
+    __table_args__ = (
+        # Índice para la paginación por cursor (orden por fecha_solicitud, id)
+        Index("ix_requests_fecha_solicitud_id", "fecha_solicitud", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
     tipo = Column(String(50), nullable=False) # Ej: 'Vacaciones', 'Permiso Médico', 'Reemplazo'
     motivo = Column(String(255))
-    fecha_solicitud = Column(Date, default=func.curdate())
+    fecha_solicitud = Column(Date, default=func.current_date())
     fecha_inicio = Column(Date, nullable=False)
     fecha_fin = Column(Date, nullable=False)
     estado = Column(String(20), default="Pendiente") # Ej: 'Pendiente', 'Aprobado', 'Rechazado'
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Time, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Time, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base 
 
@@ -8,6 +8,10 @@ class Shift(Base):
     Crucial para la alerta de 'Turnos sin cubrir'.
     """
     __tablename__ = "shifts"
+    __table_args__ = (
+        # Índice para detectar solapamientos: turnos de un empleado en una fecha
+        Index("ix_shifts_employee_fecha", "assigned_employee_id", "fecha"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     fecha = Column(Date, nullable=False)
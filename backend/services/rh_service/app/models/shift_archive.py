@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Date, Time, Boolean, DateTime, Index, func
+from app.database import Base 
+
+class ShiftArchive(Base):
+    """
+    Turnos de meses cerrados, movidos desde 'shifts' por el archivo histórico.
+    Mismas columnas (y mismos IDs) que Shift; solo se consulta cuando el rango de
+    fechas pedido llega a meses archivados. Sin claves foráneas: es de solo lectura.
+    """
+    __tablename__ = "shifts_archive"
+    __table_args__ = (
+        Index("ix_shifts_archive_fecha", "fecha"),
+        Index("ix_shifts_archive_employee_fecha", "assigned_employee_id", "fecha"),
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    fecha = Column(Date, nullable=False)
+    hora_inicio_real = Column(Time, nullable=False)
+    hora_fin_real = Column(Time, nullable=False)
+    puesto_requerido = Column(String(50))
+    assigned_employee_id = Column(Integer, nullable=True)
+    is_covered = Column(Boolean, default=False)
+    es_alteracion = Column(Boolean, default=False)
+    notas = Column(String(255))
+    archivado_en = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ShiftArchive(id={self.id}, fecha={self.fecha})>"
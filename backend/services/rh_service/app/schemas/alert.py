@@ -77,4 +77,26 @@ class ResumenStatsResponse(BaseModel):
     class Config:
         from_attributes = True
         # ✅ Permitir alias para compatibilidad (opcional)
-        populate_by_name = True
\ No newline at end of file
+        populate_by_name = True
+
+
+# --- ESQUEMAS PARA FOTOS DIARIAS DE MÉTRICAS ---
+
+class MetricSnapshotResponse(BaseModel):
+    """
+    Foto diaria de las métricas del dashboard. `sucursal_id` None es el total de la empresa.
+    """
+    fecha: date
+    sucursal_id: Optional[int] = None
+    total_employees: int
+    employees_added_month: int
+    shifts_today: int
+    pending_shifts: int
+    active_trainings: int
+    expiring_trainings: int
+    total_documentos: int
+    documentos_aprobados: int
+    compliance_rate: int
+
+    class Config:
+        from_attributes = True
@@ -69,6 +69,7 @@ class PayrollPeriodResponse(BaseModel):
     fecha_corte_revision: date
     estado: str
     finalizado: bool
+    archivado: bool = False
     
     # Configuración para permitir el mapeo de atributos de la DB (ORM mode)
     model_config = {
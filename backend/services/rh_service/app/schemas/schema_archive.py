@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from datetime import date
+
+
+# --------------------------------------------------------------------
+# ArchiveRunResponse (Schema de Salida: ejecución del archivo histórico)
+# --------------------------------------------------------------------
+class ArchiveRunResponse(BaseModel):
+    """
+    Resultado de mover a las tablas de archivo los turnos y pagos de meses cerrados.
+    """
+    corte: date = Field(..., description="Se archivó lo anterior a esta fecha (primer día del mes más antiguo conservado).")
+    turnos: int = Field(..., description="Turnos movidos a shifts_archive.")
+    periodos: int = Field(..., description="Períodos finalizados cuyos pagos se archivaron.")
+    detalles: int = Field(..., description="Detalles de pago movidos a payment_details_archive.")
+    componentes: int = Field(..., description="Componentes movidos a pay_components_archive.")
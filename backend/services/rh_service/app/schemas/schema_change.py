@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+
+
+# --------------------------------------------------------------------
+# 1. CambioResponse (Schema de Salida: un registro del feed)
+# --------------------------------------------------------------------
+class CambioResponse(BaseModel):
+    """
+    Alta, modificación o baja de una entidad. `operacion = recarga` (sin
+    `id_entidad`) indica un cambio masivo: volver a leer la entidad completa.
+    """
+    version: int = Field(..., description="Posición del cambio en el feed (creciente).")
+    entidad: str = Field(..., description="Tabla modificada (employees, shifts, documents, ...).")
+    id_entidad: Optional[int]
+    operacion: str = Field(..., description="insert, update, delete o recarga.")
+    fecha: datetime
+
+
+# --------------------------------------------------------------------
+# 2. ChangeFeedResponse (Schema de Salida: GET /changes)
+# --------------------------------------------------------------------
+class ChangeFeedResponse(BaseModel):
+    """
+    Cambios posteriores al token recibido, en orden, y el token para la próxima llamada.
+    """
+    cambios: List[CambioResponse]
+    token: str = Field(..., description="Enviar como `since` en la próxima llamada.")
+    hay_mas: bool = Field(..., description="True si quedan cambios: volver a llamar de inmediato.")
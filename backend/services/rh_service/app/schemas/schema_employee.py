@@ -1,12 +1,17 @@
 from pydantic import BaseModel, Field, EmailStr
 from datetime import date
 from decimal import Decimal 
-from typing import Optional
+from typing import Dict, List, Optional
 
 # Importar los schemas de respuesta de Rol y Sucursal para la serialización de salida
 # Asegúrate de que las rutas de importación sean correctas
 from app.schemas.schema_role import RoleResponse 
 from app.schemas.schema_sucursal import SucursalResponse 
+from app.schemas.schema_document import DocumentResponse
+from app.schemas.schema_training import TrainingResponse
+from app.schemas.schema_shift import ShiftResponse
+from app.schemas.request import RequestResponse
+from app.schemas.schema_payment_detail import PaymentDetailResponse
 
 # --------------------------------------------------------------------
 # 1. EmployeeCreate (Schema de Entrada: POST/Creación)
@@ -86,3 +91,40 @@ class EmployeeResponse(BaseModel):
     model_config = {
         "from_attributes": True
     }
+
+
+# --------------------------------------------------------------------
+# 4. EmployeeSearchResult (Schema de Salida: búsqueda de empleados)
+# --------------------------------------------------------------------
+class EmployeeSearchResult(BaseModel):
+    """
+    Empleado encontrado por la búsqueda, con las columnas necesarias para listarlo.
+    """
+    id: int
+    nombre: str
+    apellido: str
+    email: str
+    puesto: str
+    sucursal_id: int | None
+    rol_id: int
+    is_active: bool
+    score: float = Field(..., description="Relevancia: mayor es mejor.")
+
+
+# --------------------------------------------------------------------
+# 5. EmployeeProfileResponse (Schema de Salida: perfil completo)
+# --------------------------------------------------------------------
+class EmployeeProfileResponse(BaseModel):
+    """
+    Empleado con sus documentos, capacitaciones, turnos, solicitudes y pagos en una
+    sola respuesta. Las secciones no pedidas se devuelven como null.
+    """
+    empleado: EmployeeResponse
+    documentos: List[DocumentResponse] | None = None
+    capacitaciones: List[TrainingResponse] | None = None
+    turnos: List[ShiftResponse] | None = None
+    solicitudes: List[RequestResponse] | None = None
+    pagos: List[PaymentDetailResponse] | None = None
+    totales: Dict[str, int] = Field(..., description="Registros de cada sección (dentro de la ventana de fechas) antes de aplicar el límite.")
+    desde: date = Field(..., description="Inicio de la ventana aplicada a turnos y solicitudes.")
+    hasta: date = Field(..., description="Fin de la ventana aplicada a turnos y solicitudes.")
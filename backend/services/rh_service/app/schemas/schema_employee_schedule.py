@@ -1,7 +1,8 @@
 # rh_service/app/schemas/employee_schedule.py
 
 from pydantic import BaseModel, Field
-from datetime import time
+from datetime import date, time
+from typing import List
 
 # --------------------------------------------------------------------
 # 1. EmployeeScheduleCreate (Schema de Entrada: POST/Creación)
@@ -56,3 +57,26 @@ class EmployeeScheduleResponse(BaseModel):
     model_config = {
         "from_attributes": True 
     }
+
+
+# --------------------------------------------------------------------
+# 4. Generación de turnos a partir de los patrones
+# --------------------------------------------------------------------
+class ShiftGenerationRequest(BaseModel):
+    """
+    Rango de fechas (inclusive) en el que se expanden los patrones vigentes a turnos.
+    """
+    fecha_inicio: date
+    fecha_fin: date
+    employee_ids: List[int] | None = Field(None, description="Limitar a estos empleados (todos si se omite).")
+
+
+class ShiftGenerationResponse(BaseModel):
+    """
+    Resumen de la generación de turnos.
+    """
+    creados: int = Field(..., description="Turnos nuevos insertados.")
+    ya_existentes: int = Field(..., description="Turnos que ya coincidían con su patrón (no se duplican).")
+    alteraciones_marcadas: int = Field(..., description="Turnos existentes cuyo indicador es_alteracion cambió.")
+    patrones_omitidos: int = Field(..., description="Patrones que cruzan la medianoche y no se pueden expresar como un turno.")
+    patrones_solapados: int = Field(0, description="Turnos de patrón no creados por solaparse con otro patrón del mismo empleado y día.")
@@ -0,0 +1,67 @@
+from pydantic import BaseModel, Field, Json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+# --------------------------------------------------------------------
+# 1. JobCreate (Schema de Entrada: POST /jobs)
+# --------------------------------------------------------------------
+class JobCreate(BaseModel):
+    """
+    Trabajo a encolar. Los `parametros` se validan con el schema de la tarea.
+    """
+    tipo: str = Field(..., description="nomina, conciliar_nomina, exportar_nomina, generar_turnos o archivo.")
+    parametros: Dict[str, Any] = Field(default_factory=dict)
+    prioridad: int = Field(0, ge=-10, le=10, description="Mayor se ejecuta primero.")
+
+
+# --------------------------------------------------------------------
+# 2. JobResponse (Schema de Salida: estado de un trabajo)
+# --------------------------------------------------------------------
+class JobResponse(BaseModel):
+    """
+    Estado, avance y resultado de un trabajo en segundo plano.
+    """
+    id: int
+    tipo: str
+    parametros: Json[Any]
+    estado: str = Field(..., description="pendiente, en_curso, completado, fallido o cancelado.")
+    prioridad: int
+    intentos: int
+    max_intentos: int
+    progreso: int = Field(..., description="Porcentaje de avance (0 a 100).")
+    mensaje: Optional[str]
+    resultado: Optional[Json[Any]]
+    error: Optional[str]
+    cancelacion_solicitada: bool
+    creado_en: Optional[datetime]
+    iniciado_en: Optional[datetime]
+    terminado_en: Optional[datetime]
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+# --------------------------------------------------------------------
+# 3. Parámetros de las tareas
+# --------------------------------------------------------------------
+class PeriodoJobParams(BaseModel):
+    """Parámetros de las tareas de nómina (cálculo)."""
+    period_id: int
+
+
+class ConciliarJobParams(BaseModel):
+    """Parámetros de la conciliación de totales de un período."""
+    period_id: int
+    reparar: bool = True
+
+
+class ExportarJobParams(BaseModel):
+    """Parámetros de la exportación de un período a archivo."""
+    period_id: int
+    formato: str = Field("csv", pattern="^(csv|ndjson)$")
+
+
+class SinParametros(BaseModel):
+    """Tareas que no reciben parámetros (archivo histórico)."""
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from decimal import Decimal
+from typing import List
 
 # --------------------------------------------------------------------
 # 1. PaymentDetailCreate (Esquema de Entrada: POST/Creación/Cálculo)
@@ -8,6 +9,8 @@ class PaymentDetailCreate(BaseModel):
     """
     Schema para registrar el resumen de pago de un empleado en un período de nómina.
     Utiliza los campos del cálculo de nómina adaptados para horas o salario fijo.
+    Bonificaciones, descuentos y monto neto no se reciben: salen de los componentes
+    de pago (un detalle nuevo empieza en 0) y se ignoran si se envían.
     """
     # Claves Foráneas
     employee_id: int = Field(..., description="ID del empleado receptor del pago.")
@@ -20,28 +23,18 @@ class PaymentDetailCreate(BaseModel):
     # Monto base calculado (requerido para ambos tipos de pago).
     monto_base_calculado: Decimal = Field(..., decimal_places=2, description="Monto base (salario fijo o horas*tarifa) antes de ajustes.")
     
-    # --- Ajustes y Totales ---
-    
-    total_descuentos: Decimal = Field(default=Decimal(0.00), decimal_places=2, description="Suma total de deducciones aplicadas.")
-    total_bonificaciones: Decimal = Field(default=Decimal(0.00), decimal_places=2, description="Suma total de bonos y pagos extra.")
-    
-    # Monto final, es opcional/None al crear ya que se calcula en el servicio.
-    monto_neto: Decimal | None = Field(None, decimal_places=2, description="Monto final (neto) a pagar al empleado.")
-    
 # --------------------------------------------------------------------
 # 2. PaymentDetailUpdate (Esquema de Entrada: PATCH/Actualización)
 # --------------------------------------------------------------------
 class PaymentDetailUpdate(BaseModel):
     """
     Schema para actualizar el detalle de pago. Todos los campos son opcionales.
+    Los totales y el monto neto no se reciben (ver PaymentDetailCreate).
     """
     employee_id: int | None = None
     period_id: int | None = None
     horas_totales_trabajadas: Decimal | None = Field(None, decimal_places=2)
     monto_base_calculado: Decimal | None = Field(None, decimal_places=2)
-    total_descuentos: Decimal | None = Field(None, decimal_places=2)
-    total_bonificaciones: Decimal | None = Field(None, decimal_places=2)
-    monto_neto: Decimal | None = Field(None, decimal_places=2) # Se puede anular o se recalcula
 
 # --------------------------------------------------------------------
 # 3. PaymentDetailResponse (Esquema de Salida: GET/Lectura)
@@ -66,3 +59,41 @@ class PaymentDetailResponse(BaseModel):
     model_config = {
         "from_attributes": True # Permite el mapeo desde el objeto ORM
     }
+
+
+# --------------------------------------------------------------------
+# 4. PayrollRunResponse (Schema de Salida: cálculo de nómina de un período)
+# --------------------------------------------------------------------
+class PayrollRunResponse(BaseModel):
+    """
+    Resumen del cálculo de nómina de un período completo.
+    """
+    period_id: int
+    empleados: int = Field(..., description="Detalles de pago creados o recalculados.")
+    monto_base_total: Decimal
+    monto_neto_total: Decimal
+
+
+# --------------------------------------------------------------------
+# 5. ReconciliationResponse (Schema de Salida: conciliación de totales)
+# --------------------------------------------------------------------
+class TotalesCorregidos(BaseModel):
+    """
+    Detalle cuyos totales no coincidían con la suma de sus componentes.
+    """
+    detail_id: int
+    total_bonificaciones_anterior: Decimal | None
+    total_descuentos_anterior: Decimal | None
+    total_bonificaciones: Decimal
+    total_descuentos: Decimal
+    monto_neto: Decimal
+
+
+class ReconciliationResponse(BaseModel):
+    """
+    Resultado de verificar (y opcionalmente reparar) los totales de un período.
+    """
+    period_id: int
+    revisados: int
+    reparado: bool = Field(..., description="True si se guardaron las correcciones.")
+    corregidos: List[TotalesCorregidos]
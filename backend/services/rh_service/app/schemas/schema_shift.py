@@ -1,6 +1,7 @@
 # rh_service/app/schemas/shift.py
 
 from datetime import date, time
+from typing import List
 from pydantic import BaseModel, Field
 
 # -------------------------------------------------------------------- 
@@ -79,3 +80,52 @@ class ShiftResponse(BaseModel):
     model_config = {
         "from_attributes": True
     }
+
+
+# -------------------------------------------------------------------- 
+# 5. ShiftCandidateResponse (Schema de Salida: candidatos para cubrir un turno)
+# --------------------------------------------------------------------
+
+class ShiftCandidateResponse(BaseModel):
+    """
+    Empleado disponible para cubrir un turno, en el orden de recomendación.
+    """
+    employee_id: int
+    nombre: str
+    apellido: str
+    puesto: str
+    sucursal_id: int | None
+    turnos_semana: int = Field(..., description="Turnos ya asignados al empleado en la semana del turno.")
+    desempeño_score: int | None
+
+
+# -------------------------------------------------------------------- 
+# 6. Validación por lote de asignaciones
+# --------------------------------------------------------------------
+
+class ShiftAssignmentCheck(BaseModel):
+    """
+    Asignación propuesta (nueva o reasignación de un turno existente) a validar en lote.
+    """
+    shift_id: int | None = Field(None, description="ID del turno existente que se reasigna (NULL si es un turno nuevo).")
+    assigned_employee_id: int = Field(..., description="ID del empleado propuesto.")
+    fecha: date
+    hora_inicio_real: time
+    hora_fin_real: time
+
+
+class ShiftConflictResponse(BaseModel):
+    """
+    Conflicto detectado: la asignación `indice` del lote se solapa con un turno
+    existente (`shift_id_existente`) o con otra asignación del lote (`indice_en_lote`).
+    """
+    indice: int
+    employee_id: int
+    fecha: date
+    shift_id_existente: int | None = None
+    indice_en_lote: int | None = None
+
+
+class ShiftBatchValidationResponse(BaseModel):
+    valido: bool
+    conflictos: List[ShiftConflictResponse]
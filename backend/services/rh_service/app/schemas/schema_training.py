@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Dict, List
 from pydantic import BaseModel, Field
 
 # -------------------------------------------------------------------- 
@@ -69,3 +70,42 @@ class TrainingResponse(BaseModel):
     model_config = {
         "from_attributes": True
     }
+
+
+# -------------------------------------------------------------------- 
+# 4. ComplianceMatrixResponse (Schema de Salida: matriz de cumplimiento)
+# --------------------------------------------------------------------
+
+class EmpleadosMatriz(BaseModel):
+    """
+    Filas de la matriz en formato columnar: el empleado i es (id[i], nombre[i], ...).
+    """
+    id: List[int]
+    nombre: List[str]
+    apellido: List[str]
+    puesto: List[str]
+    sucursal_id: List[int | None]
+    rol_id: List[int]
+
+
+class CeldasMatriz(BaseModel):
+    """
+    Celdas con capacitación asignada (matriz dispersa en coordenadas): la celda k
+    está en la fila `fila[k]` y la columna `columna[k]`. Una combinación ausente
+    significa que la capacitación no está asignada a ese empleado.
+    """
+    fila: List[int]
+    columna: List[int]
+    estado: List[str] = Field(..., description="C = completada, P = pendiente, V = vencida.")
+    fecha_limite: List[date | None] = Field(..., description="Fecha límite de la asignación pendiente más próxima.")
+
+
+class ComplianceMatrixResponse(BaseModel):
+    """
+    Matriz empleados x capacitaciones (por nombre) con el estado de cada asignación.
+    """
+    fecha: date = Field(..., description="Fecha con la que se calculó el estado vencido.")
+    capacitaciones: List[str] = Field(..., description="Columnas: nombres de capacitación.")
+    empleados: EmpleadosMatriz
+    celdas: CeldasMatriz
+    totales: Dict[str, int] = Field(..., description="Número de celdas por estado.")
@@ -0,0 +1,406 @@
+# rh_service/app/services/alert_service.py
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, con_sesion_propia
+from app.models.alert import Alert
+from app.models.document import Document
+from app.models.payroll_period import PayrollPeriod
+from app.models.request import Request
+from app.models.shift import Shift
+from app.models.training import Training
+from app.schemas.alert import AlertaResponse, OrigenAlerta, PrioridadAlerta
+from app.services.document_service import DocumentService
+from app.services.payroll_period_service import PayrollPeriodService
+from app.services.request_service import RequestService
+from app.services.shift_service import ShiftService
+from app.services.training_service import TrainingService
+from app.utils.change_events import DELETE, UPDATE, Cambio, al_cambiar, ejecutar_core
+from app.utils.config import settings
+from app.utils.event_hub import encolar_evento
+from app.utils.pagination import Pagina, paginate
+from app.utils.query_metrics import medir_duracion
+
+logger = logging.getLogger(__name__)
+
+# Orden de prioridad para ordenar en SQL (columna prioridad_orden)
+PRIORIDAD_ORDEN = {'CRITICA': 3, 'ALTA': 2, 'MEDIA': 1, 'BAJA': 0}
+
+# Ventanas de cada fuente de alertas
+DIAS_TURNOS_SIN_CUBRIR = 7
+DIAS_VENCIMIENTO_DOCUMENTO = 30
+DIAS_VENCIMIENTO_CAPACITACION = 60
+# Días restantes desde los que la alerta pasa a prioridad ALTA
+DIAS_DOCUMENTO_URGENTE = 7
+DIAS_CAPACITACION_URGENTE = 15
+
+# Días antes del vencimiento en los que cambia la alerta de documentos y capacitaciones
+# (entra en la ventana, pasa a ALTA, pasa a CRITICA). Negativo: días después.
+# Los dispara el programador de vencimientos (app/services/expiry_service.py).
+UMBRALES_VENCIMIENTO = {
+    OrigenAlerta.DOCUMENT: (DIAS_VENCIMIENTO_DOCUMENTO, DIAS_DOCUMENTO_URGENTE, 0),
+    OrigenAlerta.TRAINING: (DIAS_VENCIMIENTO_CAPACITACION, DIAS_CAPACITACION_URGENTE, -1),
+}
+
+
+# ----------------------------------------------------
+# Reglas: entidad -> alerta (o None si no corresponde alerta)
+# ----------------------------------------------------
+
+def regla_request(req: Request, today: date) -> Optional[AlertaResponse]:
+    """Solicitudes pendientes de aprobación; la prioridad depende de cuándo inician."""
+    if req.estado != "Pendiente":
+        return None
+
+    if req.fecha_inicio and isinstance(req.fecha_inicio, date):
+        urgencia_dias = (req.fecha_inicio - today).days
+    else:
+        urgencia_dias = 999
+
+    if urgencia_dias < 7:
+        prioridad = 'CRITICA'
+    elif urgencia_dias < 30:
+        prioridad = 'ALTA'
+    else:
+        prioridad = 'MEDIA'
+
+    return AlertaResponse(
+        id_entidad=req.id,
+        origen=OrigenAlerta.REQUEST,
+        descripcion=f"Solicitud de {req.tipo} (Inicia: {req.fecha_inicio}) pendiente de aprobación.",
+        prioridad=prioridad,
+        fecha_referencia=req.fecha_solicitud or today
+    )
+
+
+def regla_shift(shift: Shift, today: date) -> Optional[AlertaResponse]:
+    """Turnos sin cubrir dentro de los próximos 7 días."""
+    if shift.is_covered or not (today <= shift.fecha <= today + timedelta(days=DIAS_TURNOS_SIN_CUBRIR)):
+        return None
+
+    dias_hasta_turno = (shift.fecha - today).days
+    prioridad = 'CRITICA' if dias_hasta_turno <= 3 else 'ALTA'
+
+    return AlertaResponse(
+        id_entidad=shift.id,
+        origen=OrigenAlerta.SHIFT,
+        descripcion=f"Turno de {shift.puesto_requerido} sin cubrir para el {shift.fecha.strftime('%d/%m')}.",
+        prioridad=prioridad,
+        fecha_referencia=shift.fecha
+    )
+
+
+def regla_document(doc: Document, today: date) -> Optional[AlertaResponse]:
+    """Documentos pendientes de aprobación o vencidos / por vencer en 30 días."""
+    por_vencer = doc.fecha_vencimiento and doc.fecha_vencimiento <= today + timedelta(days=DIAS_VENCIMIENTO_DOCUMENTO)
+    if not por_vencer and doc.aprobado_admin:
+        return None
+
+    prioridad = 'MEDIA'
+    descripcion = f"Documento '{doc.tipo}' requiere atención."
+    fecha_ref = doc.fecha_vencimiento if doc.fecha_vencimiento else today
+
+    if not doc.aprobado_admin:
+        prioridad = 'ALTA'
+        descripcion = f"Documento '{doc.tipo}' pendiente de APROBACIÓN administrativa."
+
+    if doc.fecha_vencimiento and doc.fecha_vencimiento <= today:
+        prioridad = 'CRITICA'
+        descripcion = f"Documento '{doc.tipo}' HA EXPIRADO el {doc.fecha_vencimiento.strftime('%d/%m/%Y')}."
+        fecha_ref = doc.fecha_vencimiento
+
+    elif doc.fecha_vencimiento and (doc.fecha_vencimiento - today).days <= DIAS_DOCUMENTO_URGENTE:
+        prioridad = 'ALTA'
+        descripcion = f"Documento '{doc.tipo}' vence el {doc.fecha_vencimiento.strftime('%d/%m/%Y')}."
+        fecha_ref = doc.fecha_vencimiento
+
+    return AlertaResponse(
+        id_entidad=doc.id,
+        origen=OrigenAlerta.DOCUMENT,
+        descripcion=descripcion,
+        prioridad=prioridad,
+        fecha_referencia=fecha_ref
+    )
+
+
+def regla_training(trn: Training, today: date) -> Optional[AlertaResponse]:
+    """Capacitaciones no completadas vencidas o que vencen en 60 días."""
+    if trn.completado or not trn.fecha_limite \
+            or trn.fecha_limite > today + timedelta(days=DIAS_VENCIMIENTO_CAPACITACION):
+        return None
+
+    dias_restantes = (trn.fecha_limite - today).days
+
+    if dias_restantes < 0:
+        prioridad = 'CRITICA'
+        descripcion = f"Capacitación '{trn.nombre_capacitacion}' VENCIDA el {trn.fecha_limite.strftime('%d/%m/%Y')}."
+    elif dias_restantes <= DIAS_CAPACITACION_URGENTE:
+        prioridad = 'ALTA'
+        descripcion = f"Capacitación '{trn.nombre_capacitacion}' vence el {trn.fecha_limite.strftime('%d/%m/%Y')}."
+    else:
+        prioridad = 'MEDIA'
+        descripcion = f"Capacitación '{trn.nombre_capacitacion}' pendiente (Límite: {trn.fecha_limite.strftime('%d/%m')})."
+
+    return AlertaResponse(
+        id_entidad=trn.id,
+        origen=OrigenAlerta.TRAINING,
+        descripcion=descripcion,
+        prioridad=prioridad,
+        fecha_referencia=trn.fecha_limite
+    )
+
+
+def regla_payroll(proximo_periodo, today: date) -> Optional[AlertaResponse]:
+    """Próximo corte de nómina (solo el período activo más cercano genera alerta)."""
+    if proximo_periodo is None:
+        return None
+
+    fecha_corte = proximo_periodo.fecha_corte_revision
+    dias_restantes = (fecha_corte - today).days
+
+    if dias_restantes <= 0:
+        prioridad = 'CRITICA'
+        descripcion = f"Corte de Nómina '{proximo_periodo.nombre_periodo}' VENCIDO. Acción urgente requerida."
+    elif dias_restantes <= 5:
+        prioridad = 'ALTA'
+        descripcion = f"Corte de Nómina '{proximo_periodo.nombre_periodo}' en {dias_restantes} días (Fecha: {fecha_corte.strftime('%d/%m')})."
+    else:
+        prioridad = 'MEDIA'
+        descripcion = f"Corte de Nómina '{proximo_periodo.nombre_periodo}' próximo. Revisar horas y componentes."
+
+    return AlertaResponse(
+        id_entidad=proximo_periodo.id,
+        origen=OrigenAlerta.PAYROLL,
+        descripcion=descripcion,
+        prioridad=prioridad,
+        fecha_referencia=fecha_corte
+    )
+
+
+def _fila(alerta: AlertaResponse) -> dict:
+    """Convierte una alerta en una fila de la tabla alerts."""
+    return {
+        **alerta.model_dump(mode="python"),
+        "origen": alerta.origen.value,
+        "prioridad": alerta.prioridad.value,
+        "prioridad_orden": PRIORIDAD_ORDEN[alerta.prioridad.value],
+    }
+
+
+# ----------------------------------------------------
+# Mantenimiento incremental (dentro de la transacción que modifica la entidad)
+# ----------------------------------------------------
+
+def _encolar_alerta(session: Session, origen: OrigenAlerta, id_entidad: int, fila: Optional[dict]) -> None:
+    """Evento `alerta` para los clientes conectados: la alerta vigente o su eliminación."""
+    encolar_evento(session, "alerta", {
+        "origen": origen.value,
+        "id_entidad": id_entidad,
+        "accion": "actualizada" if fila else "eliminada",
+        "alerta": fila,
+    })
+
+
+def _sincronizar(session: Session, origen: OrigenAlerta, cambios: List[Cambio],
+                 regla: Callable[[object, date], Optional[AlertaResponse]]) -> None:
+    """
+    Reemplaza las alertas de las entidades modificadas por el resultado de su regla.
+    Solo se publica el evento `alerta` de las entidades que tenían o tienen alerta.
+    """
+    today = date.today()
+    tabla = Alert.__table__
+    ids = [c.instancia.id for c in cambios]
+    previas = set(session.connection().scalars(
+        select(tabla.c.id_entidad).where(tabla.c.origen == origen.value, tabla.c.id_entidad.in_(ids))
+    ))
+    if previas:
+        ejecutar_core(session, delete(tabla).where(tabla.c.origen == origen.value, tabla.c.id_entidad.in_(previas)))
+    filas = {}
+    for c in cambios:
+        alerta = regla(c.instancia, today) if c.operacion != DELETE else None
+        filas[c.instancia.id] = _fila(alerta) if alerta else None
+    if any(filas.values()):
+        ejecutar_core(session, insert(tabla), [f for f in filas.values() if f])
+    for id_entidad, fila in filas.items():
+        if fila or id_entidad in previas:
+            _encolar_alerta(session, origen, id_entidad, fila)
+
+
+def reevaluar_alertas(session: Session, origen: OrigenAlerta, instancias: Sequence[object]) -> None:
+    """Vuelve a aplicar la regla del origen a las entidades (p. ej. al cruzar un umbral de fecha)."""
+    _sincronizar(session, origen, [Cambio(i, UPDATE) for i in instancias], FUENTES[origen][0])
+
+
+@al_cambiar(Request)
+def _al_cambiar_solicitudes(session: Session, cambios: List[Cambio]) -> None:
+    _sincronizar(session, OrigenAlerta.REQUEST, cambios, regla_request)
+
+
+@al_cambiar(Shift)
+def _al_cambiar_turnos(session: Session, cambios: List[Cambio]) -> None:
+    _sincronizar(session, OrigenAlerta.SHIFT, cambios, regla_shift)
+
+
+@al_cambiar(Document)
+def _al_cambiar_documentos(session: Session, cambios: List[Cambio]) -> None:
+    _sincronizar(session, OrigenAlerta.DOCUMENT, cambios, regla_document)
+
+
+@al_cambiar(Training)
+def _al_cambiar_capacitaciones(session: Session, cambios: List[Cambio]) -> None:
+    _sincronizar(session, OrigenAlerta.TRAINING, cambios, regla_training)
+
+
+@al_cambiar(PayrollPeriod)
+def _al_cambiar_periodos(session: Session, cambios: List[Cambio]) -> None:
+    # La alerta de nómina depende de cuál es el próximo corte entre TODOS los
+    # períodos activos: se recalcula la única alerta PAYROLL.
+    today = date.today()
+    proximo = session.connection().execute(
+        select(PayrollPeriod.id, PayrollPeriod.nombre_periodo, PayrollPeriod.fecha_corte_revision)
+        .where(PayrollPeriod.finalizado == False, PayrollPeriod.fecha_corte_revision >= today)
+        .order_by(PayrollPeriod.fecha_corte_revision.asc())
+        .limit(1)
+    ).first()
+    ejecutar_core(session, delete(Alert.__table__).where(Alert.__table__.c.origen == OrigenAlerta.PAYROLL.value))
+    alerta = regla_payroll(proximo, today)
+    if alerta:
+        ejecutar_core(session, insert(Alert.__table__), [_fila(alerta)])
+    _encolar_alerta(session, OrigenAlerta.PAYROLL, alerta.id_entidad if alerta else None,
+                    _fila(alerta) if alerta else None)
+
+
+# Fuentes de alertas: cómo obtener las entidades candidatas y qué regla aplicarles
+FUENTES = {
+    OrigenAlerta.REQUEST: (
+        regla_request,
+        lambda db: RequestService().get_pending_requests(db=db)),
+    OrigenAlerta.SHIFT: (
+        regla_shift,
+        lambda db: ShiftService().get_uncovered_shifts_in_future(db=db, days_ahead=DIAS_TURNOS_SIN_CUBRIR)),
+    OrigenAlerta.DOCUMENT: (
+        regla_document,
+        lambda db: DocumentService().get_compliance_alerts(db=db, expiration_days_threshold=DIAS_VENCIMIENTO_DOCUMENTO)),
+    OrigenAlerta.TRAINING: (
+        regla_training,
+        lambda db: TrainingService().get_pending_or_expired_trainings(db=db, expiration_days_threshold=DIAS_VENCIMIENTO_CAPACITACION)),
+    OrigenAlerta.PAYROLL: (
+        regla_payroll,
+        lambda db: [PayrollPeriodService().get_next_closure_period(db=db)]),
+}
+
+
+class AlertService:
+    """
+    Lectura y recálculo completo de la tabla de alertas.
+    """
+
+    def get_alertas_page(
+        self, db: Session,
+        origenes: Optional[Sequence[OrigenAlerta]] = None,
+        prioridades: Optional[Sequence[PrioridadAlerta]] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+        skip: int = 0, limit: int = 100, after: Optional[str] = None,
+    ) -> Pagina:
+        """
+        Alertas pendientes ordenadas por prioridad y fecha, con filtros por origen,
+        prioridad y ventana de fecha de referencia aplicados en SQL. La página se
+        obtiene con el índice (prioridad_orden, fecha_referencia), por offset o cursor.
+        """
+        query = db.query(Alert)
+        if origenes:
+            query = query.filter(Alert.origen.in_([o.value for o in origenes]))
+        if prioridades:
+            query = query.filter(Alert.prioridad.in_([p.value for p in prioridades]))
+        if fecha_desde:
+            query = query.filter(Alert.fecha_referencia >= fecha_desde)
+        if fecha_hasta:
+            query = query.filter(Alert.fecha_referencia <= fecha_hasta)
+        return paginate(query, keys=(Alert.prioridad_orden, Alert.fecha_referencia, Alert.id),
+                        skip=skip, limit=limit, after=after, descending=True)
+
+    def _evaluar_fuente(self, origen: OrigenAlerta) -> List[AlertaResponse]:
+        """
+        Evalúa una fuente con su propia sesión (se ejecuta en un hilo del pool) y
+        devuelve sus alertas. La duración queda en /metrics.
+        """
+        regla, cargar = FUENTES[origen]
+        today = date.today()
+        with medir_duracion(f"alertas.{origen.value}"):
+            db = SessionLocal()
+            try:
+                alertas = [a for a in (regla(e, today) for e in cargar(db)) if a]
+            finally:
+                db.close()
+        return alertas
+
+    def generar_alertas(self, origenes: Optional[Sequence[OrigenAlerta]] = None) -> List[AlertaResponse]:
+        """
+        Evalúa las fuentes de forma concurrente (una sesión por fuente) y concatena sus
+        alertas. No se ordenan aquí: la lectura (get_alertas_page) ordena y pagina en
+        SQL con el índice (prioridad_orden, fecha_referencia).
+        """
+        origenes = list(origenes or FUENTES)
+        with ThreadPoolExecutor(max_workers=len(origenes), thread_name_prefix="alertas") as pool:
+            listas = list(pool.map(self._evaluar_fuente, origenes))
+        return [alerta for lista in listas for alerta in lista]
+
+    def recalcular_alertas(self, db: Session, origenes: Optional[Sequence[OrigenAlerta]] = None) -> int:
+        """
+        Reconstruye las alertas de los orígenes indicados (todos por defecto). Lo
+        ejecuta el barrido diario, ya que las prioridades dependen de la fecha actual.
+        Devuelve el número de alertas recalculadas.
+        """
+        origenes = list(origenes or FUENTES)
+        filas = [_fila(a) for a in self.generar_alertas(origenes)]
+        try:
+            db.execute(delete(Alert.__table__).where(
+                Alert.__table__.c.origen.in_([o.value for o in origenes])
+            ))
+            if filas:
+                db.execute(insert(Alert.__table__), filas)
+            # Los clientes conectados recargan la lista completa
+            encolar_evento(db, "alertas_recalculadas", {
+                "total": len(filas), "origenes": [o.value for o in origenes],
+            })
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(filas)
+
+
+# ----------------------------------------------------
+# Barrido diario
+# ----------------------------------------------------
+
+def _segundos_hasta_medianoche() -> float:
+    ahora = datetime.now()
+    manana = datetime.combine(ahora.date() + timedelta(days=1), datetime.min.time())
+    return (manana - ahora).total_seconds()
+
+
+async def ejecutar_barrido_alertas() -> None:
+    """
+    Recalcula las alertas al arrancar y luego cada medianoche, cuando cambian los
+    umbrales por fecha (días restantes, vencimientos, ventana de turnos).
+    Con el programador de vencimientos activo, a medianoche ya no se recorren
+    documentos ni capacitaciones: sus alertas cambian en cada umbral disparado.
+    """
+    origenes = None
+    while True:
+        try:
+            await asyncio.to_thread(con_sesion_propia, AlertService().recalcular_alertas, origenes)
+        except Exception:
+            logger.exception("Error en el barrido diario de alertas")
+        if settings.EXPIRY_SCHEDULER_ENABLED:
+            origenes = [o for o in FUENTES if o not in UMBRALES_VENCIMIENTO]
+        await asyncio.sleep(_segundos_hasta_medianoche() + 1)
@@ -0,0 +1,212 @@
+# rh_service/app/services/archive_service.py
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, or_, select, union_all, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import FromClause
+
+from app.database import con_sesion_propia
+from app.models.pay_component import PayComponent
+from app.models.pay_component_archive import PayComponentArchive
+from app.models.payment_detail import PaymentDetail
+from app.models.payment_detail_archive import PaymentDetailArchive
+from app.models.payroll_period import PayrollPeriod
+from app.models.shift import Shift
+from app.models.shift_archive import ShiftArchive
+from app.schemas.schema_archive import ArchiveRunResponse
+from app.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Columnas que se copian a las tablas de archivo (mismos nombres en ambas)
+COLUMNAS_TURNO = ("id", "fecha", "hora_inicio_real", "hora_fin_real", "puesto_requerido",
+                  "assigned_employee_id", "is_covered", "es_alteracion", "notas")
+COLUMNAS_DETALLE = ("id", "employee_id", "period_id", "horas_totales_trabajadas", "monto_base_calculado",
+                    "total_descuentos", "total_bonificaciones", "monto_neto")
+COLUMNAS_COMPONENTE = ("id", "payment_detail_id", "tipo", "descripcion", "monto")
+
+
+def corte_archivo(hoy: Optional[date] = None) -> date:
+    """
+    Primer día del mes más antiguo que se conserva en las tablas principales:
+    el mes en curso y los ARCHIVE_HOT_MONTHS meses cerrados anteriores.
+    """
+    hoy = hoy or date.today()
+    meses = hoy.year * 12 + hoy.month - 1 - settings.ARCHIVE_HOT_MONTHS
+    return date(meses // 12, meses % 12 + 1, 1)
+
+
+def _columnas(modelo: type, nombres: Tuple[str, ...]):
+    return [getattr(modelo, c) for c in nombres]
+
+
+# ----------------------------------------------------
+# Lectura transparente
+# ----------------------------------------------------
+
+def frontera_archivo(db: Session) -> Optional[date]:
+    """
+    Última fecha de turno archivada. Se lee de la base de datos en cada llamada
+    (MAX sobre el índice de fecha, una sola lectura del índice) y no se guarda en
+    memoria: el archivo puede haberlo ejecutado otro worker o proceso.
+    """
+    return db.scalar(select(func.max(ShiftArchive.fecha)))
+
+
+def incluye_archivo(db: Session, desde: Optional[date]) -> bool:
+    """True si un rango de fechas que empieza en `desde` (None: sin inicio) llega a turnos archivados."""
+    frontera = frontera_archivo(db)
+    return frontera is not None and (desde is None or desde <= frontera)
+
+
+def tabla_turnos(db: Session, desde: date, hasta: date, employee_id: Optional[int] = None,
+                 archivo: Optional[bool] = None) -> FromClause:
+    """
+    Turnos con fecha en [desde, hasta] (y, si se indica, de `employee_id`) como
+    subconsulta con las columnas de Shift (acceder por `.c`): solo la tabla principal
+    o la unión con `shifts_archive`. Los filtros van dentro de cada rama para que
+    cada tabla use su índice.
+
+    `archivo`: None consulta la frontera del archivo para decidir si hace falta la
+    rama archivada; True la incluye siempre (sin esa consulta previa: conviene cuando
+    la rama es una lectura acotada por índice, p. ej. de un empleado).
+    """
+    ramas = [(Shift, select(*_columnas(Shift, COLUMNAS_TURNO)))]
+    if archivo or (archivo is None and incluye_archivo(db, desde)):
+        ramas.append((ShiftArchive, select(*_columnas(ShiftArchive, COLUMNAS_TURNO))))
+    consultas = []
+    for modelo, consulta in ramas:
+        consulta = consulta.where(modelo.fecha.between(desde, hasta))
+        if employee_id is not None:
+            consulta = consulta.where(modelo.assigned_employee_id == employee_id)
+        consultas.append(consulta)
+    consulta = union_all(*consultas) if len(consultas) > 1 else consultas[0]
+    return consulta.subquery("turnos")
+
+
+def tabla_detalles(employee_id: int) -> FromClause:
+    """
+    Detalles de pago del empleado, de la tabla principal y de
+    `payment_details_archive`, como subconsulta con las columnas de PaymentDetail
+    (acceder por `.c`). Cada rama usa su índice por empleado.
+    """
+    ramas = [select(*_columnas(modelo, COLUMNAS_DETALLE)).where(modelo.employee_id == employee_id)
+             for modelo in (PaymentDetail, PaymentDetailArchive)]
+    return union_all(*ramas).subquery("detalles")
+
+
+def tablas_pago(period: PayrollPeriod) -> Tuple[type, type]:
+    """(modelo de detalle, modelo de componente) donde están los pagos del período."""
+    if period.archivado:
+        return PaymentDetailArchive, PayComponentArchive
+    return PaymentDetail, PayComponent
+
+
+# ----------------------------------------------------
+# Archivo
+# ----------------------------------------------------
+
+class ArchiveService:
+    """
+    Mueve los turnos y los pagos de meses cerrados a tablas de archivo comprimidas,
+    para que las consultas habituales recorran solo los meses recientes.
+    """
+
+    def archivar(self, db: Session, hoy: Optional[date] = None,
+                 progreso: Optional[Callable[[int, str], None]] = None) -> ArchiveRunResponse:
+        """
+        Archiva los turnos anteriores al corte (por lotes de ARCHIVE_BATCH_SIZE, una
+        transacción por lote) y los pagos de los períodos finalizados que terminaron
+        antes del corte (una transacción por período). Cada lote copia y borra en la
+        misma transacción, por lo que se puede interrumpir y volver a ejecutar.
+
+        `progreso`: ver ContextoJob.progreso; se llama antes de cada lote y de cada
+        período, así que al cancelar lo ya archivado se conserva.
+        """
+        corte = corte_archivo(hoy)
+        turnos = self._archivar_turnos(db, corte, progreso)
+        periodos, detalles, componentes = self._archivar_pagos(db, corte, progreso)
+        if turnos or periodos:
+            logger.info("Archivo histórico (corte %s): %s turnos, %s períodos (%s detalles, %s componentes)",
+                        corte, turnos, periodos, detalles, componentes)
+        return ArchiveRunResponse(corte=corte, turnos=turnos, periodos=periodos,
+                                  detalles=detalles, componentes=componentes)
+
+    def _archivar_turnos(self, db: Session, corte: date, progreso=None) -> int:
+        # Los turnos ocupan el 0-80 % del avance y los pagos el resto
+        pendientes = db.scalar(select(func.count()).select_from(Shift).where(Shift.fecha < corte)) \
+            if progreso else 0
+        total = 0
+        while True:
+            ids = db.scalars(
+                select(Shift.id).where(Shift.fecha < corte).order_by(Shift.id).limit(settings.ARCHIVE_BATCH_SIZE)
+            ).all()
+            if not ids:
+                return total
+            if progreso:
+                progreso(min(80, total * 80 // max(pendientes, 1)), f"Archivados {total} de {pendientes} turnos")
+            try:
+                db.execute(insert(ShiftArchive).from_select(
+                    COLUMNAS_TURNO, select(*_columnas(Shift, COLUMNAS_TURNO)).where(Shift.id.in_(ids))
+                ))
+                db.execute(delete(Shift).where(Shift.id.in_(ids)).execution_options(synchronize_session=False))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            total += len(ids)
+
+    def _archivar_pagos(self, db: Session, corte: date, progreso=None) -> Tuple[int, int, int]:
+        periodos = db.scalars(
+            select(PayrollPeriod.id).where(
+                PayrollPeriod.finalizado == True, PayrollPeriod.fecha_fin < corte,
+                or_(PayrollPeriod.archivado == False, PayrollPeriod.archivado.is_(None)),
+            ).order_by(PayrollPeriod.id)
+        ).all()
+        detalles = componentes = 0
+        for numero, period_id in enumerate(periodos):
+            if progreso:
+                progreso(80 + numero * 19 // len(periodos),
+                         f"Archivando los pagos del período {period_id} ({numero + 1} de {len(periodos)})")
+            ids_detalle = select(PaymentDetail.id).where(PaymentDetail.period_id == period_id)
+            try:
+                detalles += db.execute(insert(PaymentDetailArchive).from_select(
+                    COLUMNAS_DETALLE,
+                    select(*_columnas(PaymentDetail, COLUMNAS_DETALLE)).where(PaymentDetail.period_id == period_id),
+                )).rowcount
+                componentes += db.execute(insert(PayComponentArchive).from_select(
+                    COLUMNAS_COMPONENTE,
+                    select(*_columnas(PayComponent, COLUMNAS_COMPONENTE))
+                    .where(PayComponent.payment_detail_id.in_(ids_detalle)),
+                )).rowcount
+                db.execute(delete(PayComponent).where(PayComponent.payment_detail_id.in_(ids_detalle))
+                           .execution_options(synchronize_session=False))
+                db.execute(delete(PaymentDetail).where(PaymentDetail.period_id == period_id)
+                           .execution_options(synchronize_session=False))
+                db.execute(update(PayrollPeriod).where(PayrollPeriod.id == period_id).values(archivado=True)
+                           .execution_options(synchronize_session=False))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        return len(periodos), detalles, componentes
+
+
+def _segundos_hasta_medianoche() -> float:
+    ahora = datetime.now()
+    manana = datetime.combine(ahora.date() + timedelta(days=1), datetime.min.time())
+    return (manana - ahora).total_seconds()
+
+
+async def ejecutar_archivo_periodico() -> None:
+    """Archiva al arrancar y luego cada medianoche (los meses se cierran al cambiar de día)."""
+    while True:
+        try:
+            await asyncio.to_thread(con_sesion_propia, ArchiveService().archivar)
+        except Exception:
+            logger.exception("Error en el archivo histórico de turnos y pagos")
+        await asyncio.sleep(_segundos_hasta_medianoche() + 1)
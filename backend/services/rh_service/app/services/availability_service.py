@@ -0,0 +1,192 @@
+# rh_service/app/services/availability_service.py
+
+import threading
+from datetime import time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.models.employee_schedule import EmployeeSchedule
+from app.models.request import Request
+from app.models.shift import Shift
+from app.schemas.schema_shift import ShiftCandidateResponse
+from app.services.shift_service import ShiftService, solapa_con
+from app.utils.query_cache import backend_cache, sesion_de_relleno
+
+# Resolución de la disponibilidad: la semana se divide en franjas de 15 minutos
+MINUTOS_POR_FRANJA = 15
+FRANJAS_POR_DIA = 24 * 60 // MINUTOS_POR_FRANJA
+FRANJAS_POR_SEMANA = 7 * FRANJAS_POR_DIA
+SEMANA_COMPLETA = (1 << FRANJAS_POR_SEMANA) - 1
+
+# Tablas de las que depende el índice en memoria
+TABLAS_INDICE = (Employee.__table__.name, EmployeeSchedule.__table__.name)
+
+# Tipos de solicitud aprobada que NO implican ausencia
+TIPOS_SIN_AUSENCIA = ("Reemplazo",)
+
+
+def _franja(hora: time, redondear_arriba: bool) -> int:
+    segundos = (hora.hour * 60 + hora.minute) * 60 + hora.second
+    franja, resto = divmod(segundos, MINUTOS_POR_FRANJA * 60)
+    return franja + 1 if redondear_arriba and resto else franja
+
+
+def mascara_intervalo(dia_semana: int, inicio: time, fin: time, cubrir: bool) -> int:
+    """
+    Bits de la semana (día 1=Lunes .. 7=Domingo) ocupados por el intervalo [inicio, fin).
+
+    Con `cubrir=True` se incluyen las franjas tocadas parcialmente (lo que un turno
+    necesita); con `cubrir=False` solo las completas (lo que un patrón garantiza).
+    Un intervalo con fin <= inicio cruza la medianoche y continúa el día siguiente.
+    """
+    a = _franja(inicio, redondear_arriba=not cubrir)
+    b = _franja(fin, redondear_arriba=cubrir)
+    if fin <= inicio:
+        b += FRANJAS_POR_DIA
+    if b <= a:
+        return 0
+    mascara = ((1 << (b - a)) - 1) << ((dia_semana - 1) * FRANJAS_POR_DIA + a)
+    # El domingo por la noche continúa el lunes
+    return (mascara & SEMANA_COMPLETA) | (mascara >> FRANJAS_POR_SEMANA)
+
+
+class EmpleadoDisponible(NamedTuple):
+    id: int
+    nombre: str
+    apellido: str
+    puesto: str
+    sucursal_id: Optional[int]
+    desempeño_score: Optional[int]
+    disponibilidad: int  # Bitset semanal de los patrones de horario vigentes
+
+
+class IndiceDisponibilidad:
+    """
+    Disponibilidad semanal de los empleados activos en memoria, agrupada por puesto.
+
+    Se reconstruye (dos consultas) cuando cambia la versión de las tablas de empleados
+    o de horarios, usando los mismos contadores de versión que la caché de consultas;
+    con el backend compartido, los cambios hechos en otro worker también la invalidan.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versiones: Optional[Dict[str, int]] = None
+        self._por_puesto: Dict[str, List[EmpleadoDisponible]] = {}
+
+    @staticmethod
+    def _clave_puesto(puesto: Optional[str]) -> str:
+        return (puesto or "").strip().lower()
+
+    def _construir(self, db: Session) -> Dict[str, List[EmpleadoDisponible]]:
+        disponibilidad: Dict[int, int] = {}
+        patrones = db.execute(
+            select(EmployeeSchedule.employee_id, EmployeeSchedule.dia_semana,
+                   EmployeeSchedule.hora_inicio_patron, EmployeeSchedule.hora_fin_patron)
+            .where(EmployeeSchedule.es_actual == True)
+        )
+        for employee_id, dia, inicio, fin in patrones:
+            disponibilidad[employee_id] = disponibilidad.get(employee_id, 0) | \
+                mascara_intervalo(dia, inicio, fin, cubrir=False)
+
+        por_puesto: Dict[str, List[EmpleadoDisponible]] = {}
+        empleados = db.execute(
+            select(Employee.id, Employee.nombre, Employee.apellido, Employee.puesto,
+                   Employee.sucursal_id, Employee.desempeño_score)
+            .where(Employee.is_active == True)
+        )
+        for fila in empleados:
+            mascara = disponibilidad.get(fila.id)
+            if mascara:
+                por_puesto.setdefault(self._clave_puesto(fila.puesto), []).append(
+                    EmpleadoDisponible(*fila, disponibilidad=mascara)
+                )
+        return por_puesto
+
+    def candidatos(self, db: Session, puesto: Optional[str], requerida: int) -> List[EmpleadoDisponible]:
+        """Empleados activos del puesto (todos si es None) cuyos patrones cubren `requerida`."""
+        versiones = backend_cache().versiones(TABLAS_INDICE)
+        with self._lock:
+            if versiones != self._versiones:
+                with sesion_de_relleno(db) as sesion:
+                    self._por_puesto = self._construir(sesion)
+                self._versiones = versiones
+            por_puesto = self._por_puesto
+
+        if puesto:
+            grupos = [por_puesto.get(self._clave_puesto(puesto), [])]
+        else:
+            grupos = list(por_puesto.values())
+        return [e for grupo in grupos for e in grupo if e.disponibilidad & requerida == requerida]
+
+
+indice_disponibilidad = IndiceDisponibilidad()
+
+
+class AvailabilityService:
+    """
+    Búsqueda de reemplazos para turnos: empleados libres del puesto requerido.
+    """
+
+    def __init__(self):
+        self.shift_service = ShiftService()
+
+    def _ocupados(self, db: Session, shift: Shift) -> Set[int]:
+        """Empleados con un turno que se solapa o con una ausencia aprobada ese día."""
+        con_turno = select(Shift.assigned_employee_id).where(
+            Shift.fecha == shift.fecha,
+            Shift.assigned_employee_id.isnot(None),
+            solapa_con(shift.hora_inicio_real, shift.hora_fin_real),
+        )
+        ausentes = select(Request.employee_id).where(
+            Request.estado == "Aprobado",
+            Request.tipo.notin_(TIPOS_SIN_AUSENCIA),
+            Request.fecha_inicio <= shift.fecha,
+            Request.fecha_fin >= shift.fecha,
+        )
+        return set(db.scalars(con_turno.union(ausentes)))
+
+    def get_candidatos(self, db: Session, shift_id: int, sucursal_id: Optional[int] = None,
+                       limit: int = 20) -> List[ShiftCandidateResponse]:
+        """
+        Ordena a los empleados que pueden cubrir el turno: mismo puesto, patrón de
+        horario vigente que cubre el turno completo, sin turnos solapados ni ausencias
+        aprobadas. Primero los que tienen menos turnos esa semana y, a igualdad, los
+        de mejor desempeño. El asignado actual (si lo hay) se excluye.
+        Lanza 404 si el turno no existe.
+        """
+        shift = self.shift_service.get_shift_by_id(db, shift_id)
+        requerida = mascara_intervalo(shift.fecha.isoweekday(), shift.hora_inicio_real,
+                                      shift.hora_fin_real, cubrir=True)
+
+        candidatos = indice_disponibilidad.candidatos(db, shift.puesto_requerido, requerida)
+        if sucursal_id is not None:
+            candidatos = [e for e in candidatos if e.sucursal_id == sucursal_id]
+        if not candidatos:
+            return []
+
+        ocupados = self._ocupados(db, shift)
+        ocupados.add(shift.assigned_employee_id)
+        candidatos = [e for e in candidatos if e.id not in ocupados]
+
+        # Carga de la semana (lunes a domingo) de los candidatos restantes
+        lunes = shift.fecha - timedelta(days=shift.fecha.weekday())
+        turnos_semana = dict(db.execute(
+            select(Shift.assigned_employee_id, func.count(Shift.id))
+            .where(Shift.fecha >= lunes, Shift.fecha < lunes + timedelta(days=7),
+                   Shift.assigned_employee_id.in_([e.id for e in candidatos]))
+            .group_by(Shift.assigned_employee_id)
+        ).all()) if candidatos else {}
+
+        candidatos.sort(key=lambda e: (turnos_semana.get(e.id, 0), -(e.desempeño_score or 0), e.id))
+        return [
+            ShiftCandidateResponse(
+                employee_id=e.id, nombre=e.nombre, apellido=e.apellido, puesto=e.puesto,
+                sucursal_id=e.sucursal_id, turnos_semana=turnos_semana.get(e.id, 0),
+                desempeño_score=e.desempeño_score,
+            )
+            for e in candidatos[:limit]
+        ]
@@ -0,0 +1,99 @@
+# rh_service/app/services/change_feed_service.py
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.database import con_sesion_propia
+from app.models.change_log import ChangeLog
+from app.schemas.schema_change import CambioResponse, ChangeFeedResponse
+from app.utils.change_log import secuenciar_pendientes  # También registra los manejadores de change_log
+from app.utils.config import settings
+from app.utils.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Frecuencia de la depuración de registros antiguos
+INTERVALO_DEPURACION = timedelta(hours=1)
+
+
+class ChangeFeedService:
+    """
+    Lectura incremental del registro de cambios (`change_log`).
+    """
+
+    def get_cambios(self, db: Session, since: Optional[str] = None, entidades: Optional[Sequence[str]] = None,
+                    limit: int = 500) -> ChangeFeedResponse:
+        """
+        Cambios con versión posterior a `since`, en orden. Sin `since` no devuelve
+        cambios, solo el token actual: el cliente carga los listados completos y
+        desde ahí sincroniza con el token.
+
+        Las versiones se asignan en orden de confirmación (ver app/utils/change_log.py):
+        un cambio confirmado después de leer el token siempre recibe una versión mayor,
+        así que no hay huecos que esperar ni cambios que se salten. Los registros aún
+        sin versión no se devuelven. Lanza 410 si el token es anterior a los registros
+        conservados.
+        """
+        if since is None:
+            actual = db.scalar(select(func.max(ChangeLog.version))) or 0
+            return ChangeFeedResponse(cambios=[], token=encode_cursor([actual]), hay_mas=False)
+
+        desde = decode_cursor(since, (ChangeLog.version,))[0]
+        primero = db.scalar(select(func.min(ChangeLog.version)))
+        # Faltan registros entre el token y el más antiguo conservado: se depuraron
+        if primero is not None and desde < primero - 1:
+            raise HTTPException(status_code=status.HTTP_410_GONE,
+                                detail="El token es anterior a los cambios conservados; recargar los datos completos.")
+
+        filas = db.execute(
+            select(ChangeLog.version, ChangeLog.entidad, ChangeLog.id_entidad, ChangeLog.operacion,
+                   ChangeLog.creado_en)
+            .where(ChangeLog.version > desde).order_by(ChangeLog.version).limit(limit + 1)
+        ).all()
+
+        cambios, ultimo = [], desde
+        for fila in filas[:limit]:
+            ultimo = fila.version
+            if entidades and fila.entidad not in entidades:
+                continue
+            cambios.append(CambioResponse(version=fila.version, entidad=fila.entidad, id_entidad=fila.id_entidad,
+                                          operacion=fila.operacion, fecha=fila.creado_en))
+        return ChangeFeedResponse(cambios=cambios, token=encode_cursor([ultimo]), hay_mas=len(filas) > limit)
+
+    def depurar(self, db: Session) -> int:
+        """Elimina los registros más antiguos que CHANGE_LOG_RETENTION_DAYS."""
+        limite = datetime.now() - timedelta(days=settings.CHANGE_LOG_RETENTION_DAYS)
+        try:
+            eliminados = db.execute(delete(ChangeLog.__table__).where(ChangeLog.creado_en < limite)).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return eliminados
+
+
+async def ejecutar_depuracion_cambios() -> None:
+    """
+    Depura el registro de cambios al arrancar y luego cada hora. Entre depuraciones,
+    cada CHANGE_LOG_SEQUENCE_SECONDS asigna las versiones que hayan quedado pendientes
+    (si el secuenciador del commit falló o el proceso terminó antes de ejecutarlo).
+    """
+    proxima_depuracion = datetime.now()
+    while True:
+        try:
+            await asyncio.to_thread(con_sesion_propia, lambda db: secuenciar_pendientes(db.get_bind()))
+        except Exception:
+            logger.exception("Error al asignar versiones del registro de cambios")
+        if datetime.now() >= proxima_depuracion:
+            try:
+                await asyncio.to_thread(con_sesion_propia, ChangeFeedService().depurar)
+            except Exception:
+                logger.exception("Error al depurar el registro de cambios")
+            proxima_depuracion = datetime.now() + INTERVALO_DEPURACION
+        await asyncio.sleep(settings.CHANGE_LOG_SEQUENCE_SECONDS)
@@ -0,0 +1,205 @@
+# rh_service/app/services/compliance_service.py
+
+import threading
+from collections import Counter
+from datetime import date
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from sqlalchemy import case, event, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.models.training import Training
+from app.schemas.schema_training import CeldasMatriz, ComplianceMatrixResponse, EmpleadosMatriz
+from app.utils.change_events import Cambio, al_cambiar
+from app.utils.query_cache import backend_cache
+
+# Tablas de las que depende la matriz en memoria
+TABLAS_MATRIZ = (Employee.__table__.name, Training.__table__.name)
+
+# Empleados y tablas modificados por la transacción en curso (se aplican tras el commit)
+CLAVE_CUMPLIMIENTO_PENDIENTE = "cumplimiento_pendiente"
+
+COMPLETADA, PENDIENTE, VENCIDA = "C", "P", "V"
+
+
+class FilaEmpleado(NamedTuple):
+    id: int
+    nombre: str
+    apellido: str
+    puesto: str
+    sucursal_id: Optional[int]
+    rol_id: int
+
+
+class Celda(NamedTuple):
+    """Asignaciones de una capacitación (por nombre) a un empleado."""
+    pendiente: bool
+    fecha_limite: Optional[date]   # La más próxima entre las pendientes
+
+    def estado(self, hoy: date) -> str:
+        if not self.pendiente:
+            return COMPLETADA
+        if self.fecha_limite and self.fecha_limite < hoy:
+            return VENCIDA
+        return PENDIENTE
+
+
+def _consulta_celdas():
+    """Una fila por (empleado, nombre de capacitación): si queda alguna pendiente y su fecha límite."""
+    pendientes = func.sum(case((Training.completado == True, 0), else_=1))
+    return select(
+        Training.employee_id, Training.nombre_capacitacion, pendientes.label("pendientes"),
+        func.min(case((Training.completado == True, None), else_=Training.fecha_limite)).label("fecha_limite"),
+    ).group_by(Training.employee_id, Training.nombre_capacitacion)
+
+
+class MatrizCumplimiento:
+    """
+    Matriz dispersa empleados activos x capacitaciones en memoria.
+
+    Se construye con dos consultas (empleados y capacitaciones agrupadas). Tras cada
+    commit que modifica empleados o capacitaciones solo se recalculan las filas de
+    los empleados afectados. Si los contadores de versión de la caché de consultas
+    avanzan más que los commits vistos aquí (otro worker, escrituras masivas), se
+    reconstruye completa.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._empleados: Dict[int, FilaEmpleado] = {}
+        self._celdas: Dict[int, Dict[str, Celda]] = {}
+        # Versiones esperadas: las de la última construcción más los commits locales
+        self._versiones: Optional[Dict[str, int]] = None
+        self._pendientes: Set[int] = set()
+
+    def _cargar(self, db: Session, ids: Optional[Iterable[int]] = None) -> None:
+        empleados = select(Employee.id, Employee.nombre, Employee.apellido, Employee.puesto,
+                           Employee.sucursal_id, Employee.rol_id).where(Employee.is_active == True)
+        celdas = _consulta_celdas().join(Employee, Training.employee_id == Employee.id) \
+            .where(Employee.is_active == True)
+        if ids is not None:
+            ids = list(ids)
+            empleados = empleados.where(Employee.id.in_(ids))
+            celdas = celdas.where(Training.employee_id.in_(ids))
+            for employee_id in ids:
+                self._empleados.pop(employee_id, None)
+                self._celdas.pop(employee_id, None)
+        else:
+            self._empleados, self._celdas = {}, {}
+
+        for fila in db.execute(empleados):
+            self._empleados[fila.id] = FilaEmpleado(*fila)
+        for employee_id, nombre, pendientes, fecha_limite in db.execute(celdas):
+            self._celdas.setdefault(employee_id, {})[nombre] = Celda(bool(pendientes), fecha_limite)
+
+    def _actualizar(self, db: Session) -> None:
+        actuales = backend_cache().versiones(TABLAS_MATRIZ)
+        if actuales != self._versiones:
+            self._cargar(db)
+            self._versiones = actuales
+            self._pendientes.clear()
+        elif self._pendientes:
+            self._cargar(db, self._pendientes)
+            self._pendientes.clear()
+
+    def registrar_commit(self, empleados: Set[int], tablas: Set[str]) -> None:
+        """Cambios confirmados en este proceso: filas a recalcular en la próxima lectura."""
+        with self._lock:
+            self._pendientes |= empleados
+            if self._versiones is not None:
+                for tabla in tablas:
+                    self._versiones[tabla] = self._versiones.get(tabla, 0) + 1
+
+    def consultar(self, db: Session, sucursal_id: Optional[int] = None, rol_id: Optional[int] = None,
+                  puesto: Optional[str] = None) -> ComplianceMatrixResponse:
+        with self._lock:
+            self._actualizar(db)
+            filas = [
+                e for e in self._empleados.values()
+                if (sucursal_id is None or e.sucursal_id == sucursal_id)
+                and (rol_id is None or e.rol_id == rol_id)
+                and (not puesto or e.puesto.strip().lower() == puesto.strip().lower())
+            ]
+            filas.sort(key=lambda e: (e.apellido, e.nombre, e.id))
+            celdas_por_fila = [self._celdas.get(e.id, {}) for e in filas]
+
+        columnas = sorted({nombre for celdas in celdas_por_fila for nombre in celdas})
+        indice_columna = {nombre: j for j, nombre in enumerate(columnas)}
+
+        hoy = date.today()
+        fila_k, columna_k, estado_k, fecha_k = [], [], [], []
+        for i, celdas in enumerate(celdas_por_fila):
+            for nombre in sorted(celdas, key=indice_columna.__getitem__):
+                celda = celdas[nombre]
+                fila_k.append(i)
+                columna_k.append(indice_columna[nombre])
+                estado_k.append(celda.estado(hoy))
+                fecha_k.append(celda.fecha_limite)
+
+        return ComplianceMatrixResponse(
+            fecha=hoy,
+            capacitaciones=columnas,
+            empleados=EmpleadosMatriz(
+                id=[e.id for e in filas], nombre=[e.nombre for e in filas],
+                apellido=[e.apellido for e in filas], puesto=[e.puesto for e in filas],
+                sucursal_id=[e.sucursal_id for e in filas], rol_id=[e.rol_id for e in filas],
+            ),
+            celdas=CeldasMatriz(fila=fila_k, columna=columna_k, estado=estado_k, fecha_limite=fecha_k),
+            totales=dict(Counter(estado_k)),
+        )
+
+
+matriz_cumplimiento = MatrizCumplimiento()
+
+
+class ComplianceService:
+    """
+    Cumplimiento de capacitaciones por empleado.
+    """
+
+    def get_matriz(self, db: Session, sucursal_id: Optional[int] = None, rol_id: Optional[int] = None,
+                   puesto: Optional[str] = None) -> ComplianceMatrixResponse:
+        """
+        Matriz de empleados activos (filtrados por sucursal, rol y puesto) x nombres de
+        capacitación, con el estado de cada asignación, en formato columnar.
+        """
+        return matriz_cumplimiento.consultar(db, sucursal_id=sucursal_id, rol_id=rol_id, puesto=puesto)
+
+
+# ----------------------------------------------------
+# Mantenimiento incremental
+# ----------------------------------------------------
+
+def _pendiente(session: Session) -> dict:
+    return session.info.setdefault(CLAVE_CUMPLIMIENTO_PENDIENTE, {"empleados": set(), "tablas": set()})
+
+
+@al_cambiar(Employee)
+def _al_cambiar_empleados(session: Session, cambios: List[Cambio]) -> None:
+    pendiente = _pendiente(session)
+    pendiente["tablas"].add(Employee.__table__.name)
+    pendiente["empleados"].update(c.instancia.id for c in cambios)
+
+
+@al_cambiar(Training)
+def _al_cambiar_capacitaciones(session: Session, cambios: List[Cambio]) -> None:
+    pendiente = _pendiente(session)
+    pendiente["tablas"].add(Training.__table__.name)
+    for cambio in cambios:
+        # También el empleado anterior si la capacitación se reasignó
+        historial = inspect(cambio.instancia).attrs.employee_id.history
+        pendiente["empleados"].update(historial.deleted)
+        pendiente["empleados"].add(cambio.instancia.employee_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _aplicar_cumplimiento(session: Session) -> None:
+    pendiente = session.info.pop(CLAVE_CUMPLIMIENTO_PENDIENTE, None)
+    if pendiente:
+        matriz_cumplimiento.registrar_commit(pendiente["empleados"], pendiente["tablas"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_cumplimiento(session: Session) -> None:
+    session.info.pop(CLAVE_CUMPLIMIENTO_PENDIENTE, None)
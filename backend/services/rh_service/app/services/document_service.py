@@ -2,7 +2,7 @@
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 from datetime import date,timedelta
 from sqlalchemy.exc import IntegrityError
 
@@ -10,6 +10,27 @@ from sqlalchemy.exc import IntegrityError
 from app.models.document import Document
 from app.schemas.schema_document import DocumentCreate, DocumentUpdate
 from app.models.employee import Employee # Necesario para verificar la FK
+from app.utils.pagination import Pagina, paginate
+from app.utils.projection import Campo, Proyeccion
+
+
+# Listado compacto (`?fields=` / `?vista=resumen`), con el nombre del empleado
+PROYECCION_DOCUMENTOS = Proyeccion(
+    Document,
+    campos={
+        "id": Campo(Document.id),
+        "employee_id": Campo(Document.employee_id),
+        "tipo": Campo(Document.tipo),
+        "url_archivo": Campo(Document.url_archivo),
+        "fecha_vencimiento": Campo(Document.fecha_vencimiento),
+        "aprobado_admin": Campo(Document.aprobado_admin),
+        "empleado_nombre": Campo(Employee.nombre, join="empleado"),
+        "empleado_apellido": Campo(Employee.apellido, join="empleado"),
+    },
+    resumen=("employee_id", "tipo", "fecha_vencimiento", "aprobado_admin"),
+    joins={"empleado": (Employee, Document.employee_id == Employee.id)},
+)
+
 
 class DocumentService:
     """
@@ -23,7 +44,7 @@ class DocumentService:
         Obtiene un documento por su ID.
         Lanza 404 si no se encuentra.
         """
-        document = db.query(Document).filter(Document.id == document_id).first()
+        document = db.get(Document, document_id)
         if not document:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Documento con ID {document_id} no encontrado.")
@@ -39,7 +60,25 @@ class DocumentService:
         """
         Obtiene una lista paginada de todos los documentos.
         """
-        return db.query(Document).offset(skip).limit(limit).all()
+        return self.get_documents_page(db, skip=skip, limit=limit).items
+
+    def get_documents_page(self, db: Session, skip: int = 0, limit: int = 100,
+                           after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de documentos ordenada por ID, por offset o por cursor (`after`).
+        """
+        return paginate(db.query(Document), keys=(Document.id,), skip=skip, limit=limit, after=after)
+
+    def get_documents_proyectados(self, db: Session, campos: List[str], employee_id: Optional[int] = None,
+                                  skip: int = 0, limit: int = 100, after: Optional[str] = None) -> Pagina:
+        """
+        Listado compacto de documentos (solo `campos`, como diccionarios): los de un
+        empleado (todos, sin paginar) o una página de todos.
+        """
+        if employee_id is not None:
+            filas = PROYECCION_DOCUMENTOS.todos(db, campos, Document.employee_id == employee_id)
+            return Pagina(items=filas, next_cursor=None)
+        return PROYECCION_DOCUMENTOS.pagina(db, campos, skip=skip, limit=limit, after=after)
 
     def create_document(self, db: Session, employee_id: int, document: DocumentCreate) -> Document:
         """
@@ -47,7 +86,7 @@ class DocumentService:
         Verifica la existencia del empleado antes de la creación.
         """
         # Lógica de negocio 1: Verificar que el employee_id exista (FK)
-        employee_exists = db.query(Employee).filter(Employee.id == employee_id).first()
+        employee_exists = db.get(Employee, employee_id)
         if not employee_exists:
              raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                  detail=f"El empleado con ID {employee_id} no existe.")
@@ -1,15 +1,27 @@
 # rh_service/app/services/employee_schedule_service.py
 
+from collections import defaultdict
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
-from datetime import time
+from typing import Callable, List, Optional
+from datetime import time, timedelta
 from sqlalchemy.exc import IntegrityError
 
 # Importa modelos y schemas
 from app.models.employee_schedule import EmployeeSchedule
-from app.schemas.schema_employee_schedule import EmployeeScheduleCreate, EmployeeScheduleUpdate
+from app.schemas.schema_employee_schedule import (
+    EmployeeScheduleCreate, EmployeeScheduleUpdate, ShiftGenerationRequest, ShiftGenerationResponse,
+)
 from app.models.employee import Employee # Necesario para verificar la FK
+from app.models.shift import Shift
+from app.utils.change_events import INSERT, EscrituraMasiva, notificar_escritura_masiva
+from app.utils.event_hub import encolar_evento
+from app.utils.pagination import Pagina, paginate
+
+# Límite del rango de generación de turnos y tamaño de cada INSERT masivo
+DIAS_MAXIMOS_GENERACION = 93
+TAMANO_LOTE_INSERCION = 1000
 
 class EmployeeScheduleService:
     """
@@ -22,7 +34,7 @@ class EmployeeScheduleService:
         Obtiene un segmento de horario semanal por su ID.
         Lanza 404 si no se encuentra.
         """
-        schedule = db.query(EmployeeSchedule).filter(EmployeeSchedule.id == schedule_id).first()
+        schedule = db.get(EmployeeSchedule, schedule_id)
         if not schedule:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Patrón de Horario con ID {schedule_id} no encontrado.")
@@ -38,14 +50,22 @@ class EmployeeScheduleService:
         """
         Obtiene una lista paginada de todos los patrones de horario.
         """
-        return db.query(EmployeeSchedule).offset(skip).limit(limit).all()
+        return self.get_schedules_page(db, skip=skip, limit=limit).items
+
+    def get_schedules_page(self, db: Session, skip: int = 0, limit: int = 100,
+                           after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de patrones de horario ordenada por ID, por offset o por cursor (`after`).
+        """
+        return paginate(db.query(EmployeeSchedule), keys=(EmployeeSchedule.id,),
+                        skip=skip, limit=limit, after=after)
 
     def create_schedule(self, db: Session, schedule_data: EmployeeScheduleCreate) -> EmployeeSchedule:
         """
         Crea un nuevo patrón de horario semanal para un empleado.
         """
         # Verificar que el employee_id exista (FK)
-        employee_exists = db.query(Employee).filter(Employee.id == schedule_data.employee_id).first()
+        employee_exists = db.get(Employee, schedule_data.employee_id)
         if not employee_exists:
              raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                  detail=f"El empleado con ID {schedule_data.employee_id} no existe.")
@@ -88,7 +108,7 @@ class EmployeeScheduleService:
         
         # Validar la FK si se intenta actualizar el employee_id
         if 'employee_id' in update_data:
-            employee_exists = db.query(Employee).filter(Employee.id == update_data['employee_id']).first()
+            employee_exists = db.get(Employee, update_data['employee_id'])
             if not employee_exists:
                  raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                      detail=f"El nuevo ID de empleado {update_data['employee_id']} no existe.")
@@ -127,3 +147,155 @@ class EmployeeScheduleService:
         db.delete(db_schedule)
         db.commit()
         return {"message": f"Patrón de Horario con ID {schedule_id} eliminado exitosamente."}
+
+
+    def generate_shifts(self, db: Session, params: ShiftGenerationRequest,
+                        progreso: Optional[Callable[[int, str], None]] = None) -> ShiftGenerationResponse:
+        """
+        Expande los patrones vigentes (`es_actual`) de los empleados activos a turnos
+        concretos en el rango de fechas, con operaciones por conjuntos:
+
+        - una consulta para los patrones y otra (índice empleado/fecha) para los turnos
+          ya existentes del rango;
+        - inserción masiva de los turnos que faltan, por lotes, y una consulta de sus
+          IDs para registrarlos uno a uno como escritura masiva (change_log, caché de
+          consultas). Se crean cubiertos, así que no generan alertas; los clientes
+          conectados reciben un único evento `turnos_generados` con el rango;
+        - actualización masiva de `es_alteracion` en los turnos existentes: False si
+          coincide exactamente con un patrón del día, True si no.
+
+        Es idempotente: un turno existente que se solapa con el patrón ocupa su lugar
+        (no se duplica), de modo que repetir la generación no crea nada nuevo.
+        Los patrones del mismo empleado y día también se comparan entre sí (regla de
+        no solapamiento de turnos): si dos se solapan, se crea el que empieza antes.
+        `progreso`: ver ContextoJob.progreso (todo se confirma al final).
+        Lanza 400 si el rango es inválido o supera `DIAS_MAXIMOS_GENERACION`.
+        """
+        if params.fecha_fin < params.fecha_inicio:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="La fecha de fin debe ser posterior o igual a la de inicio.")
+        dias = (params.fecha_fin - params.fecha_inicio).days + 1
+        if dias > DIAS_MAXIMOS_GENERACION:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"El rango no puede superar {DIAS_MAXIMOS_GENERACION} días.")
+
+        consulta_patrones = select(
+            EmployeeSchedule.employee_id, EmployeeSchedule.dia_semana, EmployeeSchedule.nombre_horario,
+            EmployeeSchedule.hora_inicio_patron, EmployeeSchedule.hora_fin_patron, Employee.puesto,
+        ).join(Employee, EmployeeSchedule.employee_id == Employee.id).where(
+            EmployeeSchedule.es_actual == True, Employee.is_active == True,
+        )
+        if params.employee_ids is not None:
+            consulta_patrones = consulta_patrones.where(EmployeeSchedule.employee_id.in_(params.employee_ids))
+
+        # (empleado, dia_semana) -> patrones de ese día
+        patrones = defaultdict(list)
+        omitidos = 0
+        for patron in db.execute(consulta_patrones):
+            if patron.hora_inicio_patron >= patron.hora_fin_patron:
+                omitidos += 1
+                continue
+            patrones[(patron.employee_id, patron.dia_semana)].append(patron)
+        empleados = {employee_id for employee_id, _ in patrones}
+        if not empleados:
+            return ShiftGenerationResponse(creados=0, ya_existentes=0, alteraciones_marcadas=0,
+                                           patrones_omitidos=omitidos)
+
+        if progreso:
+            progreso(20, f"Patrones de {len(empleados)} empleados leídos")
+
+        # (empleado, fecha) -> turnos existentes
+        existentes = defaultdict(list)
+        for turno in db.execute(
+            select(Shift.id, Shift.assigned_employee_id, Shift.fecha, Shift.hora_inicio_real,
+                   Shift.hora_fin_real, Shift.es_alteracion)
+            .where(Shift.assigned_employee_id.in_(empleados),
+                   Shift.fecha.between(params.fecha_inicio, params.fecha_fin))
+        ):
+            existentes[(turno.assigned_employee_id, turno.fecha)].append(turno)
+
+        # Turnos que faltan: un turno existente que se solapa con el patrón ocupa su lugar
+        nuevos, coincidentes, solapados = [], 0, 0
+        fechas_por_dia = defaultdict(list)
+        for offset in range(dias):
+            fecha = params.fecha_inicio + timedelta(days=offset)
+            fechas_por_dia[fecha.isoweekday()].append(fecha)
+        for (employee_id, dia_semana), lista in patrones.items():
+            lista = sorted(lista, key=lambda p: (p.hora_inicio_patron, p.hora_fin_patron))
+            for fecha in fechas_por_dia.get(dia_semana, ()):
+                turnos = existentes.get((employee_id, fecha), ())
+                # Intervalos ya aceptados ese día para el empleado (existentes + nuevos)
+                ocupados = [(t.hora_inicio_real, t.hora_fin_real) for t in turnos]
+                for patron in lista:
+                    inicio, fin = patron.hora_inicio_patron, patron.hora_fin_patron
+                    if any(t.hora_inicio_real == inicio and t.hora_fin_real == fin for t in turnos):
+                        coincidentes += 1
+                    elif any(t.hora_inicio_real < fin and t.hora_fin_real > inicio for t in turnos):
+                        continue
+                    elif any(o_inicio < fin and o_fin > inicio for o_inicio, o_fin in ocupados):
+                        solapados += 1
+                    else:
+                        ocupados.append((inicio, fin))
+                        nuevos.append({
+                            "fecha": fecha, "hora_inicio_real": inicio, "hora_fin_real": fin,
+                            "puesto_requerido": patron.puesto, "assigned_employee_id": employee_id,
+                            "is_covered": True, "es_alteracion": False, "notas": patron.nombre_horario,
+                        })
+
+        # Un turno existente es alteración si no coincide exactamente con ningún patrón de su día
+        cambios_alteracion = {}
+        for (employee_id, fecha), turnos in existentes.items():
+            del_dia = patrones.get((employee_id, fecha.isoweekday()), ())
+            for turno in turnos:
+                alteracion = not any(turno.hora_inicio_real == p.hora_inicio_patron
+                                     and turno.hora_fin_real == p.hora_fin_patron for p in del_dia)
+                if bool(turno.es_alteracion) != alteracion:
+                    cambios_alteracion[turno.id] = alteracion
+
+        if progreso:
+            progreso(60, f"Insertando {len(nuevos)} turnos")
+        try:
+            if nuevos:
+                conn = db.connection()
+                for i in range(0, len(nuevos), TAMANO_LOTE_INSERCION):
+                    conn.execute(insert(Shift.__table__), nuevos[i:i + TAMANO_LOTE_INSERCION])
+                self._notificar_insertados(db, empleados, params, existentes)
+            if cambios_alteracion:
+                db.execute(update(Shift), [{"id": shift_id, "es_alteracion": valor}
+                                           for shift_id, valor in cambios_alteracion.items()])
+            if nuevos or cambios_alteracion:
+                encolar_evento(db, "turnos_generados", {
+                    "fecha_inicio": params.fecha_inicio,
+                    "fecha_fin": params.fecha_fin,
+                    "creados": len(nuevos),
+                    "alteraciones_marcadas": len(cambios_alteracion),
+                })
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                detail=f"Error al generar turnos: {str(e)}")
+
+        return ShiftGenerationResponse(
+            creados=len(nuevos),
+            ya_existentes=coincidentes,
+            alteraciones_marcadas=len(cambios_alteracion),
+            patrones_omitidos=omitidos,
+            patrones_solapados=solapados,
+        )
+
+    def _notificar_insertados(self, db: Session, empleados, params: ShiftGenerationRequest, existentes) -> None:
+        """
+        Relee en una consulta los IDs de los turnos recién insertados (los del rango
+        que no estaban antes) y los informa como escritura masiva con sus IDs: el
+        change_log registra cada alta sin cargar las filas como instancias.
+        """
+        previos = {t.id for turnos in existentes.values() for t in turnos}
+        insertados = [
+            shift_id for shift_id in db.scalars(select(Shift.id).where(
+                Shift.assigned_employee_id.in_(empleados),
+                Shift.fecha.between(params.fecha_inicio, params.fecha_fin),
+            ))
+            if shift_id not in previos
+        ]
+        notificar_escritura_masiva(db, EscrituraMasiva(Shift.__table__.name, INSERT, insertados))
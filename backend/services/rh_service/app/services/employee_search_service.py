@@ -0,0 +1,279 @@
+# rh_service/app/services/employee_search_service.py
+
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import and_, event, or_, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.schemas.schema_employee import EmployeeSearchResult
+from app.utils.change_events import DELETE, Cambio, al_cambiar
+from app.utils.config import settings
+from app.utils.query_cache import backend_cache
+
+# Tabla de la que depende el índice en memoria
+TABLA_EMPLEADOS = Employee.__table__.name
+
+# Cambios de empleados de la transacción en curso (se aplican al índice tras el commit)
+CLAVE_BUSQUEDA_PENDIENTE = "busqueda_empleados_pendiente"
+
+# Similitud mínima (trigramas compartidos / trigramas totales) para una coincidencia aproximada
+UMBRAL_SIMILITUD = 0.35
+# Palabras del vocabulario que se consideran como máximo por término (prefijos muy cortos)
+MAX_PALABRAS_POR_TERMINO = 500
+# Puntaje por tipo de coincidencia de un término
+PUNTAJE_EXACTO = 1.0
+PUNTAJE_PREFIJO = 0.8
+PUNTAJE_APROXIMADO = 0.6
+
+_NO_ALFANUMERICO = re.compile(r"[^a-z0-9]+")
+
+
+def normalizar(texto: Optional[str]) -> str:
+    """Minúsculas, sin acentos y solo letras y dígitos separados por espacios."""
+    descompuesto = unicodedata.normalize("NFKD", texto or "")
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return _NO_ALFANUMERICO.sub(" ", sin_acentos.lower()).strip()
+
+
+def trigramas(palabra: str) -> Set[str]:
+    relleno = f"  {palabra} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+class DocEmpleado(NamedTuple):
+    id: int
+    nombre: str
+    apellido: str
+    email: str
+    puesto: str
+    sucursal_id: Optional[int]
+    rol_id: int
+    is_active: bool
+
+    def palabras(self) -> Set[str]:
+        return set(normalizar(f"{self.nombre} {self.apellido} {self.email} {self.puesto}").split())
+
+
+COLUMNAS_DOC = (Employee.id, Employee.nombre, Employee.apellido, Employee.email, Employee.puesto,
+                Employee.sucursal_id, Employee.rol_id, Employee.is_active)
+
+
+class IndiceEmpleados:
+    """
+    Índice invertido en memoria de nombre, apellido, email y puesto.
+
+    - palabra normalizada -> empleados que la contienen;
+    - vocabulario ordenado para buscar por prefijo (bisect);
+    - trigrama -> palabras del vocabulario, para coincidencias aproximadas.
+
+    Las búsquedas recorren el vocabulario (palabras distintas), no los empleados.
+    Se construye en la primera búsqueda y se actualiza tras cada commit que modifica
+    empleados; si las versiones de la caché de consultas avanzan más que los commits
+    vistos aquí (otro worker, escrituras masivas), se reconstruye.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs: Dict[int, DocEmpleado] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._trigramas: Dict[str, Set[str]] = defaultdict(set)
+        self._vocabulario: List[str] = []
+        self._version: Optional[int] = None
+
+    # --- Mantenimiento ---
+
+    def _agregar(self, doc: DocEmpleado) -> None:
+        self._docs[doc.id] = doc
+        for palabra in doc.palabras():
+            ids = self._postings.get(palabra)
+            if ids is None:
+                ids = self._postings[palabra] = set()
+                bisect.insort(self._vocabulario, palabra)
+                for t in trigramas(palabra):
+                    self._trigramas[t].add(palabra)
+            ids.add(doc.id)
+
+    def _quitar(self, employee_id: int) -> None:
+        doc = self._docs.pop(employee_id, None)
+        if doc is None:
+            return
+        for palabra in doc.palabras():
+            ids = self._postings.get(palabra)
+            if ids is None:
+                continue
+            ids.discard(employee_id)
+            if not ids:
+                del self._postings[palabra]
+                del self._vocabulario[bisect.bisect_left(self._vocabulario, palabra)]
+                for t in trigramas(palabra):
+                    self._trigramas[t].discard(palabra)
+
+    def _construir(self, db: Session) -> None:
+        self._docs, self._postings, self._trigramas = {}, {}, defaultdict(set)
+        vocabulario: Set[str] = set()
+        for fila in db.execute(select(*COLUMNAS_DOC)):
+            doc = DocEmpleado(*fila)
+            self._docs[doc.id] = doc
+            for palabra in doc.palabras():
+                self._postings.setdefault(palabra, set()).add(doc.id)
+                vocabulario.add(palabra)
+        self._vocabulario = sorted(vocabulario)
+        for palabra in self._vocabulario:
+            for t in trigramas(palabra):
+                self._trigramas[t].add(palabra)
+
+    def registrar_commit(self, cambios: Dict[int, Optional[DocEmpleado]]) -> None:
+        """Aplica los empleados confirmados en este proceso (None: eliminado)."""
+        with self._lock:
+            if self._version is None:
+                return
+            for employee_id, doc in cambios.items():
+                self._quitar(employee_id)
+                if doc is not None:
+                    self._agregar(doc)
+            self._version += 1
+
+    def _actualizar(self, db: Session) -> None:
+        actual = backend_cache().versiones((TABLA_EMPLEADOS,))[TABLA_EMPLEADOS]
+        if actual != self._version:
+            self._construir(db)
+            self._version = actual
+
+    # --- Búsqueda ---
+
+    def _coincidencias(self, termino: str) -> Dict[str, float]:
+        """Palabras del vocabulario que coinciden con el término y su puntaje."""
+        palabras: Dict[str, float] = {}
+        inicio = bisect.bisect_left(self._vocabulario, termino)
+        for palabra in self._vocabulario[inicio:inicio + MAX_PALABRAS_POR_TERMINO]:
+            if not palabra.startswith(termino):
+                break
+            palabras[palabra] = PUNTAJE_EXACTO if palabra == termino else PUNTAJE_PREFIJO
+
+        if len(termino) >= 3:
+            tri_termino = trigramas(termino)
+            compartidos = Counter(p for t in tri_termino for p in self._trigramas.get(t, ()))
+            for palabra, n in compartidos.most_common(MAX_PALABRAS_POR_TERMINO):
+                similitud = n / (len(tri_termino) + len(palabra) + 1 - n)
+                if similitud < UMBRAL_SIMILITUD:
+                    continue
+                palabras.setdefault(palabra, PUNTAJE_APROXIMADO * similitud)
+        return palabras
+
+    def buscar(self, db: Session, texto: str, sucursal_id: Optional[int] = None,
+               rol_id: Optional[int] = None, is_active: Optional[bool] = None,
+               limit: int = 20) -> List[Tuple[DocEmpleado, float]]:
+        terminos = normalizar(texto).split()
+        if not terminos:
+            return []
+        with self._lock:
+            self._actualizar(db)
+            puntajes: Optional[Dict[int, float]] = None
+            # Todos los términos deben coincidir; primero los más selectivos (más largos)
+            for termino in sorted(set(terminos), key=len, reverse=True):
+                mejor: Dict[int, float] = {}
+                for palabra, puntaje in self._coincidencias(termino).items():
+                    for employee_id in self._postings[palabra]:
+                        if (puntajes is None or employee_id in puntajes) and puntaje > mejor.get(employee_id, 0):
+                            mejor[employee_id] = puntaje
+                puntajes = mejor if puntajes is None else {i: puntajes[i] + p for i, p in mejor.items()}
+                if not puntajes:
+                    return []
+            resultados = [
+                (self._docs[i], p) for i, p in puntajes.items()
+                if (sucursal_id is None or self._docs[i].sucursal_id == sucursal_id)
+                and (rol_id is None or self._docs[i].rol_id == rol_id)
+                and (is_active is None or bool(self._docs[i].is_active) == is_active)
+            ]
+        return heapq.nsmallest(limit, resultados, key=lambda r: (-r[1], r[0].apellido, r[0].nombre, r[0].id))
+
+
+indice_empleados = IndiceEmpleados()
+
+
+class EmployeeSearchService:
+    """
+    Búsqueda de empleados por nombre, apellido, email y puesto.
+    """
+
+    def buscar(self, db: Session, q: str, sucursal_id: Optional[int] = None, rol_id: Optional[int] = None,
+               is_active: Optional[bool] = None, limit: int = 20) -> List[EmployeeSearchResult]:
+        """
+        Empleados que coinciden con todas las palabras de `q` (sin distinguir acentos
+        ni mayúsculas), ordenados por relevancia: palabra exacta, prefijo o parecida.
+        Con `EMPLOYEE_SEARCH_BACKEND = "fulltext"` se consulta la base de datos.
+        """
+        if settings.EMPLOYEE_SEARCH_BACKEND == "fulltext":
+            return self._buscar_sql(db, q, sucursal_id, rol_id, is_active, limit)
+        return [
+            EmployeeSearchResult(**doc._asdict(), score=round(puntaje, 3))
+            for doc, puntaje in indice_empleados.buscar(db, q, sucursal_id, rol_id, is_active, limit)
+        ]
+
+    def _buscar_sql(self, db: Session, q: str, sucursal_id: Optional[int], rol_id: Optional[int],
+                    is_active: Optional[bool], limit: int) -> List[EmployeeSearchResult]:
+        """
+        Búsqueda en la base de datos: índice FULLTEXT en MySQL (por prefijo de cada
+        palabra; la colación ya ignora acentos), LIKE en otros motores. Sin
+        coincidencias aproximadas.
+        """
+        terminos = normalizar(q).split()
+        if not terminos:
+            return []
+        if db.get_bind().dialect.name == "mysql":
+            puntaje = match(Employee.nombre, Employee.apellido, Employee.email, Employee.puesto,
+                            against=" ".join(f"+{t}*" for t in terminos)).in_boolean_mode()
+            consulta = select(*COLUMNAS_DOC, puntaje.label("score")).where(puntaje > 0) \
+                .order_by(puntaje.desc(), Employee.apellido, Employee.nombre, Employee.id)
+        else:
+            columnas = (Employee.nombre, Employee.apellido, Employee.email, Employee.puesto)
+            consulta = select(*COLUMNAS_DOC).where(and_(*(
+                or_(*(c.ilike(f"%{t}%") for c in columnas)) for t in terminos
+            ))).order_by(Employee.apellido, Employee.nombre, Employee.id)
+
+        if sucursal_id is not None:
+            consulta = consulta.where(Employee.sucursal_id == sucursal_id)
+        if rol_id is not None:
+            consulta = consulta.where(Employee.rol_id == rol_id)
+        if is_active is not None:
+            consulta = consulta.where(Employee.is_active == is_active)
+        return [
+            EmployeeSearchResult(**DocEmpleado(*fila[:len(COLUMNAS_DOC)])._asdict(),
+                                 score=round(float(fila[-1]), 3) if len(fila) > len(COLUMNAS_DOC) else 1.0)
+            for fila in db.execute(consulta.limit(limit))
+        ]
+
+
+# ----------------------------------------------------
+# Mantenimiento incremental
+# ----------------------------------------------------
+
+@al_cambiar(Employee)
+def _al_cambiar_empleados(session: Session, cambios: List[Cambio]) -> None:
+    pendientes = session.info.setdefault(CLAVE_BUSQUEDA_PENDIENTE, {})
+    for cambio in cambios:
+        e = cambio.instancia
+        pendientes[e.id] = None if cambio.operacion == DELETE else DocEmpleado(
+            e.id, e.nombre, e.apellido, e.email, e.puesto, e.sucursal_id, e.rol_id,
+            True if e.is_active is None else e.is_active,
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _aplicar_busqueda(session: Session) -> None:
+    pendientes = session.info.pop(CLAVE_BUSQUEDA_PENDIENTE, None)
+    if pendientes:
+        indice_empleados.registrar_commit(pendientes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_busqueda(session: Session) -> None:
+    session.info.pop(CLAVE_BUSQUEDA_PENDIENTE, None)
@@ -1,13 +1,78 @@
 # rh_service/app/services/employee_service.py
 
-from sqlalchemy.orm import Session,joinedload
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql.elements import UnaryExpression
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional, Sequence
+from datetime import date, timedelta
 
 # Importa el modelo ORM (tabla) y los schemas Pydantic
+from app.models.document import Document
 from app.models.employee import Employee
-from app.schemas.schema_employee import EmployeeCreate, EmployeeUpdate
+from app.models.payment_detail import PaymentDetail
+from app.models.request import Request
+from app.models.role import Role
+from app.models.shift import Shift
+from app.models.sucursal import Sucursal
+from app.models.training import Training
+from app.schemas.schema_employee import EmployeeCreate, EmployeeUpdate, EmployeeProfileResponse
+from app.services.archive_service import tabla_detalles, tabla_turnos
+from app.utils.pagination import Pagina, paginate
+from app.utils.projection import Campo, Proyeccion
+from app.utils.session_cache import memo_sesion
+
+# Perfil completo: sección -> (modelo, columna del empleado, orden de presentación en SQL)
+SECCIONES_PERFIL = {
+    # Próximos a vencer primero; sin vencimiento al final
+    "documentos": (Document, Document.employee_id,
+                   (Document.fecha_vencimiento.is_(None), Document.fecha_vencimiento, Document.id)),
+    # Pendientes primero, por fecha límite
+    "capacitaciones": (Training, Training.employee_id,
+                       (func.coalesce(Training.completado, False), Training.fecha_limite.is_(None),
+                        Training.fecha_limite, Training.id)),
+    # Cronológico dentro de la ventana
+    "turnos": (Shift, Shift.assigned_employee_id, (Shift.fecha, Shift.hora_inicio_real, Shift.id)),
+    # Más recientes primero
+    "solicitudes": (Request, Request.employee_id, (Request.fecha_inicio.desc(), Request.id.desc())),
+    "pagos": (PaymentDetail, PaymentDetail.employee_id, (PaymentDetail.period_id.desc(), PaymentDetail.id.desc())),
+}
+
+# Ventana por defecto (días antes y después de hoy) de turnos y solicitudes en el perfil
+DIAS_VENTANA_PERFIL = 30
+
+# Listado compacto (`?fields=` / `?vista=resumen`): columnas planas, rol y sucursal por nombre
+PROYECCION_EMPLEADOS = Proyeccion(
+    Employee,
+    campos={
+        "id": Campo(Employee.id),
+        "nombre": Campo(Employee.nombre),
+        "apellido": Campo(Employee.apellido),
+        "email": Campo(Employee.email),
+        "puesto": Campo(Employee.puesto),
+        "fecha_ingreso": Campo(Employee.fecha_ingreso),
+        "is_active": Campo(Employee.is_active),
+        "desempeño_score": Campo(Employee.desempeño_score),
+        "tarifa_hora": Campo(Employee.tarifa_hora),
+        "es_salario_fijo": Campo(Employee.es_salario_fijo),
+        "sucursal_id": Campo(Employee.sucursal_id),
+        "rol_id": Campo(Employee.rol_id),
+        "rol_nombre": Campo(Role.rol, join="rol"),
+        "sucursal_nombre": Campo(Sucursal.nombre_sucursal, join="sucursal"),
+    },
+    resumen=("nombre", "apellido", "puesto", "is_active", "rol_nombre", "sucursal_nombre"),
+    joins={
+        "rol": (Role, Employee.rol_id == Role.id),
+        "sucursal": (Sucursal, Employee.sucursal_id == Sucursal.id),
+    },
+)
+
+
+def _orden_en(tabla, orden):
+    """Orden de una sección (columnas o `columna.desc()`) sobre las columnas de una subconsulta."""
+    return [tabla.c[o.element.key].desc() if isinstance(o, UnaryExpression) else tabla.c[o.key] for o in orden]
+
 
 class EmployeeService: 
     """
@@ -15,26 +80,115 @@ class EmployeeService:
     sobre el modelo Employee.
     """
 
+    def _query(self, db: Session):
+        """
+        Consulta base de empleados para EmployeeResponse: rol y sucursal (muchos-a-uno)
+        con joinedload, en la misma consulta, sin cargas perezosas al serializar.
+        Los listados compactos usan PROYECCION_EMPLEADOS y el perfil completo lee sus
+        secciones con consultas propias.
+        """
+        return db.query(Employee).options(joinedload(Employee.rol), joinedload(Employee.sucursal))
+
+    @memo_sesion(Employee)
     def get_employee_by_id(self, db: Session, employee_id: int) -> Employee:
         """
-        Obtiene un empleado por su ID.
+        Obtiene un empleado por su ID, con rol y sucursal.
+        Se memoriza durante la petición: el router y el servicio comparten la lectura.
         Lanza 404 si no se encuentra.
         """
-        employee = db.query(Employee).filter(Employee.id == employee_id).first()
+        employee = self._query(db).filter(Employee.id == employee_id).first()
         if not employee:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Empleado con ID {employee_id} no encontrado.")
         return employee
 
     def get_all_employees(self, db: Session, skip: int = 0, limit: int = 100) -> List[Employee]:
-        return db.query(Employee)\
-            .options(
-                joinedload(Employee.rol),
-                joinedload(Employee.sucursal)
-            )\
-            .offset(skip)\
-            .limit(limit)\
+        return self.get_employees_page(db, skip=skip, limit=limit).items
+
+    def get_employees_page(self, db: Session, skip: int = 0, limit: int = 100,
+                           after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de empleados ordenada por ID, por offset o por cursor
+        (`after`), con rol y sucursal en la misma consulta.
+        """
+        query = self._query(db)
+        return paginate(query, keys=(Employee.id,), skip=skip, limit=limit, after=after)
+
+    def get_employees_proyectados(self, db: Session, campos: List[str], skip: int = 0, limit: int = 100,
+                                  after: Optional[str] = None) -> Pagina:
+        """
+        Listado compacto de empleados (solo `campos`, como diccionarios): una sola
+        consulta con únicamente esas columnas y, si se piden, el nombre del rol y
+        de la sucursal por JOIN.
+        """
+        return PROYECCION_EMPLEADOS.pagina(db, campos, skip=skip, limit=limit, after=after)
+
+    def get_employee_profile(self, db: Session, employee_id: int,
+                             secciones: Sequence[str] = tuple(SECCIONES_PERFIL),
+                             desde: Optional[date] = None, hasta: Optional[date] = None,
+                             limite: int = 20) -> EmployeeProfileResponse:
+        """
+        Perfil completo del empleado con un número fijo de consultas: el empleado con
+        rol y sucursal (JOIN) y una consulta por sección pedida.
+
+        Cada sección se ordena y se recorta a `limite` registros en SQL (ORDER BY +
+        LIMIT), y `COUNT(*) OVER ()` en la misma consulta indica en `totales` cuántos
+        había. Turnos y solicitudes se limitan además a la ventana [desde, hasta] (por
+        defecto DIAS_VENTANA_PERFIL días antes y después de hoy). Turnos y pagos se leen
+        de la unión con su tabla de archivo en esa misma consulta, así que los meses
+        archivados no agregan consultas.
+        Lanza 404 si el empleado no existe y 400 si la ventana es inválida.
+        """
+        hoy = date.today()
+        desde = desde or hoy - timedelta(days=DIAS_VENTANA_PERFIL)
+        hasta = hasta or hoy + timedelta(days=DIAS_VENTANA_PERFIL)
+        if desde > hasta:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="La fecha 'desde' no puede ser posterior a 'hasta'.")
+
+        employee = self._query(db).filter(Employee.id == employee_id).first()
+        if not employee:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"Empleado con ID {employee_id} no encontrado.")
+
+        ventanas = {
+            "solicitudes": and_(Request.fecha_inicio <= hasta, Request.fecha_fin >= desde),
+        }
+        perfil = {"empleado": employee, "totales": {}, "desde": desde, "hasta": hasta}
+        # Tabla principal + archivo (cada rama filtrada por su índice de empleado)
+        uniones = {
+            "turnos": lambda: tabla_turnos(db, desde, hasta, employee_id=employee_id, archivo=True),
+            "pagos": lambda: tabla_detalles(employee_id),
+        }
+        for seccion in secciones:
+            modelo, columna_empleado, orden = SECCIONES_PERFIL[seccion]
+            if seccion in uniones:
+                tabla = uniones[seccion]()
+                filas = db.execute(
+                    select(tabla, func.count().over().label("total"))
+                    .order_by(*_orden_en(tabla, orden))
+                    .limit(limite)
+                ).all()
+                perfil[seccion], perfil["totales"][seccion] = filas, (filas[0].total if filas else 0)
+                continue
+            filtros = [columna_empleado == employee_id]
+            if seccion in ventanas:
+                filtros.append(ventanas[seccion])
+            perfil[seccion], perfil["totales"][seccion] = self._seccion(db, modelo, filtros, orden, limite)
+        return EmployeeProfileResponse.model_validate(perfil, from_attributes=True)
+
+    @staticmethod
+    def _seccion(db: Session, modelo, filtros, orden, limite: int):
+        """Primeros `limite` registros de la sección y su total, en una consulta."""
+        filas = (
+            db.query(modelo, func.count().over().label("total"))
+            .filter(*filtros)
+            .order_by(*orden)
+            .limit(limite)
             .all()
+        )
+        return [fila[0] for fila in filas], (filas[0].total if filas else 0)
+
     def create_employee(self, db: Session, employee: EmployeeCreate) -> Employee:
          """
          Crea un nuevo registro de empleado en la base de datos.
@@ -61,8 +215,8 @@ class EmployeeService:
          try:
             db.add(db_employee)
             db.commit()
-            db.refresh(db_employee)
-            return db_employee
+            # Recarga con rol y sucursal para serializarlos sin cargas perezosas
+            return self.get_employee_by_id(db, db_employee.id)
          except IntegrityError:
             db.rollback()
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, 
@@ -89,8 +243,7 @@ class EmployeeService:
         try:
             db.add(db_employee)
             db.commit()
-            db.refresh(db_employee)
-            return db_employee
+            return self.get_employee_by_id(db, employee_id)
         except IntegrityError:
             db.rollback()
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, 
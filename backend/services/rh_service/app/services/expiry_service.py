@@ -0,0 +1,318 @@
+# rh_service/app/services/expiry_service.py
+
+import asyncio
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, con_sesion_propia
+from app.models.document import Document
+from app.models.expiry_notification import ExpiryNotification
+from app.models.training import Training
+from app.schemas.alert import OrigenAlerta
+from app.services.alert_service import UMBRALES_VENCIMIENTO, reevaluar_alertas
+from app.utils.change_events import DELETE, UPDATE, Cambio, al_cambiar, ejecutar_core
+from app.utils.event_hub import encolar_evento
+from app.utils.query_metrics import medir_duracion
+
+logger = logging.getLogger(__name__)
+
+# Vencimientos ya pasados que se cargan al arrancar, para disparar los umbrales
+# que vencieron mientras el servicio estaba detenido
+DIAS_RECUPERACION = 7
+
+# Segundos entre reintentos si la carga inicial o un disparo fallan (p. ej. base de datos caída)
+SEGUNDOS_REINTENTO = 60
+
+# Cambios de vencimiento de la transacción en curso (se aplican al heap tras el commit)
+CLAVE_VENCIMIENTOS_PENDIENTES = "vencimientos_pendientes"
+
+
+class Plazo(NamedTuple):
+    """Dónde está la fecha de vencimiento de cada origen."""
+    modelo: type
+    fecha: str                 # Columna con la fecha de vencimiento
+    cerrado: Optional[str]     # Columna booleana que anula el vencimiento (p. ej. completado)
+
+
+PLAZOS = {
+    OrigenAlerta.DOCUMENT: Plazo(Document, "fecha_vencimiento", None),
+    OrigenAlerta.TRAINING: Plazo(Training, "fecha_limite", "completado"),
+}
+ORIGEN_POR_MODELO = {plazo.modelo: origen for origen, plazo in PLAZOS.items()}
+
+# (fecha de disparo, origen, id de la entidad, fecha de vencimiento, umbral)
+Entrada = Tuple[date, str, int, date, int]
+
+
+def _fecha_vigente(plazo: Plazo, instancia) -> Optional[date]:
+    """Fecha de vencimiento que sigue corriendo, o None si no aplica."""
+    if plazo.cerrado and getattr(instancia, plazo.cerrado):
+        return None
+    return getattr(instancia, plazo.fecha)
+
+
+class ProgramadorVencimientos:
+    """
+    Heap en memoria con los próximos umbrales de vencimiento (fecha de disparo =
+    vencimiento - umbral). Solo se mira la cima: el trabajo diario es proporcional a
+    los umbrales que vencen, no al tamaño de las tablas.
+
+    Se carga una vez al arrancar y se actualiza tras el commit de cada escritura de
+    documentos o capacitaciones. Las entradas de un vencimiento que cambió no se
+    quitan del heap: se descartan al salir si ya no coinciden con `_vigentes`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heap: List[Entrada] = []
+        self._vigentes: Dict[Tuple[str, int], date] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._despertar: Optional[asyncio.Event] = None
+
+    def _programar(self, origen: str, id_entidad: int, fecha_objetivo: date,
+                   desde: date, disparados: Set[int]) -> None:
+        self._vigentes[(origen, id_entidad)] = fecha_objetivo
+        for umbral in UMBRALES_VENCIMIENTO[OrigenAlerta(origen)]:
+            fecha_disparo = fecha_objetivo - timedelta(days=umbral)
+            if fecha_disparo >= desde and umbral not in disparados:
+                heapq.heappush(self._heap, (fecha_disparo, origen, id_entidad, fecha_objetivo, umbral))
+
+    def cargar(self, db: Session) -> int:
+        """Carga los vencimientos vigentes y sus umbrales aún no disparados."""
+        desde = date.today() - timedelta(days=DIAS_RECUPERACION)
+        disparados: Dict[Tuple[str, int, date], Set[int]] = defaultdict(set)
+        for origen, id_entidad, fecha_objetivo, umbral in db.execute(
+            select(ExpiryNotification.origen, ExpiryNotification.id_entidad,
+                   ExpiryNotification.fecha_objetivo, ExpiryNotification.umbral)
+            .where(ExpiryNotification.fecha_objetivo >= desde)
+        ):
+            disparados[(origen, id_entidad, fecha_objetivo)].add(umbral)
+
+        plazos = []
+        for origen, plazo in PLAZOS.items():
+            columna = getattr(plazo.modelo, plazo.fecha)
+            consulta = select(plazo.modelo.id, columna).where(columna >= desde)
+            if plazo.cerrado:
+                consulta = consulta.where(getattr(plazo.modelo, plazo.cerrado) == False)
+            plazos.extend((origen.value, id_entidad, fecha) for id_entidad, fecha in db.execute(consulta))
+
+        with self._lock:
+            self._heap, self._vigentes = [], {}
+            for origen, id_entidad, fecha in plazos:
+                self._programar(origen, id_entidad, fecha, date.min, disparados[(origen, id_entidad, fecha)])
+            pendientes = len(self._heap)
+        self._avisar()
+        return pendientes
+
+    def actualizar(self, origen: str, id_entidad: int, fecha_objetivo: Optional[date]) -> None:
+        """
+        Nuevo vencimiento de una entidad (None: ya no vence). Solo se programan los
+        umbrales futuros; los de hoy o anteriores ya se aplicaron al guardar.
+        """
+        with self._lock:
+            if fecha_objetivo is None:
+                self._vigentes.pop((origen, id_entidad), None)
+            else:
+                self._programar(origen, id_entidad, fecha_objetivo, date.today() + timedelta(days=1), set())
+        self._avisar()
+
+    def _avisar(self) -> None:
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._despertar.set)
+            except RuntimeError:
+                self._loop = None
+
+    def _vencidos(self, hoy: date) -> List[Entrada]:
+        vencidos = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= hoy:
+                entrada = heapq.heappop(self._heap)
+                _, origen, id_entidad, fecha_objetivo, _ = entrada
+                if self._vigentes.get((origen, id_entidad)) == fecha_objetivo:
+                    vencidos.append(entrada)
+        return vencidos
+
+    def _reprogramar(self, por_entidad: List[Tuple[Tuple[str, int, date], List[int]]]) -> None:
+        """Devuelve al heap umbrales sacados que no llegaron a procesarse."""
+        with self._lock:
+            for (origen, id_entidad, fecha_objetivo), umbrales in por_entidad:
+                for umbral in umbrales:
+                    heapq.heappush(self._heap, (fecha_objetivo - timedelta(days=umbral), origen,
+                                                id_entidad, fecha_objetivo, umbral))
+
+    def segundos_hasta_proximo(self) -> Optional[float]:
+        """Espera hasta el inicio del día del próximo umbral (None si no hay ninguno)."""
+        with self._lock:
+            if not self._heap:
+                return None
+            proximo = datetime.combine(self._heap[0][0], datetime.min.time())
+        return max(0.0, (proximo - datetime.now()).total_seconds() + 1)
+
+    def disparar(self, hoy: date) -> int:
+        """
+        Dispara los umbrales vencidos: registra el disparo (una vez por umbral, también
+        entre procesos gracias a la restricción única), vuelve a evaluar la alerta de
+        la entidad y publica un evento `vencimiento`. Si una entidad cruzó varios
+        umbrales a la vez (p. ej. tras un reinicio) se informa solo el más avanzado.
+        Si falla otro error de base de datos, los umbrales de las entidades aún sin
+        confirmar vuelven al heap (se reintentan en el próximo despertar) y el error se
+        propaga. Devuelve el número de entidades notificadas.
+        """
+        agrupados: Dict[Tuple[str, int, date], List[int]] = defaultdict(list)
+        for _, origen, id_entidad, fecha_objetivo, umbral in self._vencidos(hoy):
+            agrupados[(origen, id_entidad, fecha_objetivo)].append(umbral)
+        por_entidad = list(agrupados.items())
+        if not por_entidad:
+            return 0
+
+        notificadas = procesadas = 0
+        try:
+            with medir_duracion("vencimientos"):
+                db = SessionLocal()
+                try:
+                    for (origen, id_entidad, fecha_objetivo), umbrales in por_entidad:
+                        try:
+                            if self._disparar_entidad(db, OrigenAlerta(origen), id_entidad, fecha_objetivo,
+                                                      umbrales, hoy):
+                                notificadas += 1
+                            db.commit()
+                        except IntegrityError:
+                            # Otro proceso registró el mismo disparo
+                            db.rollback()
+                        procesadas += 1
+                finally:
+                    db.close()
+        except Exception:
+            self._reprogramar(por_entidad[procesadas:])
+            raise
+        return notificadas
+
+    def _disparar_entidad(self, db: Session, origen: OrigenAlerta, id_entidad: int,
+                          fecha_objetivo: date, umbrales: List[int], hoy: date) -> bool:
+        ya_disparados = set(db.scalars(
+            select(ExpiryNotification.umbral).where(
+                ExpiryNotification.origen == origen.value,
+                ExpiryNotification.id_entidad == id_entidad,
+                ExpiryNotification.fecha_objetivo == fecha_objetivo,
+            )
+        ))
+        nuevos = [u for u in umbrales if u not in ya_disparados]
+        if not nuevos:
+            return False
+        db.execute(insert(ExpiryNotification.__table__), [
+            {"origen": origen.value, "id_entidad": id_entidad, "fecha_objetivo": fecha_objetivo, "umbral": u}
+            for u in nuevos
+        ])
+
+        plazo = PLAZOS[origen]
+        instancia = db.get(plazo.modelo, id_entidad)
+        if instancia is None or _fecha_vigente(plazo, instancia) != fecha_objetivo:
+            return False
+        reevaluar_alertas(db, origen, [instancia])
+        encolar_evento(db, "vencimiento", {
+            "origen": origen.value,
+            "id_entidad": id_entidad,
+            "fecha_vencimiento": fecha_objetivo,
+            "umbral": min(nuevos),
+            "dias_restantes": (fecha_objetivo - hoy).days,
+        })
+        return True
+
+    async def ejecutar(self) -> None:
+        """
+        Tarea del servicio: carga el heap y duerme hasta el próximo umbral o hasta
+        que una escritura programe uno nuevo.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._despertar = asyncio.Event()
+        while True:
+            try:
+                pendientes = await asyncio.to_thread(con_sesion_propia, self.cargar)
+                logger.info("Programador de vencimientos: %s umbrales pendientes", pendientes)
+                break
+            except Exception:
+                logger.exception("Error al cargar los vencimientos")
+                await asyncio.sleep(SEGUNDOS_REINTENTO)
+
+        while True:
+            self._despertar.clear()
+            espera = None
+            try:
+                await asyncio.to_thread(self.disparar, date.today())
+            except Exception:
+                logger.exception("Error al disparar umbrales de vencimiento")
+                # Los umbrales pendientes volvieron al heap con fecha de hoy: no reintentar en el acto
+                espera = SEGUNDOS_REINTENTO
+            try:
+                await asyncio.wait_for(self._despertar.wait(),
+                                       espera if espera is not None else self.segundos_hasta_proximo())
+            except asyncio.TimeoutError:
+                pass
+
+
+programador = ProgramadorVencimientos()
+
+
+async def ejecutar_programador_vencimientos() -> None:
+    await programador.ejecutar()
+
+
+# ----------------------------------------------------
+# Escrituras de documentos y capacitaciones
+# ----------------------------------------------------
+
+@al_cambiar(Document, Training)
+def _al_cambiar_vencimientos(session: Session, cambios: List[Cambio]) -> None:
+    """
+    Si cambia el vencimiento de una entidad se reinician sus disparos: los umbrales
+    de hoy o anteriores se registran como disparados (la alerta ya se recalcula con
+    el propio cambio) y los futuros se programan tras el commit.
+    """
+    origen = ORIGEN_POR_MODELO[type(cambios[0].instancia)]
+    plazo = PLAZOS[origen]
+    campos = [c for c in (plazo.fecha, plazo.cerrado) if c]
+    hoy = date.today()
+
+    reiniciar, disparados, pendientes = [], [], []
+    for cambio in cambios:
+        instancia = cambio.instancia
+        if cambio.operacion == UPDATE and not any(
+            inspect(instancia).attrs[campo].history.has_changes() for campo in campos
+        ):
+            continue
+        fecha = None if cambio.operacion == DELETE else _fecha_vigente(plazo, instancia)
+        reiniciar.append(instancia.id)
+        pendientes.append((origen.value, instancia.id, fecha))
+        if fecha:
+            disparados.extend(
+                {"origen": origen.value, "id_entidad": instancia.id, "fecha_objetivo": fecha, "umbral": u}
+                for u in UMBRALES_VENCIMIENTO[origen] if fecha - timedelta(days=u) <= hoy
+            )
+    if not reiniciar:
+        return
+
+    tabla = ExpiryNotification.__table__
+    ejecutar_core(session, delete(tabla).where(tabla.c.origen == origen.value, tabla.c.id_entidad.in_(reiniciar)))
+    if disparados:
+        ejecutar_core(session, insert(tabla), disparados)
+    session.info.setdefault(CLAVE_VENCIMIENTOS_PENDIENTES, []).extend(pendientes)
+
+
+@event.listens_for(Session, "after_commit")
+def _programar_vencimientos(session: Session) -> None:
+    for origen, id_entidad, fecha in session.info.pop(CLAVE_VENCIMIENTOS_PENDIENTES, ()):
+        programador.actualizar(origen, id_entidad, fecha)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_vencimientos(session: Session) -> None:
+    session.info.pop(CLAVE_VENCIMIENTOS_PENDIENTES, None)
@@ -0,0 +1,189 @@
+# rh_service/app/services/job_service.py
+
+import os
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.models.payroll_period import PayrollPeriod
+from app.schemas.schema_employee_schedule import ShiftGenerationRequest
+from app.schemas.schema_job import (
+    ConciliarJobParams, ExportarJobParams, JobCreate, PeriodoJobParams, SinParametros,
+)
+from app.services.archive_service import ArchiveService, tablas_pago
+from app.services.employee_Schedule_service import EmployeeScheduleService
+from app.services.payment_detail_service import PaymentDetailService
+from app.services.payroll_export_service import PayrollExportService, TAMANO_LOTE_EXPORTACION
+from app.services.payroll_run_service import PayrollRunService
+from app.utils.config import settings
+from app.utils.job_queue import (
+    CANCELADO, COMPLETADO, ESTADOS_TERMINADOS, PENDIENTE, TAREAS, ContextoJob, ejecutar_workers, tarea,
+)
+from app.utils.pagination import Pagina, paginate
+
+
+class JobService:
+    """
+    Encolado y consulta de trabajos en segundo plano (ver app/utils/job_queue.py).
+    """
+
+    def encolar(self, db: Session, job_in: JobCreate) -> Job:
+        """
+        Valida el tipo y los parámetros y guarda el trabajo como pendiente; un worker
+        lo toma según su prioridad. Lanza 422 si el tipo no existe o los parámetros
+        no son válidos para la tarea.
+        """
+        registrada = TAREAS.get(job_in.tipo)
+        if registrada is None:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                detail=f"Tipo de trabajo desconocido. Disponibles: {', '.join(sorted(TAREAS))}.")
+        try:
+            parametros = registrada.parametros.model_validate(job_in.parametros)
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                detail=e.errors(include_url=False, include_context=False))
+
+        db_job = Job(
+            tipo=job_in.tipo,
+            parametros=parametros.model_dump_json(),
+            estado=PENDIENTE,
+            prioridad=job_in.prioridad,
+            intentos=0,
+            max_intentos=settings.JOBS_MAX_ATTEMPTS,
+            progreso=0,
+            cancelacion_solicitada=False,
+            disponible_desde=datetime.now(),
+        )
+        db.add(db_job)
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    def get_job(self, db: Session, job_id: int) -> Job:
+        """Lanza 404 si el trabajo no existe."""
+        db_job = db.get(Job, job_id)
+        if not db_job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"Trabajo con ID {job_id} no encontrado.")
+        return db_job
+
+    def get_jobs_page(self, db: Session, estado: Optional[str] = None, tipo: Optional[str] = None,
+                      skip: int = 0, limit: int = 100, after: Optional[str] = None) -> Pagina:
+        """Trabajos más recientes primero, filtrables por estado y tipo."""
+        query = db.query(Job)
+        if estado:
+            query = query.filter(Job.estado == estado)
+        if tipo:
+            query = query.filter(Job.tipo == tipo)
+        return paginate(query, keys=(Job.id,), skip=skip, limit=limit, after=after, descending=True)
+
+    def cancelar(self, db: Session, job_id: int) -> Job:
+        """
+        Un pendiente se cancela de inmediato; uno en curso se detiene en su próximo
+        informe de progreso y revierte lo que no confirmó (las tareas que confirman
+        por lotes, como el archivo, conservan los lotes ya confirmados).
+        Lanza 409 si ya terminó.
+        """
+        db_job = self.get_job(db, job_id)
+        if db_job.estado in ESTADOS_TERMINADOS:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                                detail=f"El trabajo {job_id} ya terminó ({db_job.estado}).")
+        db_job.cancelacion_solicitada = True
+        if db_job.estado == PENDIENTE:
+            db_job.estado = CANCELADO
+            db_job.terminado_en = datetime.now()
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    def ruta_archivo(self, db: Session, job_id: int) -> str:
+        """Archivo generado por un trabajo completado. Lanza 404 si no tiene (o ya no existe)."""
+        db_job = self.get_job(db, job_id)
+        ruta = _ruta_archivo(db_job)
+        if db_job.estado != COMPLETADO or ruta is None or not os.path.exists(ruta):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"El trabajo {job_id} no tiene un archivo disponible.")
+        return ruta
+
+
+async def ejecutar_workers_jobs() -> None:
+    """Workers de trabajos de este proceso (JOBS_WORKERS hilos)."""
+    await ejecutar_workers(settings.JOBS_WORKERS)
+
+
+# ----------------------------------------------------
+# Tareas registradas
+# ----------------------------------------------------
+
+def _ruta_archivo(job: Job) -> Optional[str]:
+    """Archivo que genera el trabajo (solo las exportaciones generan uno)."""
+    if job.tipo != "exportar_nomina":
+        return None
+    formato = ExportarJobParams.model_validate_json(job.parametros).formato
+    return os.path.join(settings.JOBS_OUTPUT_DIR, f"job_{job.id}_nomina.{formato}")
+
+
+@tarea("nomina", PeriodoJobParams)
+def _nomina(db: Session, params: PeriodoJobParams, contexto: ContextoJob):
+    contexto.progreso(0, "Calculando la nómina del período")
+    return PayrollRunService().run_payroll(db, params.period_id, progreso=contexto.progreso)
+
+
+@tarea("conciliar_nomina", ConciliarJobParams)
+def _conciliar_nomina(db: Session, params: ConciliarJobParams, contexto: ContextoJob):
+    contexto.progreso(0, "Conciliando totales del período")
+    return PaymentDetailService().reconcile_period_totals(db, params.period_id, reparar=params.reparar,
+                                                          progreso=contexto.progreso)
+
+
+@tarea("generar_turnos", ShiftGenerationRequest)
+def _generar_turnos(db: Session, params: ShiftGenerationRequest, contexto: ContextoJob):
+    contexto.progreso(0, "Generando turnos desde los patrones de horario")
+    return EmployeeScheduleService().generate_shifts(db, params, progreso=contexto.progreso)
+
+
+@tarea("archivo", SinParametros)
+def _archivo(db: Session, params: SinParametros, contexto: ContextoJob):
+    contexto.progreso(0, "Archivando turnos y pagos de meses cerrados")
+    return ArchiveService().archivar(db, progreso=contexto.progreso)
+
+
+@tarea("exportar_nomina", ExportarJobParams)
+def _exportar_nomina(db: Session, params: ExportarJobParams, contexto: ContextoJob):
+    """
+    Escribe la exportación del período en JOBS_OUTPUT_DIR (se descarga con
+    GET /jobs/{id}/archivo) informando el avance por lote de detalles.
+    """
+    export_service = PayrollExportService()
+    export_service.validar_periodo(db, params.period_id)
+    Detalle, _ = tablas_pago(db.get(PayrollPeriod, params.period_id))
+    total = db.scalar(select(func.count()).select_from(Detalle).where(Detalle.period_id == params.period_id))
+
+    os.makedirs(settings.JOBS_OUTPUT_DIR, exist_ok=True)
+    ruta = _ruta_archivo(db.get(Job, contexto.job_id))
+    temporal = f"{ruta}.parcial"
+    if params.formato == "ndjson":
+        partes = export_service.exportar_ndjson(params.period_id)
+    else:
+        partes = export_service.exportar_csv(params.period_id)
+        encabezado = next(partes)
+    try:
+        with open(temporal, "w", encoding="utf-8", newline="") as archivo:
+            if params.formato == "csv":
+                archivo.write(encabezado)
+            # Cada parte es un lote de TAMANO_LOTE_EXPORTACION detalles (el último, menos)
+            for lotes, parte in enumerate(partes, start=1):
+                archivo.write(parte)
+                escritos = min(total, lotes * TAMANO_LOTE_EXPORTACION)
+                contexto.progreso(min(99, escritos * 100 // total), f"Exportados {escritos} de {total} detalles")
+        os.replace(temporal, ruta)
+    finally:
+        partes.close()
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return {"period_id": params.period_id, "formato": params.formato, "detalles": total}
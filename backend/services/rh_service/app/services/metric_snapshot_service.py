@@ -0,0 +1,205 @@
+# rh_service/app/services/metric_snapshot_service.py
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.database import con_sesion_propia
+from app.models.document import Document
+from app.models.employee import Employee
+from app.models.metric_snapshot import MetricSnapshot
+from app.models.shift import Shift
+from app.models.sucursal import Sucursal
+from app.models.training import Training
+# Misma ventana que usan las alertas de capacitaciones por vencer
+from app.services.alert_service import DIAS_VENCIMIENTO_CAPACITACION
+from app.utils.sql_functions import upsert
+
+logger = logging.getLogger(__name__)
+
+# Días hacia atrás de la foto con la que se compara la tendencia ("vs mes anterior")
+DIAS_REFERENCIA_TENDENCIA = 30
+
+CONTADORES = (
+    "total_employees", "employees_added_month", "shifts_today", "pending_shifts",
+    "active_trainings", "expiring_trainings", "total_documentos", "documentos_aprobados",
+)
+
+
+def _sumar_si(condicion):
+    """SUM(CASE WHEN condicion THEN 1 ELSE 0 END)"""
+    return func.coalesce(func.sum(case((condicion, 1), else_=0)), 0)
+
+
+class MetricSnapshotService:
+    """
+    Genera y lee las fotos diarias de métricas del dashboard (tabla metric_snapshots).
+    """
+
+    # ----------------------------------------------------
+    # Generación
+    # ----------------------------------------------------
+
+    def _contar_por_sucursal(self, db: Session, fecha: date,
+                             sucursal_id: Optional[int] = None) -> Dict[Optional[int], Dict[str, int]]:
+        """
+        Calcula los contadores agrupados por sucursal con una consulta agregada
+        (GROUP BY) por tabla, sin cargar objetos ORM. Con `sucursal_id`, solo esa sucursal.
+        Los turnos sin empleado asignado quedan en el grupo sin sucursal (None).
+        """
+        inicio_mes = fecha.replace(day=1)
+        limite_vencimiento = fecha + timedelta(days=DIAS_VENCIMIENTO_CAPACITACION)
+        sucursal = Employee.sucursal_id
+
+        consultas = {
+            ("total_employees", "employees_added_month"): select(
+                sucursal, func.count(Employee.id), _sumar_si(Employee.fecha_ingreso >= inicio_mes)
+            ).group_by(sucursal),
+            ("shifts_today", "pending_shifts"): select(
+                sucursal,
+                _sumar_si(Shift.is_covered == True),
+                _sumar_si(or_(Shift.is_covered == False, Shift.is_covered.is_(None))),
+            ).select_from(Shift)
+             .outerjoin(Employee, Shift.assigned_employee_id == Employee.id)
+             .where(Shift.fecha == fecha)
+             .group_by(sucursal),
+            ("active_trainings", "expiring_trainings"): select(
+                sucursal,
+                func.count(Training.id),
+                _sumar_si((Training.completado == False) & Training.fecha_limite.isnot(None)
+                          & (Training.fecha_limite <= limite_vencimiento)),
+            ).join(Employee, Training.employee_id == Employee.id).group_by(sucursal),
+            ("total_documentos", "documentos_aprobados"): select(
+                sucursal, func.count(Document.id), _sumar_si(Document.aprobado_admin == True)
+            ).join(Employee, Document.employee_id == Employee.id).group_by(sucursal),
+        }
+        sucursales = select(Sucursal.id)
+        if sucursal_id is not None:
+            consultas = {campos: consulta.where(sucursal == sucursal_id) for campos, consulta in consultas.items()}
+            sucursales = sucursales.where(Sucursal.id == sucursal_id)
+
+        por_sucursal: Dict[Optional[int], Dict[str, int]] = defaultdict(lambda: dict.fromkeys(CONTADORES, 0))
+        # Todas las sucursales tienen su fila, aunque no tengan actividad
+        for (id_sucursal,) in db.execute(sucursales):
+            por_sucursal[id_sucursal]
+        for campos, consulta in consultas.items():
+            for id_sucursal, *valores in db.execute(consulta):
+                for campo, valor in zip(campos, valores):
+                    por_sucursal[id_sucursal][campo] = int(valor or 0)
+        return por_sucursal
+
+    def generar_snapshot(self, db: Session, fecha: Optional[date] = None) -> MetricSnapshot:
+        """
+        Registra (o reemplaza) la foto del día: una fila global y una por sucursal.
+        Los contadores reflejan el estado actual de las tablas, por lo que la foto
+        de un día queda fija cuando el día termina.
+        Se escribe con un upsert sobre (fecha, ámbito): varios workers o la tarea
+        periódica pueden generarla a la vez sin duplicar filas.
+        Devuelve la fila global.
+        """
+        fecha = fecha or date.today()
+        por_sucursal = self._contar_por_sucursal(db, fecha)
+
+        total = dict.fromkeys(CONTADORES, 0)
+        ahora = datetime.now()
+        filas = []
+        for sucursal_id, contadores in por_sucursal.items():
+            for campo in CONTADORES:
+                total[campo] += contadores[campo]
+            # Los turnos sin asignar no pertenecen a ninguna sucursal: solo suman al total
+            if sucursal_id is not None:
+                filas.append({**self._fila(fecha, sucursal_id, contadores), "actualizado_en": ahora})
+        filas.append({**self._fila(fecha, None, total), "actualizado_en": ahora})
+
+        try:
+            upsert(db, MetricSnapshot, filas, claves=("fecha", "ambito"),
+                   actualizar=(*CONTADORES, "compliance_rate", "actualizado_en"))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return self.get_snapshots(db, fecha)[0]
+
+    @staticmethod
+    def _fila(fecha: date, sucursal_id: Optional[int], contadores: Dict[str, int]) -> dict:
+        total_docs = contadores["total_documentos"]
+        compliance_rate = int(contadores["documentos_aprobados"] / total_docs * 100) if total_docs else 100
+        return {"fecha": fecha, "sucursal_id": sucursal_id, "compliance_rate": compliance_rate, **contadores}
+
+    # ----------------------------------------------------
+    # Lectura
+    # ----------------------------------------------------
+
+    def calcular_en_vivo(self, db: Session, sucursal_id: Optional[int] = None,
+                         fecha: Optional[date] = None) -> Optional[MetricSnapshot]:
+        """
+        Calcula los contadores del día sin guardarlos (solo lectura), para cuando
+        todavía no hay foto de la sucursal o del día. Devuelve una fila transitoria,
+        o None si la sucursal no existe.
+        """
+        fecha = fecha or date.today()
+        por_sucursal = self._contar_por_sucursal(db, fecha, sucursal_id)
+        if sucursal_id is not None:
+            if sucursal_id not in por_sucursal:
+                return None
+            return MetricSnapshot(**self._fila(fecha, sucursal_id, por_sucursal[sucursal_id]))
+        total = dict.fromkeys(CONTADORES, 0)
+        for contadores in por_sucursal.values():
+            for campo in CONTADORES:
+                total[campo] += contadores[campo]
+        return MetricSnapshot(**self._fila(fecha, None, total))
+
+    def get_snapshots(self, db: Session, fecha: date, sucursal_id: Optional[int] = None) -> list:
+        """Fotos de un día para la sucursal indicada (None = total de la empresa)."""
+        return db.query(MetricSnapshot).filter(
+            MetricSnapshot.fecha == fecha,
+            MetricSnapshot.sucursal_id.is_(None) if sucursal_id is None
+            else MetricSnapshot.sucursal_id == sucursal_id,
+        ).all()
+
+    def get_snapshot_con_referencia(
+        self, db: Session, sucursal_id: Optional[int] = None, fecha: Optional[date] = None
+    ) -> Tuple[Optional[MetricSnapshot], Optional[MetricSnapshot]]:
+        """
+        Lee en una sola consulta indexada la foto del día y la foto de referencia
+        para la tendencia (la más reciente con al menos 30 días de antigüedad).
+        """
+        fecha = fecha or date.today()
+        de_la_sucursal = (MetricSnapshot.sucursal_id.is_(None) if sucursal_id is None
+                          else MetricSnapshot.sucursal_id == sucursal_id)
+
+        fecha_referencia = select(func.max(MetricSnapshot.fecha)).where(
+            de_la_sucursal,
+            MetricSnapshot.fecha <= fecha - timedelta(days=DIAS_REFERENCIA_TENDENCIA),
+        ).scalar_subquery()
+
+        filas = db.query(MetricSnapshot).filter(
+            de_la_sucursal,
+            or_(MetricSnapshot.fecha == fecha, MetricSnapshot.fecha == fecha_referencia),
+        ).all()
+
+        actual = next((f for f in filas if f.fecha == fecha), None)
+        referencia = next((f for f in filas if f.fecha != fecha), None)
+        return actual, referencia
+
+
+# ----------------------------------------------------
+# Tarea periódica
+# ----------------------------------------------------
+
+async def ejecutar_snapshots_periodicos(intervalo_minutos: int) -> None:
+    """
+    Refresca la foto del día cada `intervalo_minutos`. La última ejecución de cada
+    día queda como su cierre. Se ejecuta en un hilo para no bloquear el event loop.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(con_sesion_propia, MetricSnapshotService().generar_snapshot)
+        except Exception:
+            logger.exception("Error al generar la foto diaria de métricas")
+        await asyncio.sleep(intervalo_minutos * 60)
@@ -1,8 +1,10 @@
 # rh_service/app/services/pay_component_service.py
 
+from collections import defaultdict
+from sqlalchemy import bindparam, case, func, inspect, or_, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from sqlalchemy.exc import IntegrityError
 
@@ -10,6 +12,96 @@ from sqlalchemy.exc import IntegrityError
 from app.models.pay_component import PayComponent
 from app.models.payment_detail import PaymentDetail # Necesario para la FK 
 from app.schemas.schema_pay_component import PayComponentCreate, PayComponentUpdate
+from app.utils.change_events import DELETE, INSERT, Cambio, al_cambiar, ejecutar_core
+from app.utils.pagination import Pagina, paginate
+
+# Tipos de componente que se descuentan aunque se registren con monto positivo
+TIPOS_DESCUENTO = ("descuento", "deduccion", "deducción", "impuesto", "retencion", "retención")
+
+
+def clasificar_componente(tipo: str, monto: Decimal) -> Tuple[Decimal, Decimal]:
+    """
+    Devuelve el aporte del componente a (total_bonificaciones, total_descuentos).
+    Es descuento si el monto es negativo o el tipo es de descuento; se suma en valor absoluto.
+    """
+    if monto < 0 or (tipo or "").strip().lower() in TIPOS_DESCUENTO:
+        return Decimal("0"), abs(monto)
+    return monto, Decimal("0")
+
+
+def totales_componentes_sql():
+    """
+    Expresiones SQL (para un SELECT agrupado) equivalentes a `clasificar_componente`:
+    (suma de bonificaciones, suma de descuentos).
+    """
+    es_descuento = or_(PayComponent.monto < 0, func.lower(func.trim(PayComponent.tipo)).in_(TIPOS_DESCUENTO))
+    bonificaciones = func.coalesce(func.sum(case((es_descuento, 0), else_=PayComponent.monto)), 0)
+    descuentos = func.coalesce(func.sum(case((es_descuento, func.abs(PayComponent.monto)), else_=0)), 0)
+    return bonificaciones, descuentos
+
+
+def _valor_anterior(instancia, atributo: str):
+    """Valor del atributo antes de los cambios pendientes del flush."""
+    historial = inspect(instancia).attrs[atributo].history
+    if historial.deleted:
+        return historial.deleted[0]
+    return getattr(instancia, atributo)
+
+
+# ----------------------------------------------------
+# Mantenimiento incremental de los totales del detalle de pago
+# ----------------------------------------------------
+
+@al_cambiar(PayComponent)
+def _actualizar_totales_detalle(session: Session, cambios: List[Cambio]) -> None:
+    """
+    Aplica a cada PaymentDetail afectado la diferencia (delta) que producen los
+    componentes creados, modificados o eliminados en el flush, sin releer el resto
+    de sus componentes. Se ejecuta en la misma transacción que el cambio, con un
+    UPDATE atómico (columna = columna + delta) por detalle.
+    """
+    # detail_id -> [delta bonificaciones, delta descuentos]
+    deltas: Dict[int, List[Decimal]] = defaultdict(lambda: [Decimal("0"), Decimal("0")])
+
+    def aplicar(detail_id, tipo, monto, signo):
+        if detail_id is None or monto is None:
+            return
+        bonificacion, descuento = clasificar_componente(tipo, Decimal(monto))
+        deltas[detail_id][0] += signo * bonificacion
+        deltas[detail_id][1] += signo * descuento
+
+    for cambio in cambios:
+        c = cambio.instancia
+        if cambio.operacion != INSERT:
+            aplicar(_valor_anterior(c, "payment_detail_id"), _valor_anterior(c, "tipo"),
+                    _valor_anterior(c, "monto"), -1)
+        if cambio.operacion != DELETE:
+            aplicar(c.payment_detail_id, c.tipo, c.monto, 1)
+
+    filas = [{"detail_id": d, "delta_bonificaciones": b, "delta_descuentos": s}
+             for d, (b, s) in deltas.items() if b or s]
+    if not filas:
+        return
+
+    detalles = PaymentDetail.__table__
+    bonificaciones = func.coalesce(detalles.c.total_bonificaciones, 0)
+    descuentos = func.coalesce(detalles.c.total_descuentos, 0)
+    # monto_neto se asigna primero: MySQL evalúa el SET de izquierda a derecha con los
+    # valores ya actualizados; así todos los dialectos usan los valores anteriores.
+    ejecutar_core(
+        session,
+        update(detalles)
+        .where(detalles.c.id == bindparam("detail_id"))
+        .ordered_values(
+            (detalles.c.monto_neto, func.coalesce(detalles.c.monto_base_calculado, 0)
+             + bonificaciones + bindparam("delta_bonificaciones")
+             - descuentos - bindparam("delta_descuentos")),
+            (detalles.c.total_bonificaciones, bonificaciones + bindparam("delta_bonificaciones")),
+            (detalles.c.total_descuentos, descuentos + bindparam("delta_descuentos")),
+        ),
+        filas,
+        ids=[f["detail_id"] for f in filas],
+    )
 
 
 class PayComponentService:
@@ -22,7 +114,7 @@ class PayComponentService:
         Obtiene un componente de pago por su ID.
         Lanza 404 si no se encuentra.
         """
-        component = db.query(PayComponent).filter(PayComponent.id == component_id).first()
+        component = db.get(PayComponent, component_id)
         if not component:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Componente de Pago con ID {component_id} no encontrado.")
@@ -38,14 +130,21 @@ class PayComponentService:
         """
         Obtiene una lista paginada de todos los componentes de pago.
         """
-        return db.query(PayComponent).offset(skip).limit(limit).all()
+        return self.get_components_page(db, skip=skip, limit=limit).items
+
+    def get_components_page(self, db: Session, skip: int = 0, limit: int = 100,
+                            after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de componentes de pago ordenada por ID, por offset o por cursor (`after`).
+        """
+        return paginate(db.query(PayComponent), keys=(PayComponent.id,), skip=skip, limit=limit, after=after)
 
     def _validate_payment_detail_id(self, db: Session, detail_id: int):
         """
         Función auxiliar para verificar si el PaymentDetail existe.
         """
         # Asumiendo que el modelo PaymentDetail existe en app.models
-        detail_exists = db.query(PaymentDetail).filter(PaymentDetail.id == detail_id).first()
+        detail_exists = db.get(PaymentDetail, detail_id)
         if not detail_exists:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"El detalle de pago (PaymentDetail) con ID {detail_id} no existe.")
@@ -1,8 +1,9 @@
 # rh_service/app/services/payment_detail_service.py
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import Callable, List, Optional
 from decimal import Decimal
 from sqlalchemy.exc import IntegrityError
 
@@ -10,7 +11,11 @@ from sqlalchemy.exc import IntegrityError
 from app.models.payment_detail import PaymentDetail # Asumido
 from app.models.employee import Employee # Necesario para la FK de empleado
 from app.models.payroll_period import PayrollPeriod # Necesario para la FK de período
-from app.schemas.schema_payment_detail import PaymentDetailCreate, PaymentDetailUpdate
+from app.models.pay_component import PayComponent
+from app.models.payment_detail_archive import PaymentDetailArchive
+from app.schemas.schema_payment_detail import PaymentDetailCreate, PaymentDetailUpdate, ReconciliationResponse, TotalesCorregidos
+from app.services.pay_component_service import totales_componentes_sql
+from app.utils.pagination import Pagina, paginate
 
 
 class PaymentDetailService:
@@ -27,57 +32,63 @@ class PaymentDetailService:
         """ Función auxiliar para verificar la existencia de Empleado y Período de Nómina. """
         
         # 1. Validar Empleado
-        employee_exists = db.query(Employee).filter(Employee.id == employee_id).first()
+        employee_exists = db.get(Employee, employee_id)
         if not employee_exists:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"El empleado con ID {employee_id} no existe.")
         
         # 2. Validar Período de Nómina
-        period_exists = db.query(PayrollPeriod).filter(PayrollPeriod.id == period_id).first()
+        period_exists = db.get(PayrollPeriod, period_id)
         if not period_exists:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"El período de nómina con ID {period_id} no existe.")
 
 
-    def get_detail_by_id(self, db: Session, detail_id: int) -> PaymentDetail:
-        """ Obtiene un detalle de pago por su ID. Lanza 404 si no se encuentra. """
-        detail = db.query(PaymentDetail).filter(PaymentDetail.id == detail_id).first()
+    def get_detail_by_id(self, db: Session, detail_id: int, archivo: bool = False) -> PaymentDetail:
+        """
+        Obtiene un detalle de pago por su ID. Con `archivo`, si no está en la tabla
+        principal se busca en `payment_details_archive` (solo lectura).
+        Lanza 404 si no se encuentra.
+        """
+        detail = db.get(PaymentDetail, detail_id)
+        if not detail and archivo:
+            detail = db.get(PaymentDetailArchive, detail_id)
         if not detail:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Detalle de Pago con ID {detail_id} no encontrado.")
         return detail
 
     def get_details_by_employee(self, db: Session, employee_id: int) -> List[PaymentDetail]:
-        """ Obtiene todos los detalles de pago asociados a un empleado. """
-        return db.query(PaymentDetail).filter(PaymentDetail.employee_id == employee_id).all()
+        """ Obtiene todos los detalles de pago asociados a un empleado, incluidos los de períodos archivados. """
+        detalles = db.query(PaymentDetail).filter(PaymentDetail.employee_id == employee_id).all()
+        return detalles + db.query(PaymentDetailArchive).filter(PaymentDetailArchive.employee_id == employee_id).all()
 
     def get_all_details(self, db: Session, skip: int = 0, limit: int = 100) -> List[PaymentDetail]:
         """ Obtiene una lista paginada de todos los detalles de pago. """
-        return db.query(PaymentDetail).offset(skip).limit(limit).all()
+        return self.get_details_page(db, skip=skip, limit=limit).items
+
+    def get_details_page(self, db: Session, skip: int = 0, limit: int = 100,
+                         after: Optional[str] = None) -> Pagina:
+        """ Obtiene una página de detalles de pago ordenada por ID, por offset o por cursor (`after`). """
+        return paginate(db.query(PaymentDetail), keys=(PaymentDetail.id,), skip=skip, limit=limit, after=after)
 
     def create_detail(self, db: Session, detail_data: PaymentDetailCreate) -> PaymentDetail:
         """ 
         Crea un nuevo detalle de pago.
-        Realiza la validación de FK y calcula el monto_neto inicial.
+        Realiza la validación de FK. Aún no tiene componentes: los totales empiezan
+        en 0 y el monto neto es el monto base.
         """
         # 1. Validar Claves Foráneas
         self._validate_foreign_keys(db, detail_data.employee_id, detail_data.period_id)
 
-        # 2. Calcular el monto neto (Base + Bonificaciones - Descuentos)
-        monto_neto_calculated = self._calculate_monto_neto(
-            detail_data.monto_base_calculado,
-            detail_data.total_bonificaciones,
-            detail_data.total_descuentos
-        )
-
         db_detail = PaymentDetail(
             employee_id=detail_data.employee_id,
             period_id=detail_data.period_id,
             horas_totales_trabajadas=detail_data.horas_totales_trabajadas,
             monto_base_calculado=detail_data.monto_base_calculado,
-            total_descuentos=detail_data.total_descuentos,
-            total_bonificaciones=detail_data.total_bonificaciones,
-            monto_neto=monto_neto_calculated
+            total_descuentos=Decimal("0.00"),
+            total_bonificaciones=Decimal("0.00"),
+            monto_neto=detail_data.monto_base_calculado
         )
         
         try:
@@ -96,8 +107,9 @@ class PaymentDetailService:
 
     def update_detail(self, db: Session, detail_id: int, detail_update: PaymentDetailUpdate) -> PaymentDetail:
         """
-        Actualiza los campos de un detalle de pago existente. 
-        Recalcula el monto neto si se modifican los componentes base.
+        Actualiza los campos de un detalle de pago existente. Los totales solo
+        cambian con los componentes de pago; si cambia el monto base se recalcula el
+        monto neto con los totales guardados.
         """
         db_detail = self.get_detail_by_id(db, detail_id)
         update_data = detail_update.model_dump(exclude_unset=True)
@@ -112,20 +124,13 @@ class PaymentDetailService:
         for key, value in update_data.items():
             setattr(db_detail, key, value)
             
-        # 3. Recalcular el monto neto si se modificó algún componente base
-        recalculate = any(key in update_data for key in [
-            'monto_base_calculado', 'total_descuentos', 'total_bonificaciones'
-        ])
-        
-        if recalculate:
+        # 3. Recalcular el monto neto si se modificó el monto base
+        if 'monto_base_calculado' in update_data:
             db_detail.monto_neto = self._calculate_monto_neto(
                 db_detail.monto_base_calculado,
                 db_detail.total_bonificaciones,
                 db_detail.total_descuentos
             )
-        # Permite anular monto_neto si se envió explícitamente como None en el update.
-        elif 'monto_neto' in update_data:
-             db_detail.monto_neto = update_data['monto_neto']
 
         try:
             db.add(db_detail)
@@ -145,3 +150,67 @@ class PaymentDetailService:
         db.delete(db_detail)
         db.commit()
         return {"message": f"Detalle de Pago con ID {detail_id} eliminado exitosamente."}
+
+    def reconcile_period_totals(self, db: Session, period_id: int, reparar: bool = True,
+                                progreso: Optional[Callable[[int, str], None]] = None) -> ReconciliationResponse:
+        """
+        Verifica que los totales de cada detalle del período coincidan con la suma de
+        sus componentes (una consulta agrupada) y, si `reparar`, corrige los que
+        difieren con una actualización masiva por ID. monto_neto se recalcula para
+        los detalles corregidos.
+        `progreso`: ver ContextoJob.progreso (todo se confirma al final).
+        Lanza 404 si el período no existe y 409 si está archivado (sus pagos ya no se modifican).
+        """
+        period = db.get(PayrollPeriod, period_id)
+        if not period:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"El período de nómina con ID {period_id} no existe.")
+        if period.archivado:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                                detail=f"El período de nómina con ID {period_id} está archivado.")
+
+        bonificaciones, descuentos = totales_componentes_sql()
+        filas = db.execute(
+            select(PaymentDetail.id, PaymentDetail.monto_base_calculado,
+                   PaymentDetail.total_bonificaciones, PaymentDetail.total_descuentos,
+                   bonificaciones.label("bonificaciones"), descuentos.label("descuentos"))
+            .outerjoin(PayComponent, PayComponent.payment_detail_id == PaymentDetail.id)
+            .where(PaymentDetail.period_id == period_id)
+            .group_by(PaymentDetail.id, PaymentDetail.monto_base_calculado,
+                      PaymentDetail.total_bonificaciones, PaymentDetail.total_descuentos)
+        ).all()
+
+        corregidos = []
+        for fila in filas:
+            esperado_bonificaciones = Decimal(fila.bonificaciones).quantize(Decimal("0.01"))
+            esperado_descuentos = Decimal(fila.descuentos).quantize(Decimal("0.01"))
+            if (Decimal(fila.total_bonificaciones or 0) != esperado_bonificaciones
+                    or Decimal(fila.total_descuentos or 0) != esperado_descuentos):
+                corregidos.append(TotalesCorregidos(
+                    detail_id=fila.id,
+                    total_bonificaciones_anterior=fila.total_bonificaciones,
+                    total_descuentos_anterior=fila.total_descuentos,
+                    total_bonificaciones=esperado_bonificaciones,
+                    total_descuentos=esperado_descuentos,
+                    monto_neto=self._calculate_monto_neto(
+                        Decimal(fila.monto_base_calculado or 0), esperado_bonificaciones, esperado_descuentos
+                    ),
+                ))
+
+        if reparar and corregidos:
+            if progreso:
+                progreso(60, f"Corrigiendo {len(corregidos)} de {len(filas)} detalles")
+            try:
+                db.execute(update(PaymentDetail), [
+                    {"id": c.detail_id, "total_bonificaciones": c.total_bonificaciones,
+                     "total_descuentos": c.total_descuentos, "monto_neto": c.monto_neto}
+                    for c in corregidos
+                ])
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                    detail=f"Error al corregir los totales del período: {str(e)}")
+
+        return ReconciliationResponse(period_id=period_id, revisados=len(filas),
+                                      reparado=reparar and bool(corregidos), corregidos=corregidos)
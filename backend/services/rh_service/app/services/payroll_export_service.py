@@ -0,0 +1,111 @@
+# rh_service/app/services/payroll_export_service.py
+
+import csv
+import io
+import json
+from collections import defaultdict
+from typing import Dict, Iterator, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.employee import Employee
+from app.models.payroll_period import PayrollPeriod
+from app.services.archive_service import tablas_pago
+from app.services.payroll_period_service import PayrollPeriodService
+
+# Filas de detalle que se leen del cursor por lote (y componentes consultados por lote)
+TAMANO_LOTE_EXPORTACION = 500
+
+COLUMNAS_DETALLE = (
+    "detail_id", "employee_id", "nombre", "apellido", "horas_totales_trabajadas",
+    "monto_base_calculado", "total_bonificaciones", "total_descuentos", "monto_neto",
+)
+COLUMNAS_CSV = COLUMNAS_DETALLE + (
+    "componente_id", "componente_tipo", "componente_descripcion", "componente_monto",
+)
+
+
+class PayrollExportService:
+    """
+    Exportación en streaming de los detalles de pago de un período con sus componentes.
+    """
+
+    def __init__(self):
+        self.period_service = PayrollPeriodService()
+
+    def validar_periodo(self, db: Session, period_id: int) -> None:
+        """Lanza 404 antes de empezar a transmitir si el período no existe."""
+        self.period_service.get_period_by_id(db, period_id)
+
+    def _lotes(self, period_id: int) -> Iterator[List[dict]]:
+        """
+        Recorre los detalles del período (con el nombre del empleado) con un cursor
+        del servidor (`yield_per`), sin materializar el resultado completo, y para
+        cada lote consulta sus componentes con un IN acotado. Los períodos archivados
+        se leen de las tablas de archivo.
+
+        Usa sesiones propias: la respuesta se transmite después de que termina la
+        petición. Los componentes van por otra conexión porque, en MySQL, no se puede
+        consultar por la misma conexión mientras el cursor del servidor sigue abierto.
+        """
+        db_detalles, db_componentes = SessionLocal(), SessionLocal()
+        try:
+            period = db_detalles.get(PayrollPeriod, period_id)
+            if period is None:
+                return
+            Detalle, Componente = tablas_pago(period)
+            resultado = db_detalles.execute(
+                select(Detalle.id.label("detail_id"), Detalle.employee_id,
+                       Employee.nombre, Employee.apellido, Detalle.horas_totales_trabajadas,
+                       Detalle.monto_base_calculado, Detalle.total_bonificaciones,
+                       Detalle.total_descuentos, Detalle.monto_neto)
+                .join(Employee, Detalle.employee_id == Employee.id)
+                .where(Detalle.period_id == period_id)
+                .order_by(Detalle.id)
+                .execution_options(yield_per=TAMANO_LOTE_EXPORTACION)
+            )
+            for particion in resultado.partitions():
+                detalles = [dict(fila._mapping) for fila in particion]
+                componentes: Dict[int, List[dict]] = defaultdict(list)
+                for c in db_componentes.execute(
+                    select(Componente.id, Componente.payment_detail_id, Componente.tipo,
+                           Componente.descripcion, Componente.monto)
+                    .where(Componente.payment_detail_id.in_([d["detail_id"] for d in detalles]))
+                    .order_by(Componente.id)
+                ):
+                    componentes[c.payment_detail_id].append(
+                        {"id": c.id, "tipo": c.tipo, "descripcion": c.descripcion, "monto": c.monto}
+                    )
+                for d in detalles:
+                    d["componentes"] = componentes.get(d["detail_id"], [])
+                yield detalles
+        finally:
+            db_componentes.close()
+            db_detalles.close()
+
+    def exportar_csv(self, period_id: int) -> Iterator[str]:
+        """
+        CSV con una fila por componente (los datos del detalle se repiten); un detalle
+        sin componentes ocupa una fila con las columnas de componente vacías.
+        El encabezado se envía antes de la primera consulta.
+        """
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer)
+        escritor.writerow(COLUMNAS_CSV)
+        yield buffer.getvalue()
+
+        for lote in self._lotes(period_id):
+            buffer.seek(0)
+            buffer.truncate()
+            for d in lote:
+                base = [d[c] for c in COLUMNAS_DETALLE]
+                for c in d["componentes"] or [None]:
+                    escritor.writerow(base + ([c["id"], c["tipo"], c["descripcion"], c["monto"]] if c else [None] * 4))
+            yield buffer.getvalue()
+
+    def exportar_ndjson(self, period_id: int) -> Iterator[str]:
+        """NDJSON: un objeto JSON por detalle, con la lista de sus componentes."""
+        for lote in self._lotes(period_id):
+            yield "".join(json.dumps(d, default=str, ensure_ascii=False) + "\n" for d in lote)
@@ -7,7 +7,10 @@ from datetime import date,timedelta
 
 # Importa el modelo ORM (tabla) y los schemas Pydantic
 from app.models.payroll_period import PayrollPeriod
-from app.schemas.payroll_period import PayrollPeriodCreate, PayrollPeriodUpdate
+from app.schemas.payroll_period import PayrollPeriodCreate, PayrollPeriodResponse, PayrollPeriodUpdate
+from app.utils.pagination import Pagina, paginate
+from app.utils.query_cache import cache_consulta
+from app.utils.session_cache import memo_sesion
 
 class PayrollPeriodService:
     """
@@ -20,7 +23,7 @@ class PayrollPeriodService:
         Obtiene un período de nómina por su ID.
         Lanza 404 si no se encuentra.
         """
-        period = db.query(PayrollPeriod).filter(PayrollPeriod.id == period_id).first()
+        period = db.get(PayrollPeriod, period_id)
         if not period:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Período de nómina con ID {period_id} no encontrado.")
@@ -30,8 +33,17 @@ class PayrollPeriodService:
         """
         Obtiene una lista paginada de todos los períodos de nómina, ordenados por fecha de inicio.
         """
-        # Se asume que el ORM de PayrollPeriod tiene un campo 'fecha_inicio' para ordenar
-        return db.query(PayrollPeriod).order_by(PayrollPeriod.fecha_inicio.desc()).offset(skip).limit(limit).all()
+        return self.get_periods_page(db, skip=skip, limit=limit).items
+
+    def get_periods_page(self, db: Session, skip: int = 0, limit: int = 100,
+                         after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de períodos ordenada por fecha de inicio descendente
+        (desempate por ID), por offset o por cursor (`after`).
+        Usa el índice compuesto (fecha_inicio, id).
+        """
+        return paginate(db.query(PayrollPeriod), keys=(PayrollPeriod.fecha_inicio, PayrollPeriod.id),
+                        skip=skip, limit=limit, after=after, descending=True)
 
     def create_period(self, db: Session, period: PayrollPeriodCreate) -> PayrollPeriod:
         """
@@ -99,19 +111,23 @@ class PayrollPeriodService:
         db_period = self.get_period_by_id(db, period_id)
         
         # Lógica de negocio: Verificar si existen PaymentDetails asociados antes de eliminar
-        if db_period.details:
+        if db_period.archivado or db_period.details:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, 
                                 detail="No se puede eliminar el período: tiene detalles de pago asociados.")
 
         db.delete(db_period)
         db.commit()
         return {"message": f"Período de nómina con ID {period_id} eliminado exitosamente."}
-    def get_next_closure_period(self, db: Session) -> Optional[PayrollPeriod]:
+    @memo_sesion(PayrollPeriod)
+    @cache_consulta(PayrollPeriod, esquema=PayrollPeriodResponse, por_dia=True)
+    def get_next_closure_period(self, db: Session) -> Optional[PayrollPeriodResponse]:
         """
         Obtiene el próximo período de nómina activo (no finalizado) 
         que tiene la fecha de corte de revisión más cercana o en el futuro.
         
-        Este es el período clave para métricas y alertas.
+        Este es el período clave para métricas y alertas. El resultado (de solo
+        lectura) se cachea por día entre peticiones y se invalida si se modifica
+        algún período.
         """
         today = date.today()
         
@@ -0,0 +1,128 @@
+# rh_service/app/services/payroll_run_service.py
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.models.pay_component import PayComponent
+from app.models.payment_detail import PaymentDetail
+from app.schemas.schema_payment_detail import PayrollRunResponse
+from app.services.archive_service import tabla_turnos
+from app.services.pay_component_service import totales_componentes_sql
+from app.services.payroll_period_service import PayrollPeriodService
+from app.utils.config import settings
+from app.utils.sql_functions import segundos_del_dia, upsert
+
+CENTAVOS = Decimal("0.01")
+
+# Días de un mes de referencia para prorratear el salario fijo a la duración del período
+DIAS_MES_REFERENCIA = 30
+
+
+def _redondear(valor: Decimal) -> Decimal:
+    return valor.quantize(CENTAVOS, rounding=ROUND_HALF_UP)
+
+
+class PayrollRunService:
+    """
+    Cálculo de la nómina de un período completo (todos los empleados a la vez).
+    """
+
+    def __init__(self):
+        self.period_service = PayrollPeriodService()
+
+    def run_payroll(self, db: Session, period_id: int,
+                    progreso: Optional[Callable[[int, str], None]] = None) -> PayrollRunResponse:
+        """
+        Calcula y guarda el detalle de pago de cada empleado en el período, en una
+        sola transacción y con consultas agregadas (sin cargar turnos ni componentes):
+
+        - horas: suma de la duración de los turnos cubiertos del período (en SQL);
+        - monto base: horas * tarifa_hora, o para salario fijo tarifa_hora * horas
+          de un mes (`PAYROLL_HORAS_MES_SALARIO_FIJO`) prorrateado por los días del período;
+        - bonificaciones y descuentos: suma de los componentes ya registrados;
+        - un único upsert por (empleado, período) para todas las filas.
+
+        Volver a ejecutarlo recalcula los mismos detalles (no crea duplicados).
+        `progreso`: ver ContextoJob.progreso (todo se confirma al final).
+        Incluye a los empleados activos y a los inactivos con turnos en el período.
+        Lanza 404 si el período no existe y 409 si ya está finalizado.
+        """
+        period = self.period_service.get_period_by_id(db, period_id)
+        if period.finalizado:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                                detail=f"El período de nómina con ID {period_id} ya está finalizado.")
+
+        # Incluye los turnos archivados si el período llega a meses ya archivados
+        turnos = tabla_turnos(db, period.fecha_inicio, period.fecha_fin)
+        segundos = func.sum(segundos_del_dia(turnos.c.hora_fin_real) - segundos_del_dia(turnos.c.hora_inicio_real))
+        horas_por_empleado = select(turnos.c.assigned_employee_id.label("employee_id"), segundos.label("segundos")) \
+            .where(turnos.c.is_covered == True, turnos.c.assigned_employee_id.isnot(None)) \
+            .group_by(turnos.c.assigned_employee_id).subquery()
+
+        empleados = db.execute(
+            select(Employee.id, Employee.tarifa_hora, Employee.es_salario_fijo, horas_por_empleado.c.segundos)
+            .outerjoin(horas_por_empleado, horas_por_empleado.c.employee_id == Employee.id)
+            .where(or_(Employee.is_active == True, horas_por_empleado.c.segundos.isnot(None)))
+        ).all()
+
+        if progreso:
+            progreso(40, "Horas por empleado calculadas")
+
+        bonificaciones, descuentos = totales_componentes_sql()
+        totales = {
+            fila.employee_id: (Decimal(fila.bonificaciones), Decimal(fila.descuentos))
+            for fila in db.execute(
+                select(PaymentDetail.employee_id, bonificaciones.label("bonificaciones"),
+                       descuentos.label("descuentos"))
+                .join(PayComponent, PayComponent.payment_detail_id == PaymentDetail.id)
+                .where(PaymentDetail.period_id == period_id)
+                .group_by(PaymentDetail.employee_id)
+            )
+        }
+
+        dias_periodo = (period.fecha_fin - period.fecha_inicio).days + 1
+        salario_fijo_factor = Decimal(settings.PAYROLL_HORAS_MES_SALARIO_FIJO * dias_periodo) / DIAS_MES_REFERENCIA
+        filas = []
+        for employee_id, tarifa, es_salario_fijo, segundos_trabajados in empleados:
+            tarifa = Decimal(tarifa or 0)
+            if es_salario_fijo:
+                horas = None
+                monto_base = _redondear(tarifa * salario_fijo_factor)
+            else:
+                horas = _redondear(Decimal(segundos_trabajados or 0) / 3600)
+                monto_base = _redondear(horas * tarifa)
+            total_bonificaciones, total_descuentos = totales.get(employee_id, (Decimal("0"), Decimal("0")))
+            filas.append({
+                "employee_id": employee_id,
+                "period_id": period_id,
+                "horas_totales_trabajadas": horas,
+                "monto_base_calculado": monto_base,
+                "total_bonificaciones": _redondear(total_bonificaciones),
+                "total_descuentos": _redondear(total_descuentos),
+                "monto_neto": _redondear(monto_base + total_bonificaciones - total_descuentos),
+            })
+
+        if progreso:
+            progreso(80, f"Guardando {len(filas)} detalles de pago")
+        try:
+            upsert(db, PaymentDetail, filas, claves=("employee_id", "period_id"), actualizar=(
+                "horas_totales_trabajadas", "monto_base_calculado",
+                "total_bonificaciones", "total_descuentos", "monto_neto",
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                detail=f"Error al ejecutar la nómina del período: {str(e)}")
+
+        return PayrollRunResponse(
+            period_id=period_id,
+            empleados=len(filas),
+            monto_base_total=sum((f["monto_base_calculado"] for f in filas), Decimal("0")),
+            monto_neto_total=sum((f["monto_neto"] for f in filas), Decimal("0")),
+        )
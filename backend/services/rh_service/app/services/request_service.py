@@ -2,7 +2,7 @@
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 from sqlalchemy.exc import IntegrityError
 from datetime import date
 
@@ -10,6 +10,7 @@ from datetime import date
 from app.models.request import Request
 from app.schemas.request import RequestCreate, RequestUpdate
 from app.models.employee import Employee # Necesario para verificar la FK
+from app.utils.pagination import Pagina, paginate
 
 class RequestService:
     """
@@ -22,7 +23,7 @@ class RequestService:
         Obtiene una solicitud por su ID.
         Lanza 404 si no se encuentra.
         """
-        request = db.query(Request).filter(Request.id == request_id).first()
+        request = db.get(Request, request_id)
         if not request:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Solicitud con ID {request_id} no encontrada.")
@@ -38,7 +39,17 @@ class RequestService:
         """
         Obtiene una lista paginada de todas las solicitudes, ordenadas por fecha.
         """
-        return db.query(Request).order_by(Request.fecha_solicitud.desc()).offset(skip).limit(limit).all()
+        return self.get_requests_page(db, skip=skip, limit=limit).items
+
+    def get_requests_page(self, db: Session, skip: int = 0, limit: int = 100,
+                          after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de solicitudes ordenada por fecha de solicitud descendente
+        (desempate por ID), por offset o por cursor (`after`).
+        Usa el índice compuesto (fecha_solicitud, id).
+        """
+        return paginate(db.query(Request), keys=(Request.fecha_solicitud, Request.id),
+                        skip=skip, limit=limit, after=after, descending=True)
 
     def create_request(self, db: Session, request: RequestCreate) -> Request:
         """
@@ -48,7 +59,7 @@ class RequestService:
         2. Validar que la fecha de inicio sea anterior a la de fin.
         """
         # Lógica de negocio 1: Verificar que el employee_id exista (FK)
-        employee_exists = db.query(Employee).filter(Employee.id == request.employee_id).first()
+        employee_exists = db.get(Employee, request.employee_id)
         if not employee_exists:
              raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                  detail=f"El empleado con ID {request.employee_id} no existe.")
@@ -1,9 +1,11 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 from app.models.role import Role
 from app.schemas.schema_role import RoleCreate,RoleResponse,RoleUpdate
+from app.utils.pagination import Pagina, paginate
+from app.utils.query_cache import cache_consulta
 
 class RoleService:
     """
@@ -13,7 +15,7 @@ class RoleService:
     def get_role_by_id(self, db:Session, role_id : int)->Role:
         
         """Busca los roles por id"""
-        role=db.query(Role).filter(Role.id==role_id).first()
+        role=db.get(Role,role_id)
         if not role:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Id de rol no es valido {role_id}")
         return role 
@@ -21,7 +23,14 @@ class RoleService:
         """
         obtiene lista de todos los roles
         """
-        return db.query(Role).offset(skip).limit(limit).all()
+        return self.get_roles_page(db, skip=skip, limit=limit).items
+    @cache_consulta(Role, esquema=RoleResponse)
+    def get_roles_page(self, db:Session, skip:int=0, limit:int=100, after:Optional[str]=None)->Pagina:
+        """
+        pagina de roles ordenada por id, por offset o por cursor (after)
+        se cachea entre peticiones hasta que cambie la tabla de roles
+        """
+        return paginate(db.query(Role), keys=(Role.id,), skip=skip, limit=limit, after=after)
     def create_role(self,db:Session,role:RoleCreate)->Role:
         """creamos roles para ser asignados a los empleados"""
         db_role=Role(
@@ -1,15 +1,80 @@
 # rh_service/app/services/shift_service.py
 
+import heapq
+from collections import defaultdict
+from itertools import count
+from sqlalchemy import and_, inspect, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from datetime import time, date, timedelta
 from sqlalchemy.exc import IntegrityError
 
 # Importa modelos y schemas
 from app.models.shift import Shift
 from app.models.employee import Employee
-from app.schemas.schema_shift import ShiftCreate, ShiftUpdate, ShiftAssign
+from app.models.shift_archive import ShiftArchive
+from app.schemas.schema_shift import (
+    ShiftCreate, ShiftUpdate, ShiftAssign, ShiftResponse, ShiftAssignmentCheck, ShiftConflictResponse,
+)
+from app.services.archive_service import incluye_archivo
+from app.utils.change_events import UPDATE, Cambio, al_cambiar
+from app.utils.event_hub import encolar_evento
+from app.utils.pagination import Pagina, paginate
+from app.utils.projection import Campo, Proyeccion
+from app.utils.query_cache import cache_consulta
+
+
+def solapa_con(inicio: time, fin: time):
+    """Condición SQL: el turno se solapa con el intervalo [inicio, fin) del mismo día."""
+    return and_(Shift.hora_inicio_real < fin, Shift.hora_fin_real > inicio)
+
+
+# Campos cuyo cambio se informa a los clientes conectados como cambio de cobertura
+CAMPOS_COBERTURA = ("fecha", "hora_inicio_real", "hora_fin_real", "assigned_employee_id", "is_covered")
+
+# Listado compacto (`?fields=` / `?vista=resumen`), con el nombre del empleado asignado
+PROYECCION_TURNOS = Proyeccion(
+    Shift,
+    campos={
+        "id": Campo(Shift.id),
+        "fecha": Campo(Shift.fecha),
+        "hora_inicio_real": Campo(Shift.hora_inicio_real),
+        "hora_fin_real": Campo(Shift.hora_fin_real),
+        "puesto_requerido": Campo(Shift.puesto_requerido),
+        "assigned_employee_id": Campo(Shift.assigned_employee_id),
+        "is_covered": Campo(Shift.is_covered),
+        "es_alteracion": Campo(Shift.es_alteracion),
+        "notas": Campo(Shift.notas),
+        "empleado_nombre": Campo(Employee.nombre, join="empleado"),
+        "empleado_apellido": Campo(Employee.apellido, join="empleado"),
+    },
+    resumen=("fecha", "hora_inicio_real", "hora_fin_real", "puesto_requerido",
+             "assigned_employee_id", "is_covered"),
+    joins={"empleado": (Employee, Shift.assigned_employee_id == Employee.id)},
+)
+
+
+@al_cambiar(Shift)
+def _publicar_cobertura(session: Session, cambios: List[Cambio]) -> None:
+    """Evento `turno` (tras el commit) por cada turno creado, eliminado o con cambio de cobertura."""
+    for cambio in cambios:
+        s = cambio.instancia
+        estado = inspect(s)
+        if cambio.operacion == UPDATE and not any(
+            estado.attrs[campo].history.has_changes() for campo in CAMPOS_COBERTURA
+        ):
+            continue
+        encolar_evento(session, "turno", {
+            "operacion": cambio.operacion,
+            "id": s.id,
+            "fecha": s.fecha,
+            "hora_inicio_real": s.hora_inicio_real,
+            "hora_fin_real": s.hora_fin_real,
+            "puesto_requerido": s.puesto_requerido,
+            "assigned_employee_id": s.assigned_employee_id,
+            "is_covered": bool(s.is_covered),
+        })
 
 
 class ShiftService:
@@ -18,12 +83,15 @@ class ShiftService:
     Turnos de Trabajo (Shift), incluyendo la asignación de empleados.
     """
 
-    def get_shift_by_id(self, db: Session, shift_id: int) -> Shift:
+    def get_shift_by_id(self, db: Session, shift_id: int, archivo: bool = False) -> Shift:
         """
-        Obtiene un turno por su ID.
+        Obtiene un turno por su ID. Con `archivo`, si no está en la tabla principal se
+        busca en `shifts_archive` (solo lectura: las escrituras no lo piden).
         Lanza 404 si no se encuentra.
         """
-        shift = db.query(Shift).filter(Shift.id == shift_id).first()
+        shift = db.get(Shift, shift_id)
+        if not shift and archivo:
+            shift = db.get(ShiftArchive, shift_id)
         if not shift:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Turno con ID {shift_id} no encontrado.")
@@ -31,21 +99,54 @@ class ShiftService:
 
     def get_shifts_by_employee(self, db: Session, employee_id: int) -> List[Shift]:
         """
-        Obtiene todos los turnos asignados a un empleado específico.
+        Obtiene todos los turnos asignados a un empleado específico, incluidos los
+        archivados si el archivo tiene turnos (índice empleado/fecha en ambas tablas).
         """
-        return db.query(Shift).filter(Shift.assigned_employee_id == employee_id).all()
+        turnos = db.query(Shift).filter(Shift.assigned_employee_id == employee_id).all()
+        if incluye_archivo(db, None):
+            turnos += db.query(ShiftArchive).filter(ShiftArchive.assigned_employee_id == employee_id).all()
+        return turnos
 
-    def get_shifts_by_date(self, db: Session, target_date: date) -> List[Shift]:
+    @cache_consulta(Shift, ShiftArchive, esquema=ShiftResponse)
+    def get_shifts_by_date(self, db: Session, target_date: date) -> List[ShiftResponse]:
         """
-        Obtiene todos los turnos programados para una fecha específica.
+        Obtiene todos los turnos programados para una fecha específica (típicamente hoy).
+        Si la fecha pertenece a un mes archivado, incluye los turnos de `shifts_archive`.
+        El resultado se cachea entre peticiones hasta que se modifique algún turno.
         """
-        return db.query(Shift).filter(Shift.fecha == target_date).all()
+        turnos = db.query(Shift).filter(Shift.fecha == target_date).all()
+        if incluye_archivo(db, target_date):
+            turnos += db.query(ShiftArchive).filter(ShiftArchive.fecha == target_date).all()
+        return turnos
 
     def get_all_shifts(self, db: Session, skip: int = 0, limit: int = 100) -> List[Shift]:
         """
         Obtiene una lista paginada de todos los turnos.
         """
-        return db.query(Shift).offset(skip).limit(limit).all()
+        return self.get_shifts_page(db, skip=skip, limit=limit).items
+
+    def get_shifts_page(self, db: Session, skip: int = 0, limit: int = 100,
+                        after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de turnos ordenada por ID, por offset o por cursor (`after`).
+        """
+        return paginate(db.query(Shift), keys=(Shift.id,), skip=skip, limit=limit, after=after)
+
+    def get_shifts_proyectados(self, db: Session, campos: List[str], employee_id: Optional[int] = None,
+                               target_date: Optional[date] = None, skip: int = 0, limit: int = 100,
+                               after: Optional[str] = None) -> Pagina:
+        """
+        Listado compacto de turnos (solo `campos`, como diccionarios) con los mismos
+        filtros que el listado completo: por empleado o fecha (todos, sin paginar)
+        o una página de todos los turnos.
+        """
+        if employee_id is not None:
+            filas = PROYECCION_TURNOS.todos(db, campos, Shift.assigned_employee_id == employee_id)
+            return Pagina(items=filas, next_cursor=None)
+        if target_date is not None:
+            filas = PROYECCION_TURNOS.todos(db, campos, Shift.fecha == target_date)
+            return Pagina(items=filas, next_cursor=None)
+        return PROYECCION_TURNOS.pagina(db, campos, skip=skip, limit=limit, after=after)
 
     def _validate_shift_times(self, start_time: time, end_time: time):
         """
@@ -60,11 +161,37 @@ class ShiftService:
         Función auxiliar para verificar si el empleado existe.
         """
         if employee_id is not None:
-            employee_exists = db.query(Employee).filter(Employee.id == employee_id).first()
+            employee_exists = db.get(Employee, employee_id)
             if not employee_exists:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                     detail=f"El empleado con ID {employee_id} no existe.")
 
+    def _validate_no_overlap(self, db: Session, employee_id: Optional[int], fecha: date,
+                             inicio: time, fin: time, excluir_shift_id: Optional[int] = None):
+        """
+        Función auxiliar para verificar que el empleado no tenga otro turno que se
+        solape ese día. Usa el índice (assigned_employee_id, fecha), así que solo lee
+        los turnos del empleado en esa fecha. Bloquea la fila del empleado para que
+        dos asignaciones concurrentes no pasen ambas la validación.
+        Lanza 409 si hay conflicto.
+        """
+        if employee_id is None:
+            return
+        db.execute(select(Employee.id).where(Employee.id == employee_id).with_for_update())
+
+        query = db.query(Shift.id, Shift.hora_inicio_real, Shift.hora_fin_real).filter(
+            Shift.assigned_employee_id == employee_id,
+            Shift.fecha == fecha,
+            solapa_con(inicio, fin),
+        )
+        if excluir_shift_id is not None:
+            query = query.filter(Shift.id != excluir_shift_id)
+        conflicto = query.first()
+        if conflicto:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                                detail=f"El empleado {employee_id} ya tiene el turno {conflicto.id} el {fecha} "
+                                       f"de {conflicto.hora_inicio_real} a {conflicto.hora_fin_real}.")
+
     def create_shift(self, db: Session, shift_data: ShiftCreate) -> Shift:
         """
         Crea o planifica un nuevo turno.
@@ -74,6 +201,10 @@ class ShiftService:
 
         #  Verificar la FK (si está asignado inicialmente)
         self._validate_employee_id(db, shift_data.assigned_employee_id)
+
+        #  Verificar que el empleado no tenga otro turno a la misma hora
+        self._validate_no_overlap(db, shift_data.assigned_employee_id, shift_data.fecha,
+                                  shift_data.hora_inicio_real, shift_data.hora_fin_real)
         
         # Determinar el estado de cobertura (is_covered)
         is_covered = shift_data.assigned_employee_id is not None
@@ -108,6 +239,9 @@ class ShiftService:
         
         # Verificar que el empleado exista
         self._validate_employee_id(db, assignment_data.assigned_employee_id)
+        self._validate_no_overlap(db, assignment_data.assigned_employee_id, db_shift.fecha,
+                                  db_shift.hora_inicio_real, db_shift.hora_fin_real,
+                                  excluir_shift_id=shift_id)
         
         db_shift.assigned_employee_id = assignment_data.assigned_employee_id
         db_shift.is_covered = True # Siempre True al asignar
@@ -143,6 +277,17 @@ class ShiftService:
             fin = update_data.get('hora_fin_real', db_shift.hora_fin_real)
             self._validate_shift_times(inicio, fin)
 
+        # Validar solapamiento si cambia el empleado, la fecha o el horario
+        if update_data.keys() & {'assigned_employee_id', 'fecha', 'hora_inicio_real', 'hora_fin_real'}:
+            self._validate_no_overlap(
+                db,
+                update_data.get('assigned_employee_id', db_shift.assigned_employee_id),
+                update_data.get('fecha', db_shift.fecha),
+                update_data.get('hora_inicio_real', db_shift.hora_inicio_real),
+                update_data.get('hora_fin_real', db_shift.hora_fin_real),
+                excluir_shift_id=shift_id,
+            )
+
         # Copia los datos actualizados al objeto ORM
         for key, value in update_data.items():
             setattr(db_shift, key, value)
@@ -171,6 +316,63 @@ class ShiftService:
         db.commit()
         return {"message": f"Turno con ID {shift_id} eliminado exitosamente."}
 
+    def validate_assignments_batch(self, db: Session,
+                                   asignaciones: List[ShiftAssignmentCheck]) -> List[ShiftConflictResponse]:
+        """
+        Valida en una pasada un lote de asignaciones (p. ej. la planificación de una
+        semana) contra los turnos existentes y entre sí, sin guardar nada.
+
+        Lee con una sola consulta indexada los turnos de los empleados del lote en el
+        rango de fechas y, por cada (empleado, fecha), recorre los intervalos ordenados
+        por inicio manteniendo en un heap los que siguen abiertos (barrido): O(n log n).
+        Los turnos existentes que el lote reasigna (`shift_id`) se reemplazan por la
+        nueva asignación. Lanza 400 si alguna asignación tiene horas inválidas.
+        """
+        # (empleado, fecha) -> [(inicio, fin, índice en el lote | None, id del turno existente | None)]
+        intervalos: Dict[Tuple[int, date], list] = defaultdict(list)
+        for i, a in enumerate(asignaciones):
+            if a.hora_inicio_real >= a.hora_fin_real:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=f"Asignación {i}: la hora de inicio debe ser anterior a la de fin.")
+            intervalos[(a.assigned_employee_id, a.fecha)].append((a.hora_inicio_real, a.hora_fin_real, i, None))
+        if not intervalos:
+            return []
+
+        reasignados = {a.shift_id for a in asignaciones if a.shift_id is not None}
+        fechas = [fecha for _, fecha in intervalos]
+        existentes = db.query(Shift.id, Shift.assigned_employee_id, Shift.fecha,
+                              Shift.hora_inicio_real, Shift.hora_fin_real).filter(
+            Shift.assigned_employee_id.in_({employee_id for employee_id, _ in intervalos}),
+            Shift.fecha.between(min(fechas), max(fechas)),
+        )
+        for turno in existentes:
+            clave = (turno.assigned_employee_id, turno.fecha)
+            if turno.id not in reasignados and clave in intervalos:
+                intervalos[clave].append((turno.hora_inicio_real, turno.hora_fin_real, None, turno.id))
+
+        conflictos: List[ShiftConflictResponse] = []
+        desempate = count()
+        for (employee_id, fecha), lista in intervalos.items():
+            lista.sort(key=lambda x: (x[0], x[1]))
+            abiertos: list = []  # heap de (fin, desempate, índice, shift_id)
+            for inicio, fin, indice, shift_id in lista:
+                while abiertos and abiertos[0][0] <= inicio:
+                    heapq.heappop(abiertos)
+                for _, _, otro_indice, otro_shift_id in abiertos:
+                    if indice is None and otro_indice is None:
+                        continue  # Conflicto previo entre turnos existentes: no es del lote
+                    conflictos.append(ShiftConflictResponse(
+                        indice=indice if indice is not None else otro_indice,
+                        employee_id=employee_id,
+                        fecha=fecha,
+                        shift_id_existente=shift_id if indice is None else otro_shift_id,
+                        indice_en_lote=otro_indice if indice is not None else None,
+                    ))
+                heapq.heappush(abiertos, (fin, next(desempate), indice, shift_id))
+
+        conflictos.sort(key=lambda c: c.indice)
+        return conflictos
+
     # ✅ CORRECCIÓN: Este método debe estar DENTRO de la clase
     def get_uncovered_shifts_in_future(self, db: Session, days_ahead: int = 7) -> List[Shift]:
         """
@@ -1,16 +1,18 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 from app.models.sucursal import Sucursal
 from app.schemas.schema_sucursal import SucursalCreate, SucursalResponse, SucursalUpdate
+from app.utils.pagination import Pagina, paginate
+from app.utils.query_cache import cache_consulta
 
 class SucursalService:
     # Lógica para sucursales
 
     def get_sucursales_by_id(self, db: Session, sucursales_id: int) -> Sucursal:
         # Obtener sucursal por id 
-        sucursal = db.query(Sucursal).filter(Sucursal.id == sucursales_id).first()
+        sucursal = db.get(Sucursal, sucursales_id)
         if not sucursal:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
@@ -20,7 +22,14 @@ class SucursalService:
 
     def get_all_sucursales(self, db: Session, skip: int = 0, limit: int = 100) -> List[Sucursal]:
         # Obtiene una lista de las sucursales
-        return db.query(Sucursal).offset(skip).limit(limit).all()
+        return self.get_sucursales_page(db, skip=skip, limit=limit).items
+
+    @cache_consulta(Sucursal, esquema=SucursalResponse)
+    def get_sucursales_page(self, db: Session, skip: int = 0, limit: int = 100,
+                            after: Optional[str] = None) -> Pagina:
+        # Página de sucursales ordenada por id, por offset o por cursor (after)
+        # Se cachea entre peticiones hasta que cambie la tabla de sucursales
+        return paginate(db.query(Sucursal), keys=(Sucursal.id,), skip=skip, limit=limit, after=after)
 
     def create_sucursal(self, db: Session, sucursal: SucursalCreate) -> Sucursal:
         # Crear una sucursal
@@ -2,7 +2,7 @@
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import List, Optional
 from datetime import date,timedelta
 from sqlalchemy.exc import IntegrityError
 
@@ -10,6 +10,27 @@ from sqlalchemy.exc import IntegrityError
 from app.models.training import Training
 from app.models.employee import Employee 
 from app.schemas.schema_training import TrainingCreate, TrainingUpdate
+from app.utils.pagination import Pagina, paginate
+from app.utils.projection import Campo, Proyeccion
+
+
+# Listado compacto (`?fields=` / `?vista=resumen`), con el nombre del empleado
+PROYECCION_CAPACITACIONES = Proyeccion(
+    Training,
+    campos={
+        "id": Campo(Training.id),
+        "employee_id": Campo(Training.employee_id),
+        "nombre_capacitacion": Campo(Training.nombre_capacitacion),
+        "fecha_asignacion": Campo(Training.fecha_asignacion),
+        "fecha_limite": Campo(Training.fecha_limite),
+        "completado": Campo(Training.completado),
+        "certificado_url": Campo(Training.certificado_url),
+        "empleado_nombre": Campo(Employee.nombre, join="empleado"),
+        "empleado_apellido": Campo(Employee.apellido, join="empleado"),
+    },
+    resumen=("employee_id", "nombre_capacitacion", "fecha_limite", "completado"),
+    joins={"empleado": (Employee, Training.employee_id == Employee.id)},
+)
 
 
 class TrainingService:
@@ -23,7 +44,7 @@ class TrainingService:
         Obtiene un registro de capacitación por su ID.
         Lanza 404 si no se encuentra.
         """
-        training = db.query(Training).filter(Training.id == training_id).first()
+        training = db.get(Training, training_id)
         if not training:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Capacitación con ID {training_id} no encontrada.")
@@ -39,13 +60,31 @@ class TrainingService:
         """
         Obtiene una lista paginada de todos los registros de capacitación.
         """
-        return db.query(Training).offset(skip).limit(limit).all()
+        return self.get_trainings_page(db, skip=skip, limit=limit).items
+
+    def get_trainings_page(self, db: Session, skip: int = 0, limit: int = 100,
+                           after: Optional[str] = None) -> Pagina:
+        """
+        Obtiene una página de capacitaciones ordenada por ID, por offset o por cursor (`after`).
+        """
+        return paginate(db.query(Training), keys=(Training.id,), skip=skip, limit=limit, after=after)
+
+    def get_trainings_proyectados(self, db: Session, campos: List[str], employee_id: Optional[int] = None,
+                                  skip: int = 0, limit: int = 100, after: Optional[str] = None) -> Pagina:
+        """
+        Listado compacto de capacitaciones (solo `campos`, como diccionarios): los de un
+        empleado (todos, sin paginar) o una página de todos.
+        """
+        if employee_id is not None:
+            filas = PROYECCION_CAPACITACIONES.todos(db, campos, Training.employee_id == employee_id)
+            return Pagina(items=filas, next_cursor=None)
+        return PROYECCION_CAPACITACIONES.pagina(db, campos, skip=skip, limit=limit, after=after)
 
     def _validate_employee_id(self, db: Session, employee_id: int):
         """
         Función auxiliar para verificar si el empleado existe.
         """
-        employee_exists = db.query(Employee).filter(Employee.id == employee_id).first()
+        employee_exists = db.get(Employee, employee_id)
         if not employee_exists:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"El empleado con ID {employee_id} no existe.")
@@ -0,0 +1,145 @@
+# rh_service/app/utils/change_events.py
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Operaciones que se informan a los manejadores
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+
+class Cambio(NamedTuple):
+    """Una instancia ORM modificada en un flush y la operación aplicada."""
+    instancia: object
+    operacion: str
+
+
+class EscrituraMasiva(NamedTuple):
+    """
+    Un insert/update/delete masivo (no pasa por el flush): ORM con `session.execute`
+    o SQL Core con `ejecutar_core`. `ids` son las claves primarias afectadas, si se conocen.
+    """
+    tabla: str
+    operacion: str
+    ids: Optional[List[Any]]
+
+
+# Manejadores registrados por modelo: fn(session, cambios)
+_manejadores: Dict[type, List[Callable[[Session, List[Cambio]], None]]] = defaultdict(list)
+# Manejadores que reciben los cambios de cualquier modelo
+_manejadores_globales: List[Callable[[Session, List[Cambio]], None]] = []
+# Manejadores de escrituras masivas de cualquier tabla: fn(session, escritura)
+_manejadores_masivos: List[Callable[[Session, EscrituraMasiva], None]] = []
+
+
+def al_cambiar(*modelos: type):
+    """
+    Decorador que registra un manejador para los cambios de los modelos indicados
+    (sin modelos: para los cambios de cualquier modelo).
+
+    El manejador recibe la sesión y la lista de cambios de ese modelo en cada flush.
+    Se ejecuta dentro de la misma transacción (evento `after_flush`): las instancias
+    nuevas ya tienen su ID y cualquier escritura del manejador se confirma o se
+    revierte junto con el cambio que la originó. Para escribir se debe usar
+    `session.connection()` (SQL Core), nunca operaciones ORM que provoquen otro flush.
+
+        @al_cambiar(Request)
+        def actualizar_alertas(session, cambios): ...
+    """
+    def registrar(fn):
+        if not modelos:
+            _manejadores_globales.append(fn)
+        for modelo in modelos:
+            _manejadores[modelo].append(fn)
+        return fn
+    return registrar
+
+
+@event.listens_for(Session, "after_flush")
+def _despachar_cambios(session: Session, flush_context) -> None:
+    # En after_flush, new/dirty/deleted todavía reflejan el estado previo al flush
+    if not _manejadores and not _manejadores_globales:
+        return
+
+    cambios: Dict[type, List[Cambio]] = defaultdict(list)
+    for instancia in session.new:
+        cambios[type(instancia)].append(Cambio(instancia, INSERT))
+    for instancia in session.dirty:
+        if session.is_modified(instancia, include_collections=False):
+            cambios[type(instancia)].append(Cambio(instancia, UPDATE))
+    for instancia in session.deleted:
+        cambios[type(instancia)].append(Cambio(instancia, DELETE))
+
+    for lista in cambios.values():
+        notificar_cambios(session, lista)
+
+
+def notificar_cambios(session: Session, cambios: Sequence[Cambio]) -> None:
+    """
+    Ejecuta los manejadores de `al_cambiar` para cambios de un mismo modelo. Lo usa
+    el flush y, de forma explícita, las escrituras por SQL Core cuyas filas se releen
+    como instancias (p. ej. una inserción masiva), para que reciban el mismo trato.
+    """
+    lista = list(cambios)
+    if not lista:
+        return
+    for manejador in _manejadores.get(type(lista[0].instancia), ()):
+        manejador(session, lista)
+    for manejador in _manejadores_globales:
+        manejador(session, lista)
+
+
+# ----------------------------------------------------
+# Escrituras masivas
+# ----------------------------------------------------
+
+def al_escribir_masivo(fn):
+    """
+    Decorador que registra un manejador para las escrituras masivas de cualquier
+    tabla. Como los de `al_cambiar`, se ejecuta dentro de la transacción de la escritura.
+    """
+    _manejadores_masivos.append(fn)
+    return fn
+
+
+def notificar_escritura_masiva(session: Session, escritura: EscrituraMasiva) -> None:
+    """
+    Ejecuta los manejadores de escrituras masivas. Lo usan `ejecutar_core` y el
+    despacho de `session.execute`, y de forma explícita una inserción masiva que
+    relee sus claves primarias (p. ej. la generación de turnos).
+    """
+    for manejador in _manejadores_masivos:
+        manejador(session, escritura)
+
+
+def _despachar_masiva(session: Session, sentencia, parametros, ids: Optional[Sequence[Any]] = None) -> None:
+    operacion = INSERT if sentencia.is_insert else UPDATE if sentencia.is_update else DELETE
+    if ids is None and isinstance(parametros, list) and parametros \
+            and all(p.get("id") is not None for p in parametros):
+        ids = [p["id"] for p in parametros]
+    notificar_escritura_masiva(
+        session, EscrituraMasiva(sentencia.table.name, operacion, list(ids) if ids is not None else None)
+    )
+
+
+def ejecutar_core(session: Session, sentencia, parametros=None, ids: Optional[Sequence[Any]] = None):
+    """
+    Ejecuta un insert/update/delete de SQL Core con `session.connection()` (misma
+    transacción, sin flush) e informa a los manejadores de escrituras masivas, que de
+    otro modo no lo verían (caché de consultas, change_log). `ids`: claves primarias
+    afectadas cuando los parámetros no traen `id`.
+    """
+    resultado = session.connection().execute(sentencia, parametros)
+    _despachar_masiva(session, sentencia, parametros, ids)
+    return resultado
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _despachar_escrituras_orm(orm_execute_state) -> None:
+    # Los insert/update/delete masivos con session.execute no pasan por el flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _despachar_masiva(orm_execute_state.session, orm_execute_state.statement, orm_execute_state.parameters)
@@ -0,0 +1,155 @@
+# rh_service/app/utils/change_log.py
+
+import logging
+from datetime import datetime
+from typing import List, Sequence
+
+from sqlalchemy import bindparam, event, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.change_log import ChangeLog
+from app.models.change_log_secuencia import ChangeLogSecuencia
+from app.utils.change_events import Cambio, EscrituraMasiva, al_cambiar, al_escribir_masivo
+from app.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Operación registrada para escrituras masivas sin IDs conocidos: recargar la entidad
+RECARGA = "recarga"
+
+# Tablas internas que no se publican en el feed de cambios
+TABLAS_SIN_REGISTRO = frozenset({
+    ChangeLog.__table__.name, ChangeLogSecuencia.__table__.name, "metric_snapshots", "expiry_notifications",
+    "shifts_archive", "payment_details_archive", "pay_components_archive", "jobs",
+})
+
+# En `Session.info`: la transacción escribió en change_log (hay versiones por asignar al confirmar)
+CLAVE_PENDIENTE = "change_log_pendiente"
+# En `Session.info`: tablas con una fila `recarga` ya registrada en la transacción
+CLAVE_RECARGAS = "change_log_recargas"
+
+# Filas secuenciadas por sentencia
+TAMANO_LOTE_SECUENCIA = 1000
+
+
+def _registrar(session: Session, filas: List[dict]) -> None:
+    # SQL Core sobre la conexión de la sesión: misma transacción, sin provocar otro flush
+    if filas:
+        session.connection().execute(insert(ChangeLog.__table__), filas)
+        session.info[CLAVE_PENDIENTE] = True
+
+
+@al_cambiar()
+def _registrar_cambios(session: Session, cambios: Sequence[Cambio]) -> None:
+    """Una fila por instancia insertada, modificada o eliminada en el flush."""
+    tabla = type(cambios[0].instancia).__table__.name
+    if not settings.CHANGE_LOG_ENABLED or tabla in TABLAS_SIN_REGISTRO:
+        return
+    ahora = datetime.now()
+    _registrar(session, [
+        {"entidad": tabla, "id_entidad": c.instancia.id, "operacion": c.operacion, "creado_en": ahora}
+        for c in cambios
+    ])
+
+
+@al_escribir_masivo
+def _registrar_escrituras_masivas(session: Session, escritura: EscrituraMasiva) -> None:
+    """
+    Escrituras masivas (sin flush): si se conocen las claves primarias afectadas se
+    registra cada entidad; si no, una fila `recarga` para toda la tabla (una sola por
+    tabla y transacción).
+    """
+    if not settings.CHANGE_LOG_ENABLED or escritura.tabla in TABLAS_SIN_REGISTRO:
+        return
+    ahora = datetime.now()
+    if escritura.ids:
+        filas = [{"entidad": escritura.tabla, "id_entidad": id_entidad, "operacion": escritura.operacion,
+                  "creado_en": ahora} for id_entidad in escritura.ids]
+    else:
+        recargas = session.info.setdefault(CLAVE_RECARGAS, set())
+        if escritura.tabla in recargas:
+            return
+        recargas.add(escritura.tabla)
+        filas = [{"entidad": escritura.tabla, "id_entidad": None, "operacion": RECARGA, "creado_en": ahora}]
+    _registrar(session, filas)
+
+
+# ----------------------------------------------------
+# Secuenciador: versiones en orden de confirmación
+# ----------------------------------------------------
+
+def _ultima_version(conexion: Connection) -> int:
+    """Lee y bloquea el contador (lo crea si la tabla está vacía)."""
+    consulta = select(ChangeLogSecuencia.ultima_version).where(ChangeLogSecuencia.id == 1).with_for_update()
+    ultima = conexion.scalar(consulta)
+    if ultima is None:
+        try:
+            with conexion.begin_nested():
+                conexion.execute(insert(ChangeLogSecuencia.__table__).values(id=1, ultima_version=0))
+        except IntegrityError:
+            # Otro proceso lo creó a la vez
+            pass
+        ultima = conexion.scalar(consulta)
+    return ultima
+
+
+def secuenciar(conexion: Connection) -> int:
+    """
+    Asigna `version` a las filas de change_log ya confirmadas que no la tienen, en
+    orden de id, a continuación de la última asignada. Solo ve filas confirmadas, así
+    que una transacción larga recibe versiones mayores que las de las transacciones
+    que confirmaron antes que ella, aunque sus ids sean menores: el feed, ordenado por
+    versión, no tiene huecos que haya que esperar ni saltar.
+    El bloqueo del contador serializa a los secuenciadores de todos los procesos. Las
+    filas pendientes se leen con SKIP LOCKED: las que aún bloquea una transacción
+    abierta no se esperan, se numeran cuando esa transacción confirma.
+    Devuelve la cantidad de filas secuenciadas.
+    """
+    ultima = _ultima_version(conexion)
+    total = 0
+    while True:
+        ids = conexion.scalars(
+            select(ChangeLog.id).where(ChangeLog.version.is_(None))
+            .order_by(ChangeLog.id).limit(TAMANO_LOTE_SECUENCIA).with_for_update(skip_locked=True)
+        ).all()
+        if not ids:
+            break
+        conexion.execute(
+            update(ChangeLog.__table__).where(ChangeLog.id == bindparam("b_id"))
+            .values(version=bindparam("b_version")),
+            [{"b_id": id_cambio, "b_version": ultima + n} for n, id_cambio in enumerate(ids, 1)],
+        )
+        ultima += len(ids)
+        total += len(ids)
+        if len(ids) < TAMANO_LOTE_SECUENCIA:
+            break
+    if total:
+        conexion.execute(update(ChangeLogSecuencia.__table__).where(ChangeLogSecuencia.id == 1)
+                         .values(ultima_version=ultima))
+    return total
+
+
+def secuenciar_pendientes(bind) -> int:
+    """Ejecuta el secuenciador en una transacción propia sobre `bind` (engine)."""
+    with bind.begin() as conexion:
+        return secuenciar(conexion)
+
+
+@event.listens_for(Session, "after_commit")
+def _secuenciar_al_confirmar(session: Session) -> None:
+    # Justo después del commit, para que el cambio aparezca en el feed de inmediato.
+    # Si falla, lo asigna la tarea periódica (ver change_feed_service).
+    session.info.pop(CLAVE_RECARGAS, None)
+    if session.info.pop(CLAVE_PENDIENTE, None):
+        try:
+            secuenciar_pendientes(session.get_bind())
+        except Exception:
+            logger.exception("Error al asignar versiones del registro de cambios")
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_pendientes(session: Session) -> None:
+    session.info.pop(CLAVE_PENDIENTE, None)
+    session.info.pop(CLAVE_RECARGAS, None)
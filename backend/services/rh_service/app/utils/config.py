@@ -31,6 +31,78 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     ENV: str = "development"
 
+    # ----------------------------------------------------
+    # Métricas de consultas SQL (ver app/utils/query_metrics.py)
+    # ----------------------------------------------------
+    DB_QUERY_STRICT: bool = False        # Falla la petición si excede su presupuesto o hay N+1 (tests)
+    DB_N_PLUS_ONE_THRESHOLD: int = 3     # Cargas perezosas repetidas de una relación para marcar N+1
+
+    # ----------------------------------------------------
+    # Caché de consultas entre peticiones (ver app/utils/query_cache.py)
+    # ----------------------------------------------------
+    QUERY_CACHE_ENABLED: bool = True
+    # "memoria": LRU y versiones por proceso. Solo es correcto con un worker: con varios,
+    # las invalidaciones de un worker no llegan a los demás, que siguen sirviendo datos
+    # viejos. Con más de un worker de uvicorn usar "sqlite" (compartida en el host).
+    QUERY_CACHE_BACKEND: str = "memoria"
+    QUERY_CACHE_MAX_ENTRIES: int = 1024        # Entradas máximas antes de descartar las menos usadas
+    # Archivo del backend "sqlite": en un directorio privado del usuario del servicio (0700)
+    QUERY_CACHE_SQLITE_PATH: str = "~/.cache/rh_service/query_cache.sqlite3"
+
+    # ----------------------------------------------------
+    # Búsqueda de empleados (ver app/services/employee_search_service.py)
+    # ----------------------------------------------------
+    EMPLOYEE_SEARCH_BACKEND: str = "memoria"   # "memoria" (índice de trigramas por proceso) o "fulltext" (MySQL)
+
+    # ----------------------------------------------------
+    # Eventos en tiempo real (ver app/utils/event_hub.py)
+    # ----------------------------------------------------
+    EVENTS_BUFFER_SIZE: int = 1000          # Eventos recientes guardados para reanudar con Last-Event-ID
+    EVENTS_QUEUE_SIZE: int = 100            # Eventos pendientes por conexión antes de considerarla lenta
+    EVENTS_HEARTBEAT_SECONDS: int = 15      # Latido en conexiones sin eventos (evita cortes por inactividad)
+    EVENTS_MAX_CONNECTIONS: int = 5000      # Conexiones abiertas por proceso
+
+    # ----------------------------------------------------
+    # Registro de cambios y feed /changes (ver app/utils/change_log.py)
+    # ----------------------------------------------------
+    CHANGE_LOG_ENABLED: bool = True          # Registrar altas, modificaciones y bajas en change_log
+    CHANGE_LOG_RETENTION_DAYS: int = 7       # Antigüedad máxima de los registros (más antiguos: 410 en /changes)
+    CHANGE_LOG_SEQUENCE_SECONDS: int = 5     # Respaldo: asignación periódica de versiones pendientes
+
+    # ----------------------------------------------------
+    # Nómina
+    # ----------------------------------------------------
+    PAYROLL_HORAS_MES_SALARIO_FIJO: int = 160  # Horas de un mes completo para empleados de salario fijo
+
+    # ----------------------------------------------------
+    # Archivo histórico (ver app/services/archive_service.py)
+    # ----------------------------------------------------
+    ARCHIVE_HOT_MONTHS: int = 3        # Meses cerrados que se conservan en las tablas principales
+    ARCHIVE_BATCH_SIZE: int = 5000     # Turnos movidos por transacción
+
+    # ----------------------------------------------------
+    # Trabajos en segundo plano (ver app/utils/job_queue.py)
+    # ----------------------------------------------------
+    JOBS_ENABLED: bool = True                  # Workers de trabajos en este proceso
+    JOBS_WORKERS: int = 2                      # Trabajos ejecutados a la vez por proceso
+    JOBS_MAX_ATTEMPTS: int = 3                 # Intentos ante errores inesperados o 5xx (no ante 4xx)
+    JOBS_RETRY_BASE_SECONDS: int = 30          # Espera antes del reintento n: base * 2^(n-1)
+    JOBS_POLL_SECONDS: float = 2               # Espera de un worker sin trabajos pendientes
+    JOBS_LEASE_SECONDS: int = 300              # Sin latido en este tiempo: el trabajo vuelve a la cola
+    JOBS_OUTPUT_DIR: str = "/tmp/rh_jobs"      # Archivos generados (exportaciones)
+
+    # ----------------------------------------------------
+    # Tareas periódicas
+    # ----------------------------------------------------
+    METRICS_SNAPSHOT_ENABLED: bool = True          # Foto diaria de métricas del dashboard
+    METRICS_SNAPSHOT_INTERVAL_MINUTES: int = 15    # Frecuencia de refresco de la foto del día
+    ALERTS_SWEEP_ENABLED: bool = True              # Recálculo de alertas al arrancar y cada medianoche
+    EXPIRY_SCHEDULER_ENABLED: bool = True          # Umbrales de vencimiento de documentos y capacitaciones
+    # Archivo de turnos y pagos de meses cerrados, al arrancar y cada medianoche. Desactivado
+    # por defecto: activarlo es una decisión del operador, porque lo archivado pasa a ser de
+    # solo lectura (ver app/api/archive_router.py). Se puede ejecutar a mano con POST /archive/ejecutar.
+    ARCHIVE_ENABLED: bool = False
+
     # ----------------------------------------------------
     # Configuración de Pydantic v2 (Clave)
     # ----------------------------------------------------
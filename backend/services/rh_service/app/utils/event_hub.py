@@ -0,0 +1,190 @@
+# rh_service/app/utils/event_hub.py
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, FrozenSet, List, NamedTuple, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.utils.config import settings
+
+# Eventos pendientes de la transacción en curso (se publican tras el commit)
+CLAVE_EVENTOS_PENDIENTES = "eventos_pendientes"
+
+
+class Evento(NamedTuple):
+    id: int
+    tipo: str
+    datos: Any
+
+
+# Marcador que el hub deja en la cola de cada suscriptor al apagarse
+_CIERRE = object()
+
+
+class Suscripcion:
+    """Cola acotada de una conexión y los tipos de evento que le interesan."""
+
+    __slots__ = ("cola", "tipos", "desbordada")
+
+    def __init__(self, tipos: Optional[FrozenSet[str]]):
+        self.cola: asyncio.Queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        self.tipos = tipos
+        self.desbordada = False
+
+
+class EventHub:
+    """
+    Difusión de eventos del servicio a las conexiones abiertas (Server-Sent Events).
+
+    - Cada conexión tiene una cola acotada. Si un cliente lento la llena, se vacía
+      y la conexión se pone al día desde el buffer circular (sin bloquear a los demás).
+    - Los últimos `EVENTS_BUFFER_SIZE` eventos quedan en un buffer circular para
+      reanudar desde `Last-Event-ID`.
+    - `publicar` se puede llamar desde cualquier hilo; el reparto a las colas se hace
+      en el event loop. Una conexión inactiva solo ocupa su cola vacía.
+
+    El hub es por proceso: con varios workers, cada uno difunde lo que confirma.
+    """
+
+    def __init__(self, tamano_buffer: int):
+        self._lock = threading.Lock()
+        self._buffer: Deque[Evento] = deque(maxlen=tamano_buffer)
+        # IDs crecientes también entre reinicios del proceso (milisegundos al arrancar)
+        self._ultimo_id = int(time.time() * 1000)
+        self._suscripciones: Set[Suscripcion] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def conexiones(self) -> int:
+        return len(self._suscripciones)
+
+    # --- Publicación ---
+
+    def publicar(self, tipo: str, datos: Any) -> None:
+        with self._lock:
+            self._ultimo_id += 1
+            evento = Evento(self._ultimo_id, tipo, datos)
+            self._buffer.append(evento)
+            if self._loop is not None and self._suscripciones:
+                try:
+                    self._loop.call_soon_threadsafe(self._repartir, evento)
+                except RuntimeError:
+                    # El loop ya se cerró (apagado del servicio)
+                    self._loop = None
+
+    def _repartir(self, evento: Evento) -> None:
+        for sub in self._suscripciones:
+            if sub.desbordada or (sub.tipos is not None and evento.tipo not in sub.tipos):
+                continue
+            try:
+                sub.cola.put_nowait(evento)
+            except asyncio.QueueFull:
+                sub.desbordada = True
+
+    def _desde(self, ultimo_id: int, tipos: Optional[FrozenSet[str]]) -> Optional[List[Evento]]:
+        """Eventos posteriores a `ultimo_id`, o None si ya no están en el buffer."""
+        with self._lock:
+            if ultimo_id > self._ultimo_id:
+                return None
+            if self._buffer and ultimo_id < self._buffer[0].id - 1:
+                return None
+            if not self._buffer and ultimo_id < self._ultimo_id:
+                return None
+            return [e for e in self._buffer if e.id > ultimo_id and (tipos is None or e.tipo in tipos)]
+
+    @property
+    def ultimo_id(self) -> int:
+        with self._lock:
+            return self._ultimo_id
+
+    # --- Suscripción ---
+
+    async def escuchar(self, ultimo_id: Optional[int] = None,
+                       tipos: Optional[FrozenSet[str]] = None) -> AsyncIterator[Optional[Evento]]:
+        """
+        Eventos para una conexión. Produce None cuando pasan `EVENTS_HEARTBEAT_SECONDS`
+        sin eventos (latido). Con `ultimo_id`, primero reenvía lo que el cliente no
+        recibió; si eso ya salió del buffer, produce un evento `reinicio` para que
+        el cliente recargue el estado completo.
+        """
+        self._loop = asyncio.get_running_loop()
+        sub = Suscripcion(tipos)
+        self._suscripciones.add(sub)
+        try:
+            entregado = self.ultimo_id if ultimo_id is None else ultimo_id
+            pendientes: Optional[List[Evento]] = [] if ultimo_id is None else self._desde(ultimo_id, tipos)
+            while True:
+                if pendientes is None:
+                    yield Evento(self.ultimo_id, "reinicio", None)
+                    entregado = self.ultimo_id
+                    pendientes = []
+                for evento in pendientes:
+                    if evento.id > entregado:
+                        entregado = evento.id
+                        yield evento
+
+                try:
+                    evento = await asyncio.wait_for(sub.cola.get(), settings.EVENTS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    pendientes = []
+                    yield None
+                    continue
+                if evento is _CIERRE:
+                    return
+
+                if sub.desbordada:
+                    # Cliente lento: se descarta la cola y se repone desde el buffer
+                    while not sub.cola.empty():
+                        sub.cola.get_nowait()
+                    sub.desbordada = False
+                    pendientes = self._desde(entregado, tipos)
+                else:
+                    pendientes = [evento]
+        finally:
+            self._suscripciones.discard(sub)
+
+    def cerrar(self) -> None:
+        """Termina todas las conexiones abiertas (apagado del servicio)."""
+        for sub in self._suscripciones:
+            while not sub.cola.empty():
+                sub.cola.get_nowait()
+            sub.cola.put_nowait(_CIERRE)
+
+
+hub = EventHub(settings.EVENTS_BUFFER_SIZE)
+
+
+def formatear_sse(evento: Optional[Evento]) -> str:
+    """Un evento en formato text/event-stream; None es un comentario de latido."""
+    if evento is None:
+        return ": ping\n\n"
+    datos = json.dumps(evento.datos, default=str, ensure_ascii=False)
+    return f"id: {evento.id}\nevent: {evento.tipo}\ndata: {datos}\n\n"
+
+
+# ----------------------------------------------------
+# Publicación transaccional: solo lo confirmado llega a los clientes
+# ----------------------------------------------------
+
+def encolar_evento(session: Session, tipo: str, datos: Any) -> None:
+    """
+    Registra un evento en la transacción de `session`; se publica después del commit
+    y se descarta si hay rollback. Pensado para los manejadores de `al_cambiar`.
+    """
+    session.info.setdefault(CLAVE_EVENTOS_PENDIENTES, []).append((tipo, datos))
+
+
+@event.listens_for(Session, "after_commit")
+def _publicar_eventos(session: Session) -> None:
+    for tipo, datos in session.info.pop(CLAVE_EVENTOS_PENDIENTES, ()):
+        hub.publicar(tipo, datos)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_eventos(session: Session) -> None:
+    session.info.pop(CLAVE_EVENTOS_PENDIENTES, None)
@@ -0,0 +1,260 @@
+# rh_service/app/utils/job_queue.py
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.job import Job
+from app.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Estados de un trabajo
+PENDIENTE = "pendiente"
+EN_CURSO = "en_curso"
+COMPLETADO = "completado"
+FALLIDO = "fallido"
+CANCELADO = "cancelado"
+ESTADOS_TERMINADOS = (COMPLETADO, FALLIDO, CANCELADO)
+
+# Pendientes que un worker intenta tomar por vuelta (si otro gana la carrera, prueba el siguiente)
+CANDIDATOS_POR_VUELTA = 5
+# Intervalo mínimo entre escrituras de progreso de un mismo trabajo
+INTERVALO_PROGRESO_SEGUNDOS = 1.0
+
+
+class JobCancelado(Exception):
+    """Lanzada por `ContextoJob.progreso` cuando se pidió cancelar el trabajo."""
+
+
+class Tarea(NamedTuple):
+    funcion: Callable[[Session, BaseModel, "ContextoJob"], Any]
+    parametros: Type[BaseModel]
+
+
+# Tipo de trabajo -> función que lo ejecuta y schema de sus parámetros
+TAREAS: Dict[str, Tarea] = {}
+
+
+def tarea(nombre: str, parametros: Type[BaseModel]):
+    """
+    Registra una función como tipo de trabajo. Recibe la sesión del trabajo, los
+    parámetros validados y el `ContextoJob`; lo que devuelve se guarda como resultado.
+    """
+    def registrar(funcion):
+        TAREAS[nombre] = Tarea(funcion, parametros)
+        return funcion
+    return registrar
+
+
+class ContextoJob:
+    """Avance y cancelación del trabajo en curso, para la función de la tarea."""
+
+    def __init__(self, job_id: int, worker: str):
+        self.job_id = job_id
+        self.worker = worker
+        self._ultima_escritura = 0.0
+
+    def progreso(self, porcentaje: int, mensaje: Optional[str] = None) -> None:
+        """
+        Guarda el avance (como máximo una vez por segundo) con una sesión propia,
+        independiente de la transacción de la tarea. Es también el punto de control de
+        cancelación: lanza JobCancelado si se pidió cancelar. La tarea no debe atraparla;
+        se revierte lo que la tarea no haya confirmado (lo ya confirmado permanece).
+
+        Los servicios que reciben un callback `progreso` (nómina, conciliación,
+        generación de turnos, archivo) lo llaman con esta firma entre etapas y antes de
+        escribir, fuera de su manejo de errores, para que la excepción llegue al worker.
+        """
+        ahora = time.monotonic()
+        if porcentaje < 100 and ahora - self._ultima_escritura < INTERVALO_PROGRESO_SEGUNDOS:
+            return
+        self._ultima_escritura = ahora
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(Job).where(Job.id == self.job_id, Job.worker == self.worker)
+                .values(progreso=max(0, min(100, porcentaje)), mensaje=mensaje, latido_en=datetime.now())
+            )
+            cancelar = db.scalar(select(Job.cancelacion_solicitada).where(Job.id == self.job_id))
+            db.commit()
+        finally:
+            db.close()
+        if cancelar:
+            raise JobCancelado()
+
+
+class _Latido(threading.Thread):
+    """
+    Renueva `latido_en` mientras la tarea corre, aunque no informe progreso (p. ej.
+    una sola transacción larga): sin latido el trabajo se da por abandonado.
+    """
+
+    def __init__(self, job_id: int, worker: str):
+        super().__init__(daemon=True, name=f"latido-job-{job_id}")
+        self.job_id = job_id
+        self.worker = worker
+        self._detener = threading.Event()
+
+    def run(self) -> None:
+        while not self._detener.wait(settings.JOBS_LEASE_SECONDS / 3):
+            db = SessionLocal()
+            try:
+                db.execute(update(Job).where(Job.id == self.job_id, Job.worker == self.worker)
+                           .values(latido_en=datetime.now()))
+                db.commit()
+            except Exception:
+                logger.exception("No se pudo renovar el latido del trabajo %s", self.job_id)
+            finally:
+                db.close()
+
+    def detener(self) -> None:
+        self._detener.set()
+
+
+# ----------------------------------------------------
+# Ejecución
+# ----------------------------------------------------
+
+def _recuperar_abandonados(db: Session) -> None:
+    """Trabajos en curso sin latido (el proceso murió): vuelven a la cola o fallan si agotaron intentos."""
+    limite = datetime.now() - timedelta(seconds=settings.JOBS_LEASE_SECONDS)
+    abandonados = (Job.estado == EN_CURSO, Job.latido_en < limite)
+    db.execute(update(Job).where(*abandonados, Job.intentos >= Job.max_intentos)
+               .values(estado=FALLIDO, worker=None, terminado_en=datetime.now(),
+                       error="El worker dejó de responder y se agotaron los intentos."))
+    db.execute(update(Job).where(*abandonados)
+               .values(estado=PENDIENTE, worker=None, mensaje="Reintento: el worker dejó de responder."))
+    db.commit()
+
+
+def _tomar(db: Session, worker: str) -> Optional[int]:
+    """
+    Toma el pendiente de mayor prioridad. El UPDATE condicionado al estado es la
+    cerradura: si otro worker (de este u otro proceso) lo tomó antes, afecta 0 filas.
+    """
+    ahora = datetime.now()
+    candidatos = db.scalars(
+        select(Job.id).where(Job.estado == PENDIENTE, Job.disponible_desde <= ahora)
+        .order_by(Job.prioridad.desc(), Job.id).limit(CANDIDATOS_POR_VUELTA)
+    ).all()
+    for job_id in candidatos:
+        tomado = db.execute(
+            update(Job).where(Job.id == job_id, Job.estado == PENDIENTE)
+            .values(estado=EN_CURSO, worker=worker, intentos=Job.intentos + 1,
+                    iniciado_en=ahora, latido_en=ahora, mensaje=None)
+        ).rowcount
+        db.commit()
+        if tomado:
+            return job_id
+    return None
+
+
+def _terminar(db: Session, job_id: int, worker: str, **valores) -> None:
+    # Solo si sigue siendo nuestro (no fue recuperado por otro worker)
+    db.execute(update(Job).where(Job.id == job_id, Job.worker == worker)
+               .values(terminado_en=datetime.now(), **valores))
+    db.commit()
+
+
+def _reintentar(db: Session, job_id: int, worker: str, intentos: int, max_intentos: int, error: str) -> None:
+    # Vuelve a la cola con espera exponencial, o falla si se agotaron los intentos
+    if intentos >= max_intentos:
+        _terminar(db, job_id, worker, estado=FALLIDO, error=error)
+        return
+    espera = settings.JOBS_RETRY_BASE_SECONDS * 2 ** (intentos - 1)
+    db.execute(update(Job).where(Job.id == job_id, Job.worker == worker).values(
+        estado=PENDIENTE, worker=None, error=error,
+        disponible_desde=datetime.now() + timedelta(seconds=espera),
+        mensaje=f"Reintento {intentos + 1} de {max_intentos} en {espera} s.",
+    ))
+    db.commit()
+
+
+def _ejecutar(db: Session, job_id: int, worker: str) -> None:
+    job = db.get(Job, job_id)
+    registrada = TAREAS.get(job.tipo)
+    if registrada is None:
+        _terminar(db, job_id, worker, estado=FALLIDO, error=f"Tipo de trabajo desconocido: {job.tipo}")
+        return
+    tipo, intentos, max_intentos = job.tipo, job.intentos, job.max_intentos
+    latido = _Latido(job_id, worker)
+    latido.start()
+    try:
+        resultado = registrada.funcion(db, registrada.parametros.model_validate_json(job.parametros),
+                                       ContextoJob(job_id, worker))
+    except JobCancelado:
+        db.rollback()
+        _terminar(db, job_id, worker, estado=CANCELADO, mensaje="Cancelado a pedido.")
+    except HTTPException as e:
+        db.rollback()
+        if e.status_code < 500:
+            # Errores de negocio (404, 409, ...): reintentar daría el mismo resultado
+            _terminar(db, job_id, worker, estado=FALLIDO, error=str(e.detail))
+        else:
+            # Los servicios envuelven los errores de base de datos en un 500
+            logger.exception("Error en el trabajo %s (%s), intento %s de %s", job_id, tipo, intentos, max_intentos)
+            _reintentar(db, job_id, worker, intentos, max_intentos, str(e.detail))
+    except Exception as e:
+        db.rollback()
+        logger.exception("Error en el trabajo %s (%s), intento %s de %s", job_id, tipo, intentos, max_intentos)
+        _reintentar(db, job_id, worker, intentos, max_intentos, repr(e))
+    else:
+        _terminar(db, job_id, worker, estado=COMPLETADO, progreso=100, mensaje=None, error=None,
+                  resultado=json.dumps(jsonable_encoder(resultado), ensure_ascii=False))
+    finally:
+        latido.detener()
+
+
+def procesar_siguiente(worker: str) -> bool:
+    """Ejecuta un trabajo pendiente, si hay. Devuelve False si la cola estaba vacía."""
+    db = SessionLocal()
+    try:
+        _recuperar_abandonados(db)
+        job_id = _tomar(db, worker)
+        if job_id is None:
+            return False
+        _ejecutar(db, job_id, worker)
+        return True
+    finally:
+        db.close()
+
+
+async def ejecutar_workers(cantidad: int) -> None:
+    """
+    Workers de trabajos en hilos propios (no los del event loop ni los de
+    `asyncio.to_thread`): un trabajo largo no retrasa peticiones ni otras tareas.
+    """
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=cantidad, thread_name_prefix="job-worker")
+    prefijo = f"{socket.gethostname()}:{os.getpid()}"
+
+    async def worker(numero: int) -> None:
+        nombre = f"{prefijo}:{numero}"
+        while True:
+            try:
+                trabajo = await loop.run_in_executor(pool, procesar_siguiente, nombre)
+            except Exception:
+                logger.exception("Error en el worker de trabajos %s", nombre)
+                trabajo = False
+            if not trabajo:
+                await asyncio.sleep(settings.JOBS_POLL_SECONDS)
+
+    try:
+        await asyncio.gather(*(worker(n) for n in range(cantidad)))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
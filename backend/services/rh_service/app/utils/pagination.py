@@ -0,0 +1,147 @@
+# rh_service/app/utils/pagination.py
+
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+# Nombre del header donde se devuelve el cursor de la siguiente página.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Pagina(NamedTuple):
+    """
+    Resultado de una consulta paginada: los registros de la página y el cursor
+    opaco para pedir la siguiente (None si no hay más registros).
+    """
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+# ----------------------------------------------------
+# Codificación del cursor (opaco para el cliente)
+# ----------------------------------------------------
+
+def _to_json(value: Any) -> Any:
+    """Convierte los valores de las claves a tipos serializables en JSON."""
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, column) -> Any:
+    """Reconstruye el valor de la clave según el tipo Python de la columna."""
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is time:
+        return time.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Codifica los valores de las claves de orden del último registro."""
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    """
+    Decodifica un cursor generado por `encode_cursor`.
+    Lanza 400 si el cursor está corrupto o no corresponde a las claves del listado.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("número de claves inválido")
+        return [_from_json(v, c) for v, c in zip(values, columns)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="El cursor de paginación no es válido.")
+
+
+# ----------------------------------------------------
+# Condición de keyset
+# ----------------------------------------------------
+
+def _after_condition(columns: Sequence, values: Sequence[Any], descending: bool):
+    """
+    Construye la condición "fila posterior al cursor" para un orden compuesto
+    (c1, c2, ..., id). Respeta el orden de NULLs de MySQL: en ASC van primero
+    y en DESC van al final.
+    """
+    column, value = columns[0], values[0]
+    if len(columns) == 1:
+        # La última clave es siempre única y no nula (el id).
+        return column < value if descending else column > value
+
+    tie = _after_condition(columns[1:], values[1:], descending)
+    if value is None:
+        if descending:
+            return and_(column.is_(None), tie)
+        return or_(column.isnot(None), and_(column.is_(None), tie))
+
+    if descending:
+        return or_(column < value, column.is_(None), and_(column == value, tie))
+    return or_(column > value, and_(column == value, tie))
+
+
+def paginate(query: Query, keys: Sequence, skip: int = 0, limit: int = 100,
+             after: Optional[str] = None, descending: bool = False) -> Pagina:
+    """
+    Pagina una consulta ordenándola por `keys` (columnas indexadas; la última debe
+    ser la clave primaria).
+
+    - Si se recibe `after`, usa paginación por cursor (keyset): la base de datos
+      salta directamente al registro siguiente usando el índice, sin recorrer
+      las filas previas, y la página es estable ante inserciones concurrentes.
+    - Si no, mantiene el modo `offset(skip)` por compatibilidad.
+
+    En ambos modos se devuelve `next_cursor`, de modo que un cliente puede
+    empezar con offset y continuar con cursor.
+    """
+    if limit <= 0:
+        return Pagina(items=[], next_cursor=None)
+
+    order = [k.desc() if descending else k.asc() for k in keys]
+    query = query.order_by(*order)
+
+    if after:
+        values = decode_cursor(after, keys)
+        query = query.filter(_after_condition(keys, values, descending))
+    elif skip:
+        query = query.offset(skip)
+
+    # Se pide un registro extra para saber si existe una página siguiente.
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return Pagina(items=rows, next_cursor=None)
+
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor([getattr(last, k.key) for k in keys])
+    return Pagina(items=rows, next_cursor=next_cursor)
+
+
+def with_next_cursor(response: Response, page: Pagina) -> List[Any]:
+    """
+    Expone el cursor de la siguiente página en el header `X-Next-Cursor` y
+    devuelve los registros, manteniendo el cuerpo de la respuesta como una lista.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
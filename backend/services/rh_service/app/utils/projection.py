@@ -0,0 +1,104 @@
+# rh_service/app/utils/projection.py
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy.orm import Query, Session
+
+from app.utils.pagination import NEXT_CURSOR_HEADER, Pagina, paginate
+
+# Valores de `?vista=` en los listados
+VISTA_COMPLETA = "completa"
+VISTA_RESUMEN = "resumen"
+
+
+class Campo(NamedTuple):
+    """Campo plano de un listado: expresión SQL y, si es de otra tabla, el JOIN que requiere."""
+    expresion: Any
+    join: Optional[str] = None
+
+
+class Proyeccion:
+    """
+    Listado compacto de un modelo: campos planos (columnas propias o de tablas
+    relacionadas, p. ej. el nombre del rol) que el cliente elige con
+    `?fields=a,b,c` o con `?vista=resumen`.
+
+    Solo las columnas pedidas llegan al SELECT (y solo los JOIN que necesitan);
+    las filas se devuelven como diccionarios, sin construir objetos ORM ni
+    validar schemas anidados. `id` se incluye siempre (es además la clave del
+    cursor de paginación).
+    """
+
+    def __init__(self, modelo: type, campos: Dict[str, Campo], resumen: Sequence[str],
+                 joins: Optional[Dict[str, Tuple[Any, Any]]] = None):
+        self.modelo = modelo
+        self.campos = campos
+        self.resumen = tuple(resumen)
+        self.joins = joins or {}
+
+    def seleccion(self, fields: Optional[str], vista: str = VISTA_COMPLETA) -> Optional[List[str]]:
+        """
+        Campos a devolver según `fields` (tiene prioridad) o `vista`; None si se
+        pidió la respuesta completa. Lanza 422 si algún campo no existe.
+        """
+        if fields:
+            pedidos = [f.strip() for f in fields.split(",") if f.strip()]
+            desconocidos = sorted(set(pedidos) - self.campos.keys())
+            if desconocidos:
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                                    detail=f"Campos desconocidos: {', '.join(desconocidos)}. "
+                                           f"Disponibles: {', '.join(self.campos)}.")
+        elif vista == VISTA_RESUMEN:
+            pedidos = list(self.resumen)
+        else:
+            return None
+        return ["id"] + [c for c in dict.fromkeys(pedidos) if c != "id"]
+
+    def consulta(self, db: Session, campos: Sequence[str]) -> Query:
+        """SELECT de solo los campos indicados, con los JOIN que requieren."""
+        query = db.query(*(self.campos[c].expresion.label(c) for c in campos)).select_from(self.modelo)
+        for nombre in dict.fromkeys(self.campos[c].join for c in campos if self.campos[c].join):
+            destino, condicion = self.joins[nombre]
+            query = query.outerjoin(destino, condicion)
+        return query
+
+    def todos(self, db: Session, campos: Sequence[str], *filtros, orden: Sequence = ()) -> List[Dict[str, Any]]:
+        """Todas las filas que cumplen `filtros`, como diccionarios."""
+        query = self.consulta(db, campos).filter(*filtros)
+        if orden:
+            query = query.order_by(*orden)
+        return [dict(fila._mapping) for fila in query]
+
+    def pagina(self, db: Session, campos: Sequence[str], *filtros, skip: int = 0, limit: int = 100,
+               after: Optional[str] = None) -> Pagina:
+        """Página ordenada por ID (offset o cursor `after`), como diccionarios."""
+        page = paginate(self.consulta(db, campos).filter(*filtros), keys=(self.modelo.id,),
+                        skip=skip, limit=limit, after=after)
+        return Pagina(items=[dict(fila._mapping) for fila in page.items], next_cursor=page.next_cursor)
+
+
+def _a_json(valor: Any) -> Any:
+    """Mismo formato que los schemas de respuesta: fechas ISO y Decimal como texto."""
+    if isinstance(valor, (date, datetime, time)):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return str(valor)
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def respuesta_proyectada(filas: Union[Pagina, List[Dict[str, Any]]]) -> Response:
+    """
+    Respuesta JSON de un listado proyectado. Se serializa directamente (sin pasar por
+    el `response_model` del endpoint) y, si es una página, expone `X-Next-Cursor`.
+    """
+    headers = None
+    if isinstance(filas, Pagina):
+        if filas.next_cursor:
+            headers = {NEXT_CURSOR_HEADER: filas.next_cursor}
+        filas = filas.items
+    contenido = json.dumps(filas, default=_a_json, ensure_ascii=False, separators=(",", ":"))
+    return Response(content=contenido, media_type="application/json", headers=headers)
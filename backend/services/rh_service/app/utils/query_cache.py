@@ -0,0 +1,292 @@
+# rh_service/app/utils/query_cache.py
+
+import functools
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Set, Type
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.utils.change_events import Cambio, EscrituraMasiva, al_cambiar, al_escribir_masivo
+from app.utils.config import settings
+from app.utils.pagination import Pagina
+from app.utils.query_metrics import metricas
+
+# Tablas modificadas por la transacción en curso (en `Session.info`), pendientes de publicar
+CLAVE_TABLAS_PENDIENTES = "query_cache_tablas"
+
+
+# ----------------------------------------------------
+# Backends
+# ----------------------------------------------------
+
+class CacheLRU:
+    """
+    Backend en memoria del proceso: diccionario LRU acotado a `max_entradas`
+    y contadores de versión por tabla. Es el backend por defecto, pensado para un
+    solo worker: las versiones son del proceso, así que con varios workers cada
+    uno sigue sirviendo sus entradas aunque otro haya modificado las tablas.
+    Guarda los schemas tal cual (sin serializar), envueltos en una tupla.
+    """
+
+    def __init__(self, max_entradas: int):
+        self.max_entradas = max_entradas
+        self._lock = threading.Lock()
+        self._entradas: "OrderedDict[str, Any]" = OrderedDict()
+        self._versiones: Dict[str, int] = {}
+
+    def obtener(self, clave: str, esquema: Type[BaseModel]) -> Optional[tuple]:
+        with self._lock:
+            try:
+                self._entradas.move_to_end(clave)
+                return self._entradas[clave]
+            except KeyError:
+                return None
+
+    def guardar(self, clave: str, valor: Any, esquema: Type[BaseModel]) -> None:
+        with self._lock:
+            self._entradas[clave] = (valor,)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+    def versiones(self, tablas: Sequence[str]) -> Dict[str, int]:
+        with self._lock:
+            return {t: self._versiones.get(t, 0) for t in tablas}
+
+    def incrementar_versiones(self, tablas: Iterable[str]) -> None:
+        with self._lock:
+            for tabla in tablas:
+                self._versiones[tabla] = self._versiones.get(tabla, 0) + 1
+
+
+class CacheSQLite:
+    """
+    Backend compartido entre los workers de uvicorn de un mismo host: un archivo
+    SQLite local (modo WAL) con las entradas serializadas y las versiones por
+    tabla. Al superar `max_entradas` se descartan las menos usadas recientemente.
+
+    Las entradas se guardan como JSON y se reconstruyen validándolas con el
+    `esquema` Pydantic (nunca con pickle), y el archivo vive en un directorio
+    privado del usuario del servicio (0700).
+    """
+
+    def __init__(self, ruta: str, max_entradas: int):
+        self.ruta = os.path.expanduser(ruta)
+        self.max_entradas = max_entradas
+        self._local = threading.local()
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, mode=0o700, exist_ok=True)
+        with self._conexion() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS entradas "
+                         "(clave TEXT PRIMARY KEY, valor BLOB NOT NULL, usado REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_entradas_usado ON entradas (usado)")
+            conn.execute("CREATE TABLE IF NOT EXISTS versiones "
+                         "(tabla TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+
+    def _conexion(self) -> sqlite3.Connection:
+        # Una conexión por hilo: sqlite3 no permite compartirlas entre hilos
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.ruta, timeout=5, isolation_level=None)
+            os.chmod(self.ruta, 0o600)
+            self._local.conn = conn
+        return conn
+
+    def obtener(self, clave: str, esquema: Type[BaseModel]) -> Optional[tuple]:
+        conn = self._conexion()
+        fila = conn.execute("SELECT valor FROM entradas WHERE clave = ?", (clave,)).fetchone()
+        if fila is None:
+            return None
+        try:
+            valor = _desde_json(fila[0], esquema)
+        except ValueError:
+            # Entrada ilegible o de otra versión del schema: se trata como fallo y se reemplaza
+            return None
+        conn.execute("UPDATE entradas SET usado = ? WHERE clave = ?", (time.time(), clave))
+        return (valor,)
+
+    def guardar(self, clave: str, valor: Any, esquema: Type[BaseModel]) -> None:
+        conn = self._conexion()
+        conn.execute("INSERT OR REPLACE INTO entradas (clave, valor, usado) VALUES (?, ?, ?)",
+                     (clave, _a_json(valor), time.time()))
+        conn.execute(
+            "DELETE FROM entradas WHERE clave IN (SELECT clave FROM entradas "
+            "ORDER BY usado DESC LIMIT -1 OFFSET ?)", (self.max_entradas,)
+        )
+
+    def versiones(self, tablas: Sequence[str]) -> Dict[str, int]:
+        marcadores = ",".join("?" * len(tablas))
+        filas = self._conexion().execute(
+            f"SELECT tabla, version FROM versiones WHERE tabla IN ({marcadores})", tuple(tablas)
+        ).fetchall()
+        return {**dict.fromkeys(tablas, 0), **dict(filas)}
+
+    def incrementar_versiones(self, tablas: Iterable[str]) -> None:
+        conn = self._conexion()
+        for tabla in tablas:
+            conn.execute("INSERT INTO versiones (tabla, version) VALUES (?, 1) "
+                         "ON CONFLICT(tabla) DO UPDATE SET version = version + 1", (tabla,))
+
+
+def _a_json(valor: Any) -> str:
+    """Serializa un resultado ya convertido a schemas: uno, lista o Pagina."""
+    if isinstance(valor, Pagina):
+        datos = {"pagina": [i.model_dump(mode="json") for i in valor.items], "next_cursor": valor.next_cursor}
+    elif isinstance(valor, list):
+        datos = {"lista": [i.model_dump(mode="json") for i in valor]}
+    else:
+        datos = {"valor": valor.model_dump(mode="json") if valor is not None else None}
+    return json.dumps(datos)
+
+
+def _desde_json(texto: str, esquema: Type[BaseModel]) -> Any:
+    datos = json.loads(texto)
+    if "pagina" in datos:
+        return Pagina([esquema.model_validate(i) for i in datos["pagina"]], datos["next_cursor"])
+    if "lista" in datos:
+        return [esquema.model_validate(i) for i in datos["lista"]]
+    return esquema.model_validate(datos["valor"]) if datos["valor"] is not None else None
+
+
+def _crear_backend():
+    if settings.QUERY_CACHE_BACKEND == "sqlite":
+        return CacheSQLite(settings.QUERY_CACHE_SQLITE_PATH, settings.QUERY_CACHE_MAX_ENTRIES)
+    return CacheLRU(settings.QUERY_CACHE_MAX_ENTRIES)
+
+
+# Backend activo (se crea al primer uso, según la configuración)
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def backend_cache():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _crear_backend()
+    return _backend
+
+
+# ----------------------------------------------------
+# Versiones por tabla
+# ----------------------------------------------------
+
+@al_cambiar()
+def _marcar_tablas_modificadas(session: Session, cambios: Sequence[Cambio]) -> None:
+    tabla = type(cambios[0].instancia).__table__.name
+    session.info.setdefault(CLAVE_TABLAS_PENDIENTES, set()).add(tabla)
+
+
+@al_escribir_masivo
+def _marcar_escrituras_masivas(session: Session, escritura: EscrituraMasiva) -> None:
+    session.info.setdefault(CLAVE_TABLAS_PENDIENTES, set()).add(escritura.tabla)
+
+
+@event.listens_for(Session, "after_commit")
+def _publicar_versiones(session: Session) -> None:
+    # Las versiones se incrementan al confirmar: otra sesión que lea entre el flush
+    # y el commit vería los datos anteriores y los guardaría con la versión nueva.
+    tablas: Set[str] = session.info.pop(CLAVE_TABLAS_PENDIENTES, None)
+    if tablas:
+        backend_cache().incrementar_versiones(tablas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_versiones(session: Session) -> None:
+    session.info.pop(CLAVE_TABLAS_PENDIENTES, None)
+
+
+# ----------------------------------------------------
+# Decorador
+# ----------------------------------------------------
+
+@contextmanager
+def sesion_de_relleno(db: Session) -> Iterator[Session]:
+    """
+    Sesión para leer lo que se guardará con las versiones recién leídas. Si `db` ya
+    tiene una transacción abierta, su snapshot (REPEATABLE READ) puede ser anterior a
+    esas versiones y el resultado quedaría guardado como actual: se usa una sesión
+    nueva y breve, cuyo snapshot empieza después. Si no, sirve la propia `db`.
+    """
+    if not db.in_transaction():
+        yield db
+        return
+    nueva = Session(bind=db.get_bind(), autoflush=False)
+    try:
+        yield nueva
+    finally:
+        nueva.close()
+
+
+def _a_esquema(valor: Any, esquema: Type[BaseModel]) -> Any:
+    """Convierte el resultado ORM a schemas Pydantic (independientes de la sesión)."""
+    if valor is None:
+        return None
+    if isinstance(valor, Pagina):
+        return Pagina([esquema.model_validate(i) for i in valor.items], valor.next_cursor)
+    if isinstance(valor, list):
+        return [esquema.model_validate(i) for i in valor]
+    return esquema.model_validate(valor)
+
+
+def cache_consulta(*modelos: type, esquema: Type[BaseModel], por_dia: bool = False):
+    """
+    Cachea entre peticiones el resultado de un método de servicio de solo lectura
+    `metodo(self, db, ...)`, con clave (método, parámetros, versión de cada tabla
+    de `modelos`). Cualquier cambio confirmado en esas tablas incrementa su versión,
+    de modo que las entradas anteriores dejan de alcanzarse y el LRU las descarta.
+
+    El resultado se guarda convertido a `esquema` (no a objetos ORM), por lo que los
+    llamadores reciben schemas de solo lectura. Con `por_dia=True` la clave incluye
+    la fecha actual, para consultas relativas a "hoy".
+    Mientras la sesión tenga cambios sin confirmar en esas tablas se consulta
+    directamente a la base de datos. Un fallo se resuelve con `sesion_de_relleno`.
+
+        @cache_consulta(Role, esquema=RoleResponse)
+        def get_roles_page(self, db: Session, ...): ...
+    """
+    tablas = tuple(m.__table__.name for m in modelos)
+
+    def decorador(fn: Callable) -> Callable:
+        firma = inspect.signature(fn)
+        nombre = fn.__qualname__
+
+        @functools.wraps(fn)
+        def envoltura(self, db: Session, *args, **kwargs):
+            if not settings.QUERY_CACHE_ENABLED or \
+                    db.info.get(CLAVE_TABLAS_PENDIENTES, set()).intersection(tablas):
+                return _a_esquema(fn(self, db, *args, **kwargs), esquema)
+
+            backend = backend_cache()
+            argumentos = firma.bind(self, db, *args, **kwargs)
+            argumentos.apply_defaults()
+            parametros = tuple(argumentos.arguments.items())[2:]
+            versiones = backend.versiones(tablas)
+            clave = repr((nombre, parametros, sorted(versiones.items()),
+                          date.today() if por_dia else None))
+
+            # El backend devuelve (valor,) para distinguir un resultado None de un fallo
+            entrada = backend.obtener(clave, esquema)
+            metricas.registrar_cache(nombre, acierto=entrada is not None)
+            if entrada is not None:
+                return entrada[0]
+
+            with sesion_de_relleno(db) as sesion:
+                valor = _a_esquema(fn(self, sesion, *args, **kwargs), esquema)
+            backend.guardar(clave, valor, esquema)
+            return valor
+        return envoltura
+    return decorador
@@ -0,0 +1,262 @@
+# rh_service/app/utils/query_metrics.py
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Headers de diagnóstico que se agregan a la respuesta en modo DEBUG
+QUERIES_HEADER = "X-DB-Queries"
+DB_TIME_HEADER = "X-DB-Time-ms"
+N_PLUS_ONE_HEADER = "X-DB-N-Plus-One"
+
+
+class PresupuestoConsultasExcedido(AssertionError):
+    """
+    Se lanza en modo estricto cuando un endpoint (o bloque medido) supera su
+    presupuesto de consultas o repite cargas perezosas idénticas (N+1).
+    Hereda de AssertionError para que los tests fallen de forma natural.
+    """
+
+
+class EstadisticasConsulta:
+    """
+    Acumula las consultas SQL emitidas durante una petición (o un bloque
+    `contar_consultas`): número de sentencias, tiempo total en la base de datos
+    y cargas perezosas de relaciones agrupadas por (entidad, relación).
+    """
+
+    def __init__(self, presupuesto: Optional[int] = None):
+        self.consultas = 0
+        self.tiempo_ms = 0.0
+        self.cargas_perezosas: Counter = Counter()
+        self.presupuesto = presupuesto
+
+    def sospechas_n_mas_1(self) -> List[Tuple[str, int]]:
+        """
+        Relaciones cargadas de forma perezosa al menos `DB_N_PLUS_ONE_THRESHOLD`
+        veces: la misma consulta repetida por cada registro del listado.
+        """
+        umbral = settings.DB_N_PLUS_ONE_THRESHOLD
+        return [(rel, n) for rel, n in self.cargas_perezosas.most_common() if n >= umbral]
+
+    def excede_presupuesto(self) -> bool:
+        return self.presupuesto is not None and self.consultas > self.presupuesto
+
+    def problemas(self) -> List[str]:
+        """Describe las violaciones detectadas (presupuesto y N+1)."""
+        problemas = []
+        if self.excede_presupuesto():
+            problemas.append(f"{self.consultas} consultas (presupuesto: {self.presupuesto})")
+        for relacion, veces in self.sospechas_n_mas_1():
+            problemas.append(f"N+1 en {relacion} ({veces} cargas perezosas)")
+        return problemas
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            QUERIES_HEADER: str(self.consultas),
+            DB_TIME_HEADER: f"{self.tiempo_ms:.2f}",
+        }
+        sospechas = self.sospechas_n_mas_1()
+        if sospechas:
+            headers[N_PLUS_ONE_HEADER] = ", ".join(f"{rel}x{n}" for rel, n in sospechas)
+        return headers
+
+
+# Estadísticas de la petición en curso. Los endpoints síncronos se ejecutan en
+# el threadpool con una copia del contexto, por lo que comparten el mismo objeto.
+_estadisticas_actuales: ContextVar[Optional[EstadisticasConsulta]] = ContextVar(
+    "estadisticas_consulta", default=None
+)
+
+
+def estadisticas_actuales() -> Optional[EstadisticasConsulta]:
+    return _estadisticas_actuales.get()
+
+
+# ----------------------------------------------------
+# Hooks de SQLAlchemy (se registran una sola vez al importar el módulo)
+# ----------------------------------------------------
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _antes_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _despues_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+    inicio = conn.info["query_start_time"].pop()
+    stats = _estadisticas_actuales.get()
+    if stats is not None:
+        stats.consultas += 1
+        stats.tiempo_ms += (time.perf_counter() - inicio) * 1000
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _registrar_carga_perezosa(orm_execute_state):
+    # `lazy_loaded_from` solo se informa en cargas perezosas (no en selectinload)
+    if not orm_execute_state.is_select or orm_execute_state.lazy_loaded_from is None:
+        return
+    stats = _estadisticas_actuales.get()
+    if stats is not None:
+        stats.cargas_perezosas[str(orm_execute_state.loader_strategy_path.prop)] += 1
+
+
+# ----------------------------------------------------
+# Medición
+# ----------------------------------------------------
+
+@contextmanager
+def contar_consultas(presupuesto: Optional[int] = None,
+                     estricto: bool = True) -> Iterator[EstadisticasConsulta]:
+    """
+    Mide las consultas emitidas dentro del bloque. En modo estricto lanza
+    `PresupuestoConsultasExcedido` al salir si se supera `presupuesto` o se
+    detecta un patrón N+1.
+
+        with contar_consultas(presupuesto=2) as stats:
+            service.get_all_employees(db)
+    """
+    stats = EstadisticasConsulta(presupuesto=presupuesto)
+    token = _estadisticas_actuales.set(stats)
+    try:
+        yield stats
+    finally:
+        _estadisticas_actuales.reset(token)
+    if estricto and stats.problemas():
+        raise PresupuestoConsultasExcedido("; ".join(stats.problemas()))
+
+
+def presupuesto_consultas(maximo: int):
+    """
+    Dependencia para declarar el número máximo de consultas de un endpoint:
+
+        @router.get("/", dependencies=[Depends(presupuesto_consultas(2))])
+    """
+    def _declarar_presupuesto():
+        stats = _estadisticas_actuales.get()
+        if stats is not None:
+            stats.presupuesto = maximo
+    return _declarar_presupuesto
+
+
+class RegistroMetricas:
+    """
+    Agregado para producción (expuesto en /metrics): consultas por endpoint,
+    duración de tareas internas (p. ej. cada fuente de alertas) y aciertos de caché.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._por_endpoint: Dict[str, dict] = {}
+        self._tiempos: Dict[str, dict] = {}
+        self._cache: Dict[str, Counter] = {}
+
+    def registrar(self, endpoint: str, stats: EstadisticasConsulta) -> None:
+        with self._lock:
+            m = self._por_endpoint.setdefault(endpoint, {
+                "peticiones": 0,
+                "consultas_total": 0,
+                "consultas_max": 0,
+                "tiempo_db_ms_total": 0.0,
+                "excesos_presupuesto": 0,
+                "sospechas_n_mas_1": 0,
+            })
+            m["peticiones"] += 1
+            m["consultas_total"] += stats.consultas
+            m["consultas_max"] = max(m["consultas_max"], stats.consultas)
+            m["tiempo_db_ms_total"] += stats.tiempo_ms
+            m["excesos_presupuesto"] += int(stats.excede_presupuesto())
+            m["sospechas_n_mas_1"] += int(bool(stats.sospechas_n_mas_1()))
+
+    def registrar_duracion(self, nombre: str, tiempo_ms: float) -> None:
+        """Acumula la duración de una tarea interna identificada por `nombre`."""
+        with self._lock:
+            t = self._tiempos.setdefault(nombre, {"ejecuciones": 0, "tiempo_ms_total": 0.0, "tiempo_ms_max": 0.0})
+            t["ejecuciones"] += 1
+            t["tiempo_ms_total"] += tiempo_ms
+            t["tiempo_ms_max"] = max(t["tiempo_ms_max"], tiempo_ms)
+
+    def registrar_cache(self, nombre: str, acierto: bool) -> None:
+        """Cuenta un acierto o fallo de la caché de consultas para `nombre`."""
+        with self._lock:
+            self._cache.setdefault(nombre, Counter())["aciertos" if acierto else "fallos"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, dict]]:
+        with self._lock:
+            endpoints = {}
+            for endpoint, m in self._por_endpoint.items():
+                endpoints[endpoint] = {
+                    **m,
+                    "tiempo_db_ms_total": round(m["tiempo_db_ms_total"], 2),
+                    "consultas_promedio": round(m["consultas_total"] / m["peticiones"], 2),
+                }
+            tiempos = {}
+            for nombre, t in self._tiempos.items():
+                tiempos[nombre] = {
+                    "ejecuciones": t["ejecuciones"],
+                    "tiempo_ms_total": round(t["tiempo_ms_total"], 2),
+                    "tiempo_ms_max": round(t["tiempo_ms_max"], 2),
+                    "tiempo_ms_promedio": round(t["tiempo_ms_total"] / t["ejecuciones"], 2),
+                }
+            cache = {}
+            for nombre, c in self._cache.items():
+                cache[nombre] = {
+                    "aciertos": c["aciertos"],
+                    "fallos": c["fallos"],
+                    "tasa_aciertos": round(c["aciertos"] / (c["aciertos"] + c["fallos"]), 4),
+                }
+            return {"endpoints": endpoints, "tiempos": tiempos, "cache": cache}
+
+
+@contextmanager
+def medir_duracion(nombre: str) -> Iterator[None]:
+    """Registra en `metricas` la duración del bloque con el nombre indicado."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        metricas.registrar_duracion(nombre, (time.perf_counter() - inicio) * 1000)
+
+
+metricas = RegistroMetricas()
+
+
+async def middleware_metricas_consultas(request, call_next):
+    """
+    Middleware HTTP: mide las consultas de cada petición, agrega los headers de
+    diagnóstico en DEBUG y acumula las métricas por endpoint.
+    En modo estricto (`DB_QUERY_STRICT`, pensado para tests) falla la petición
+    si se supera el presupuesto declarado o se detecta un N+1.
+    """
+    stats = EstadisticasConsulta()
+    token = _estadisticas_actuales.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        _estadisticas_actuales.reset(token)
+
+    route = request.scope.get("route")
+    endpoint = f"{request.method} {route.path if route else request.url.path}"
+    metricas.registrar(endpoint, stats)
+
+    problemas = stats.problemas()
+    if problemas:
+        if settings.DB_QUERY_STRICT:
+            raise PresupuestoConsultasExcedido(f"{endpoint}: " + "; ".join(problemas))
+        logger.warning("%s: %s", endpoint, "; ".join(problemas))
+
+    if settings.DEBUG:
+        response.headers.update(stats.headers())
+    return response
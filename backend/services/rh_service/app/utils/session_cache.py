@@ -0,0 +1,58 @@
+# rh_service/app/utils/session_cache.py
+
+import functools
+import inspect
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.utils.change_events import Cambio, al_cambiar
+
+# Clave en `Session.info` donde vive la caché de la petición
+CLAVE_CACHE = "memo_sesion"
+
+
+def memo_sesion(*modelos: type):
+    """
+    Memoriza el resultado de un método de servicio idempotente `metodo(self, db, ...)`
+    durante la vida de la sesión `db` (una petición, vía `get_db`).
+
+    Las entradas se invalidan automáticamente cuando un flush de la misma sesión
+    modifica alguno de los `modelos` indicados, así que una lectura posterior a un
+    cambio nunca devuelve datos anteriores. Las excepciones (p. ej. 404) no se memorizan.
+
+        @memo_sesion(PayrollPeriod)
+        def get_next_closure_period(self, db: Session): ...
+    """
+    def decorador(fn: Callable) -> Callable:
+        firma = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def envoltura(self, db: Session, *args, **kwargs):
+            cache: Dict[Tuple, Tuple[Any, Tuple[type, ...]]] = db.info.setdefault(CLAVE_CACHE, {})
+            # Clave normalizada: la misma llamada por posición o por nombre comparte entrada
+            argumentos = firma.bind(self, db, *args, **kwargs)
+            argumentos.apply_defaults()
+            clave = (fn.__qualname__,) + tuple(argumentos.arguments.items())[2:]
+            try:
+                return cache[clave][0]
+            except KeyError:
+                pass
+            except TypeError:
+                # Argumentos no hashables: sin memoización
+                return fn(self, db, *args, **kwargs)
+            valor = fn(self, db, *args, **kwargs)
+            cache[clave] = (valor, modelos)
+            return valor
+        return envoltura
+    return decorador
+
+
+@al_cambiar()
+def _invalidar_memo(session: Session, cambios: List[Cambio]) -> None:
+    cache = session.info.get(CLAVE_CACHE)
+    if not cache:
+        return
+    modelo = type(cambios[0].instancia)
+    for clave in [c for c, (_, modelos) in cache.items() if modelo in modelos]:
+        del cache[clave]
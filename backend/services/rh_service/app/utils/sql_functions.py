@@ -0,0 +1,80 @@
+# rh_service/app/utils/sql_functions.py
+
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import Integer
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.utils.change_events import ejecutar_core
+
+
+# ----------------------------------------------------
+# Funciones SQL portables entre dialectos
+# ----------------------------------------------------
+
+class segundos_del_dia(FunctionElement):
+    """
+    Segundos transcurridos desde la medianoche para una columna TIME.
+    MySQL: TIME_TO_SEC(x). Permite sumar duraciones de turnos en SQL.
+    """
+    type = Integer()
+    inherit_cache = True
+    name = "segundos_del_dia"
+
+
+@compiles(segundos_del_dia)
+def _segundos_del_dia_mysql(element, compiler, **kw):
+    return "TIME_TO_SEC(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(segundos_del_dia, "sqlite")
+def _segundos_del_dia_sqlite(element, compiler, **kw):
+    # SQLite guarda TIME como texto 'HH:MM:SS[.ffffff]'
+    return "(strftime('%%s', %s) - strftime('%%s', '00:00:00'))" % compiler.process(element.clauses, **kw)
+
+
+@compiles(segundos_del_dia, "postgresql")
+def _segundos_del_dia_postgresql(element, compiler, **kw):
+    return "CAST(EXTRACT(EPOCH FROM %s) AS INTEGER)" % compiler.process(element.clauses, **kw)
+
+
+# ----------------------------------------------------
+# Upsert por dialecto
+# ----------------------------------------------------
+
+def upsert(db: Session, modelo, filas: List[dict], claves: Sequence[str], actualizar: Sequence[str]) -> None:
+    """
+    Inserta `filas` en la tabla de `modelo` y, si ya existe una fila con las mismas
+    `claves` (restricción única), actualiza las columnas `actualizar`.
+    MySQL usa ON DUPLICATE KEY UPDATE; SQLite y PostgreSQL, ON CONFLICT DO UPDATE.
+
+    Se ejecuta como SQL Core sobre la conexión de la sesión (misma transacción): el
+    camino masivo del ORM separa las filas por la forma de sus valores (p. ej. las
+    que traen None) y emite una sentencia por grupo. Aquí hay una sola sentencia
+    (executemany) por conjunto de columnas; con filas homogéneas, una en total.
+    """
+    if not filas:
+        return
+    tabla = modelo.__table__
+    dialecto = db.get_bind().dialect.name
+    if dialecto == "mysql":
+        sentencia = mysql_insert(tabla)
+        sentencia = sentencia.on_duplicate_key_update({c: sentencia.inserted[c] for c in actualizar})
+    else:
+        insertar = postgresql_insert if dialecto == "postgresql" else sqlite_insert
+        sentencia = insertar(tabla)
+        sentencia = sentencia.on_conflict_do_update(
+            index_elements=list(claves), set_={c: sentencia.excluded[c] for c in actualizar}
+        )
+
+    por_columnas: Dict[Tuple[str, ...], List[dict]] = defaultdict(list)
+    for fila in filas:
+        por_columnas[tuple(sorted(fila))].append(fila)
+    for grupo in por_columnas.values():
+        ejecutar_core(db, sentencia, grupo)